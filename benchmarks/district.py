@@ -0,0 +1,152 @@
+# coding=utf-8
+"""Generate deterministic synthetic districts of dragonfly Buildings for benchmarks.
+
+The districts are a grid of Buildings with rectangular footprints that are
+subdivided into a grid of Room2Ds. Each Building is created with
+Building.from_footprint and can optionally be assigned windows and roofs
+of increasing complexity. The same inputs always produce the same Model,
+such that the benchmark results of different versions can be compared.
+Usage:
+
+.. code-block:: shell
+
+    python benchmarks/district.py [building_count] [output_file]
+"""
+import sys
+import json
+import math
+import random
+
+from ladybug_geometry.geometry3d import Point3D, Face3D
+
+from dragonfly.building import Building
+from dragonfly.roof import RoofSpecification
+from dragonfly.model import Model
+from dragonfly.windowparameter import SimpleWindowRatio, RepeatingWindowRatio
+
+WINDOW_TYPES = ('None', 'SimpleWindowRatio', 'RepeatingWindowRatio',
+                'RectangularWindows', 'DetailedWindows')
+STREET_WIDTH = 12  # distance between the Buildings of the district
+TOLERANCE = 0.01
+
+
+def building_footprint(origin, room_count, rng):
+    """Get a list of Face3D for the rooms of a rectangular Building footprint.
+
+    Args:
+        origin: A Point3D for the bottom left corner of the footprint.
+        room_count: An integer for the number of rooms in the footprint.
+        rng: A random.Random used to pick the dimensions of the rooms.
+
+    Returns:
+        A tuple with the list of Face3D and the (width, depth) of the footprint.
+    """
+    columns = int(math.ceil(math.sqrt(room_count)))
+    room_width, room_depth = rng.choice((4, 5, 6, 8)), rng.choice((4, 5, 6))
+    faces = []
+    for i in range(room_count):
+        x = origin.x + (i % columns) * room_width
+        y = origin.y + (i // columns) * room_depth
+        pts = (Point3D(x, y, origin.z), Point3D(x + room_width, y, origin.z),
+               Point3D(x + room_width, y + room_depth, origin.z),
+               Point3D(x, y + room_depth, origin.z))
+        faces.append(Face3D(pts))
+    rows = int(math.ceil(room_count / float(columns)))
+    return faces, (columns * room_width, rows * room_depth)
+
+
+def building_roof(origin, width, depth, height, roof_complexity):
+    """Get a RoofSpecification with a series of gables over a Building footprint.
+
+    Args:
+        origin: A Point3D for the bottom left corner of the footprint.
+        width: The dimension of the footprint in the X direction.
+        depth: The dimension of the footprint in the Y direction.
+        height: A number for the Z coordinate of the eaves of the roof.
+        roof_complexity: An integer for the number of gables along the depth of
+            the footprint. Each gable adds two roof geometries.
+    """
+    roof_geos, strip = [], depth / roof_complexity
+    x1, x2, rise = origin.x, origin.x + width, min(strip / 2, 3)
+    for i in range(roof_complexity):
+        y1 = origin.y + strip * i
+        y2, y3 = y1 + strip / 2, y1 + strip
+        roof_geos.append(Face3D((
+            Point3D(x1, y1, height), Point3D(x2, y1, height),
+            Point3D(x2, y2, height + rise), Point3D(x1, y2, height + rise))))
+        roof_geos.append(Face3D((
+            Point3D(x1, y2, height + rise), Point3D(x2, y2, height + rise),
+            Point3D(x2, y3, height), Point3D(x1, y3, height))))
+    return RoofSpecification(roof_geos)
+
+
+def assign_windows(building, window_type):
+    """Assign windows of a given type to all outdoor walls of a Building."""
+    if window_type == 'None':
+        return
+    if window_type == 'RepeatingWindowRatio':
+        building.set_outdoor_window_parameters(RepeatingWindowRatio(0.4, 2, 0.8, 3))
+        return
+    building.set_outdoor_window_parameters(SimpleWindowRatio(0.4))
+    if window_type == 'RectangularWindows':
+        building.to_rectangular_windows()
+    elif window_type == 'DetailedWindows':
+        for room in building.unique_room_2ds:
+            room.to_detailed_windows()
+
+
+def synthetic_district(building_count=25, story_count=4, room_count=9,
+                       window_type='SimpleWindowRatio', roof_complexity=0,
+                       unique_stories=False, seed=0):
+    """Get a Model of a district with a grid of Buildings.
+
+    Args:
+        building_count: An integer for the number of Buildings. (Default: 25).
+        story_count: An integer for the number of stories of each Building.
+            (Default: 4).
+        room_count: An integer for the number of Room2Ds on each story. (Default: 9).
+        window_type: Text for the type of window parameters assigned to the
+            outdoor walls. Choose from the WINDOW_TYPES. (Default: SimpleWindowRatio).
+        roof_complexity: An integer for the number of gables in the roof of each
+            Building. If 0, the Buildings will have flat roofs. (Default: 0).
+        unique_stories: Boolean to note whether each story of the Buildings
+            should be a unique Story (True) or the middle stories should be
+            represented with a multiplier (False). (Default: False).
+        seed: An integer for the seed of the random numbers used to pick the
+            dimensions of the Buildings. (Default: 0).
+    """
+    assert window_type in WINDOW_TYPES, 'Window type "{}" is not one of {}.'.format(
+        window_type, WINDOW_TYPES)
+    rng = random.Random(seed)
+    columns = int(math.ceil(math.sqrt(building_count)))
+    cell = int(math.ceil(math.sqrt(room_count))) * 8 + STREET_WIDTH
+    buildings = []
+    for b in range(building_count):
+        bldg_id = 'Building_{}'.format(b)
+        origin = Point3D((b % columns) * cell, (b // columns) * cell, 0)
+        footprint, (width, depth) = building_footprint(origin, room_count, rng)
+        if unique_stories:  # vary the heights slightly to make every story unique
+            heights = [3 + 0.05 * (i % 2) for i in range(story_count)]
+        else:
+            heights = [3] * story_count
+        bldg = Building.from_footprint(bldg_id, footprint, heights, tolerance=TOLERANCE)
+        for story in bldg.unique_stories:
+            story.solve_room_2d_adjacency(TOLERANCE)
+        bldg.separate_top_bottom_floors()
+        assign_windows(bldg, window_type)
+        if roof_complexity > 0:
+            top_story = bldg.unique_stories[-1]
+            height = top_story.floor_height + top_story.floor_to_floor_height
+            top_story.roof = building_roof(origin, width, depth, height, roof_complexity)
+        buildings.append(bldg)
+    return Model('Synthetic_District', buildings, tolerance=TOLERANCE)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 25
+    model = synthetic_district(count)
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], 'w') as fp:
+            json.dump(model.to_dict(), fp)
+    else:
+        print('{} with {} Room2Ds'.format(model, len(model.room_2ds)))
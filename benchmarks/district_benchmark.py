@@ -0,0 +1,174 @@
+# coding=utf-8
+"""Benchmark the main dragonfly operations on a synthetic district.
+
+Each scenario is timed several times on a Model from district.py and the
+fastest run is reported along with the peak memory allocated during a separate
+run traced with tracemalloc. The results can be saved to a JSON file and
+used as a baseline to report the change of each scenario in a later run.
+Usage:
+
+.. code-block:: shell
+
+    python benchmarks/district_benchmark.py --buildings 25 --save baseline.json
+    python benchmarks/district_benchmark.py --buildings 25 --compare baseline.json
+"""
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+from dragonfly.room2d import Room2D
+from dragonfly.model import Model
+
+from district import synthetic_district, WINDOW_TYPES, TOLERANCE
+
+
+def _story_rooms(model):
+    """Get a list with a copy of the Room2Ds of each Story with reset adjacencies."""
+    story_rooms = []
+    for story in model.stories:
+        rooms = [room.duplicate() for room in story.room_2ds]
+        for room in rooms:
+            room.reset_adjacency()
+        story_rooms.append(rooms)
+    return story_rooms
+
+
+def _solve_adjacency(story_rooms):
+    for rooms in story_rooms:
+        Room2D.solve_adjacency(rooms, TOLERANCE)
+
+
+def _intersect_adjacency(story_rooms):
+    for rooms in story_rooms:
+        Room2D.intersect_adjacency(rooms, TOLERANCE)
+
+
+def _intersect_adjacency_partition(story_rooms):
+    for rooms in story_rooms:
+        Room2D.intersect_adjacency(rooms, TOLERANCE, partition=True)
+
+
+MERGE_METHODS = ('Zones', 'PlenumZones', 'Stories', 'PlenumStories')
+
+
+def _to_honeybee(model, merge_method=None):
+    return list(model.to_honeybee(
+        'Building', merge_method=merge_method, tolerance=TOLERANCE))
+
+
+def scenarios(model):
+    """Get a list of (name, setup, function) tuples for each benchmark scenario.
+
+    The setup is a function that is run before each timed run and its result
+    is passed to the function, which is the part of the scenario that is timed.
+    """
+    model_dict = model.to_dict()
+    merge_scenarios = [
+        ('Model.to_honeybee[{}]'.format(method), lambda: model,
+         lambda m, method=method: _to_honeybee(m, method))
+        for method in MERGE_METHODS
+    ]
+    return [
+        ('Model.from_dict', lambda: model_dict, Model.from_dict),
+        ('Model.to_dict', lambda: model, lambda m: m.to_dict()),
+        ('Model.to_honeybee', lambda: model, _to_honeybee),
+        ('Model.check_all', lambda: model,
+         lambda m: m.check_all(raise_exception=False, detailed=True)),
+        ('Room2D.solve_adjacency', lambda: _story_rooms(model), _solve_adjacency),
+        ('Room2D.intersect_adjacency', lambda: _story_rooms(model),
+         _intersect_adjacency),
+        ('Room2D.intersect_adjacency[partition]', lambda: _story_rooms(model),
+         _intersect_adjacency_partition)
+    ] + merge_scenarios
+
+
+def run_scenario(setup, function, repeat):
+    """Get the fastest time in seconds and the peak memory in MB of a scenario."""
+    times = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        function(arg)
+        times.append(time.perf_counter() - start)
+    arg = setup()
+    tracemalloc.start()
+    try:
+        function(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(times), peak / 1e6
+
+
+def report(results, baseline=None, threshold=1.1):
+    """Get a text report of benchmark results with an optional baseline comparison.
+
+    Args:
+        results: A dictionary of benchmark results with scenario names as keys.
+        baseline: An optional dictionary of benchmark results to be compared to.
+        threshold: A number for the ratio between the result and the baseline
+            above which a scenario is reported as a regression.
+
+    Returns:
+        A tuple with the text of the report and a list of regressed scenarios.
+    """
+    lines = ['{:<40}{:>12}{:>12}'.format('Scenario', 'Time (s)', 'Peak (MB)')]
+    regressions = []
+    for name, res in results.items():
+        line = '{:<40}{:>12.3f}{:>12.1f}'.format(name, res['time'], res['memory'])
+        base = None if baseline is None else baseline.get(name)
+        if base is not None:
+            t_ratio = res['time'] / base['time'] if base['time'] else 1
+            m_ratio = res['memory'] / base['memory'] if base['memory'] else 1
+            line += '  time x{:.2f}  memory x{:.2f}'.format(t_ratio, m_ratio)
+            if t_ratio > threshold or m_ratio > threshold:
+                regressions.append(name)
+                line += '  REGRESSION'
+        lines.append(line)
+    return '\n'.join(lines), regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--buildings', type=int, default=25)
+    parser.add_argument('--stories', type=int, default=4)
+    parser.add_argument('--rooms', type=int, default=9)
+    parser.add_argument('--windows', choices=WINDOW_TYPES, default='SimpleWindowRatio')
+    parser.add_argument('--roof', type=int, default=0,
+                        help='Number of gables in the roof of each Building.')
+    parser.add_argument('--unique-stories', action='store_true')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--scenario', action='append',
+                        help='Name of a scenario to run. By default, all are run.')
+    parser.add_argument('--save', help='JSON file to which the results are written.')
+    parser.add_argument('--compare', help='JSON file of baseline results.')
+    parser.add_argument('--threshold', type=float, default=1.1)
+    args = parser.parse_args(args)
+
+    model = synthetic_district(
+        args.buildings, args.stories, args.rooms, args.windows, args.roof,
+        args.unique_stories)
+    print('{} Buildings, {} Room2Ds'.format(len(model.buildings), len(model.room_2ds)))
+    results = {}
+    for name, setup, function in scenarios(model):
+        if args.scenario and name not in args.scenario:
+            continue
+        run_time, memory = run_scenario(setup, function, args.repeat)
+        results[name] = {'time': run_time, 'memory': memory}
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)['results']
+    text, regressions = report(results, baseline, args.threshold)
+    print(text)
+    if args.save:
+        with open(args.save, 'w') as fp:
+            json.dump({'arguments': vars(args), 'results': results}, fp, indent=4)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# coding=utf-8
+"""Benchmark the memory saved by sharing equal shading parameters on load.
+
+Model.from_dict is run on a synthetic district with RepeatingWindowRatio and
+Overhang on all outdoor walls once with the shading parameters interned and
+once with interning turned off. The retained memory of the loaded Model is
+traced with tracemalloc. Usage:
+
+.. code-block:: shell
+
+    python benchmarks/intern_benchmark.py [building_count]
+"""
+import sys
+import gc
+import time
+import tracemalloc
+
+import dragonfly.shadingparameter as shadingparameter
+from dragonfly.shadingparameter import Overhang
+from dragonfly.model import Model
+
+from district import synthetic_district
+
+
+def load_model(data, repeat=5):
+    """Get the retained memory in MB and the best load time of a Model dict."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.time()
+        Model.from_dict(data)
+        times.append(time.time() - start)
+    gc.collect()
+    tracemalloc.start()
+    model = Model.from_dict(data)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+    del model
+    return retained, min(times)
+
+
+def main(building_count=100):
+    """Print the memory and load time of a Model with and without interning."""
+    model = synthetic_district(
+        building_count, 4, 12, 'RepeatingWindowRatio', unique_stories=True)
+    for bldg in model.buildings:
+        bldg.set_outdoor_shading_parameters(Overhang(0.5))
+    data = model.to_dict()
+    room_count = len(model.room_2ds)
+    del model
+    interned = load_model(data)
+    intern_func = shadingparameter.intern_parameter
+    shadingparameter.intern_parameter = lambda parameter: parameter
+    try:
+        not_interned = load_model(data)
+    finally:
+        shadingparameter.intern_parameter = intern_func
+    print('{} Room2Ds'.format(room_count))
+    for name, (memory, load_time) in \
+            zip(('interned', 'not interned'), (interned, not_interned)):
+        print('{}: {:.2f} MB retained, {:.3f}s load'.format(name, memory, load_time))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
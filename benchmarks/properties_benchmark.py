@@ -0,0 +1,70 @@
+# coding=utf-8
+"""Benchmark the cost of looping over extension attributes in Model operations.
+
+Model.duplicate() and Model.move() are timed on a synthetic Model once with the
+cached extension attributes and once with the attributes recomputed using
+dir() on each call. Usage:
+
+.. code-block:: shell
+
+    python benchmarks/properties_benchmark.py [room_count]
+"""
+import sys
+import time
+
+from ladybug_geometry.geometry3d import Vector3D, Point3D, Face3D
+
+from dragonfly.properties import _Properties
+from dragonfly.room2d import Room2D
+from dragonfly.story import Story
+from dragonfly.building import Building
+from dragonfly.model import Model
+
+
+def synthetic_model(room_count):
+    """Get a Model with a grid of Room2Ds in a single Building."""
+    rooms, side = [], int(room_count ** 0.5) or 1
+    for i in range(room_count):
+        x, y = (i % side) * 5, (i // side) * 5
+        pts = (Point3D(x, y, 0), Point3D(x + 5, y, 0),
+               Point3D(x + 5, y + 5, 0), Point3D(x, y + 5, 0))
+        rooms.append(Room2D('Room_{}'.format(i), Face3D(pts), 3))
+    building = Building('Building', [Story('Story', rooms)])
+    return Model('Model', [building])
+
+
+def time_operations(model):
+    """Get the time in seconds to duplicate and move a Model."""
+    start = time.time()
+    model.duplicate()
+    dup_time = time.time() - start
+    start = time.time()
+    model.move(Vector3D(1, 1, 0))
+    move_time = time.time() - start
+    return dup_time, move_time
+
+
+def _dir_extension_attributes(self):
+    """The extension attributes computed with dir() upon every request."""
+    return (atr for atr in dir(self) if not atr.startswith('_')
+            and atr not in self._exclude)
+
+
+def main(room_count=20000):
+    """Print the time to duplicate and move a Model with and without the cache."""
+    model = synthetic_model(room_count)
+    cached = time_operations(model)
+    cached_attr = _Properties._extension_attributes
+    type.__setattr__(_Properties, '_extension_attributes',
+                     property(_dir_extension_attributes))
+    try:
+        uncached = time_operations(model)
+    finally:
+        type.__setattr__(_Properties, '_extension_attributes', cached_attr)
+    print('{} Room2Ds'.format(room_count))
+    for name, c_time, u_time in zip(('duplicate', 'move'), cached, uncached):
+        print('{}: cached {:.3f}s, dir() {:.3f}s'.format(name, c_time, u_time))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
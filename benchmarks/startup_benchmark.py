@@ -0,0 +1,46 @@
+# coding=utf-8
+"""Benchmark the time it takes to start the dragonfly command line interface.
+
+The time of `python -m dragonfly --help` is measured both with the default
+import of all extensions and with lazy extension loading (using the cached
+list of extensions). Usage:
+
+.. code-block:: shell
+
+    python benchmarks/startup_benchmark.py [run_count]
+"""
+import os
+import sys
+import subprocess
+import tempfile
+import time
+
+
+def time_command(command, env, run_count):
+    """Get a sorted list with the time in seconds of several runs of a command."""
+    times = []
+    for _ in range(run_count):
+        start = time.time()
+        subprocess.check_call(command, env=env, stdout=subprocess.DEVNULL)
+        times.append(time.time() - start)
+    return sorted(times)
+
+
+def main(run_count=10):
+    """Print the median startup time of the dragonfly CLI in each mode."""
+    command = [sys.executable, '-m', 'dragonfly', '--help']
+    cache_file = os.path.join(tempfile.gettempdir(), 'dragonfly_benchmark_cache.json')
+    eager_env = dict(os.environ)
+    eager_env.pop('DRAGONFLY_LAZY_EXTENSIONS', None)
+    lazy_env = dict(os.environ)
+    lazy_env['DRAGONFLY_LAZY_EXTENSIONS'] = '1'
+    lazy_env['DRAGONFLY_EXTENSION_CACHE'] = cache_file
+    subprocess.check_call(command, env=lazy_env, stdout=subprocess.DEVNULL)  # cache
+    for mode, env in (('eager', eager_env), ('lazy', lazy_env)):
+        times = time_command(command, env, run_count)
+        print('{}: median {:.3f}s, min {:.3f}s over {} runs'.format(
+            mode, times[len(times) // 2], times[0], run_count))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
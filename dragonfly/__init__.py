@@ -1,19 +1,45 @@
 """Dragonfly Core library."""
 import importlib
-import pkgutil
+import os
 import sys
 
 from honeybee.logutil import get_logger
 
+from dragonfly.extensionutil import extension_names, default_extension_cache
+
 
 logger = get_logger(__name__, filename='dragonfly.log')
 
-#  find and import dragonfly extensions
-#  this is a critical step to add additional functionalities to dragonfly core library.
-extensions = {}
-for finder, name, ispkg in pkgutil.iter_modules():
-    if not name.startswith('dragonfly_'):
-        continue
+
+def load_extensions(name=None):
+    """Import dragonfly extensions that have been discovered but not yet loaded.
+
+    Extensions are only left unloaded when the DRAGONFLY_LAZY_EXTENSIONS environment
+    variable is set, in which case they are imported the first time that they
+    are needed (eg. upon the first access of obj.properties.energy).
+
+    Args:
+        name: Optional text for the name of a single extension to load (eg.
+            "energy" or "dragonfly_energy"). If None or if no pending extension
+            has this name, all pending extensions will be loaded. (Default: None).
+
+    Returns:
+        True if any extension was imported. False if there were no pending
+        extensions to be imported.
+    """
+    if not _pending_extensions:
+        return False
+    if name is not None:
+        name = name if name.startswith('dragonfly_') else 'dragonfly_{}'.format(name)
+    to_load = [name] if name in _pending_extensions else list(_pending_extensions)
+    for ext_name in to_load:
+        _pending_extensions.remove(ext_name)
+        _import_extension(ext_name)
+    return True
+
+
+def _import_extension(name):
+    """Import a dragonfly extension and add it to the extensions dictionary."""
     try:
         extensions[name] = importlib.import_module(name)
     except Exception:
@@ -21,3 +47,15 @@ for finder, name, ispkg in pkgutil.iter_modules():
             logger.exception('Failed to import {0}!'.format(name))
     else:
         logger.info('Successfully imported Dragonfly plugin: {}'.format(name))
+
+
+#  find and import dragonfly extensions
+#  this is a critical step to add additional functionalities to dragonfly core library.
+extensions = {}
+_pending_extensions = []
+if os.environ.get('DRAGONFLY_LAZY_EXTENSIONS', '').lower() in ('1', 'true', 'yes'):
+    # use a cached list of extensions and only import them when they are needed
+    _pending_extensions.extend(extension_names(default_extension_cache()))
+else:
+    for _name in extension_names():
+        _import_extension(_name)
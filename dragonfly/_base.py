@@ -42,6 +42,7 @@ class _BaseGeometry(object):
     @identifier.setter
     def identifier(self, value):
         self._identifier = valid_string(value, 'dragonfly object identifier')
+        self._clear_parent_index()
 
     @property
     def display_name(self):
@@ -103,6 +104,15 @@ class _BaseGeometry(object):
         """Get a copy of this object."""
         return self.__copy__()
 
+    def _clear_parent_index(self):
+        """Clear the index of identifiers on the parent when this object is renamed."""
+        parent = getattr(self, '_parent', None)
+        if parent is not None:
+            try:
+                parent._identifier_index = None
+            except AttributeError:  # parent without an index of identifiers
+                pass
+
     @staticmethod
     def _validation_message_child(
             message, child_obj, detailed=False, code='000000', extension='Core',
@@ -3,6 +3,7 @@
 from __future__ import division
 
 import math
+from collections import deque
 try:
     from itertools import izip as zip  # python 2
 except ImportError:
@@ -23,11 +24,13 @@ from honeybee.units import parse_distance_string
 
 from ._base import _BaseGeometry
 from .properties import BuildingProperties
-from .story import Story
+from .story import Story, OffsetStoryView
 from .roof import RoofSpecification
 from .room2d import Room2D
 from .windowparameter import _AsymmetricBase
 from .skylightparameter import DetailedSkylights
+from .parallel import parallel_map, parallel_imap
+from .spatialindex import RectangleGrid
 import dragonfly.writer.building as writer
 
 
@@ -99,13 +102,14 @@ class Building(_BaseGeometry):
         * max
         * user_data
     """
-    __slots__ = ('_unique_stories', '_room_3ds', '_roofs')
+    __slots__ = ('_unique_stories', '_room_3ds', '_roofs', '_identifier_index')
 
     def __init__(self, identifier, unique_stories=None, room_3ds=None,
                  sort_stories=True):
         """A complete Building defined by Stories."""
         # initialize and perform a basic check that there's some geometry
         _BaseGeometry.__init__(self, identifier)  # process the identifier
+        self._identifier_index = None  # dictionary of Stories set upon request
         if (unique_stories is None or len(unique_stories) == 0) and \
                 (room_3ds is None or len(room_3ds) == 0):
             raise ValueError('Building must have some geometry - at least one Story '
@@ -113,6 +117,7 @@ class Building(_BaseGeometry):
 
         # process the story geometry
         if unique_stories is not None:
+            unique_stories = Building._real_stories(unique_stories)
             for story in unique_stories:
                 assert isinstance(story, Story), \
                     'Expected dragonfly Story. Got {}'.format(type(story))
@@ -406,6 +411,7 @@ class Building(_BaseGeometry):
     @unique_stories.setter
     def unique_stories(self, value):
         if value is not None:
+            value = Building._real_stories(value)
             for story in value:
                 assert isinstance(story, Story), \
                     'Expected dragonfly Story. Got {}'.format(type(story))
@@ -762,21 +768,18 @@ class Building(_BaseGeometry):
         The Story objects returned here each have a multiplier of 1 and repeated
         stories are represented will their own Story object. 3D Rooms are not included
         in this output.
+
+        Each Story is returned as an OffsetStoryView, which shares the Room2Ds
+        and parameters of the unique Story that it repeats and only applies the
+        offset and identifier prefix of the repeated floor. A copy of the unique
+        Story is only created once the view is edited or its Room2Ds are
+        requested. The to_story method of each view can be used to get the
+        real Story.
         """
         all_stories = []
         for story in self._unique_stories:
-            new_story = story.duplicate()
-            new_story.multiplier = 1
-            all_stories.append(new_story)
-
-            if story.multiplier != 1:
-                for i in range(story.multiplier - 1):
-                    new_story = story.duplicate()
-                    new_story.add_prefix('Flr{}'.format(i + 1))
-                    new_story.multiplier = 1
-                    m_vec = Vector3D(0, 0, story.floor_to_floor_height * (i + 1))
-                    new_story.move(m_vec)
-                    all_stories.append(new_story)
+            for i in range(story.multiplier):
+                all_stories.append(OffsetStoryView(story, i))
         return all_stories
 
     def all_room_2ds(self):
@@ -825,13 +828,11 @@ class Building(_BaseGeometry):
 
     def stories_by_identifier(self, identifiers):
         """Get a list of Story objects in the Building given Story identifiers."""
-        stories, bldg_stories = [], self.unique_stories
+        stories, story_index = [], self._story_index()
         for identifier in identifiers:
-            for story in bldg_stories:
-                if story.identifier == identifier:
-                    stories.append(story)
-                    break
-            else:
+            try:
+                stories.append(story_index[identifier])
+            except KeyError:
                 raise ValueError(
                     'Story "{}" was not found in the Building.'.format(identifier))
         return stories
@@ -1006,6 +1007,7 @@ class Building(_BaseGeometry):
                 that can be resolved later (True). (Default: False).
         """
         # check to be sure all of the input is correct
+        stories = Building._real_stories(stories)
         for story in stories:
             assert isinstance(story, Story), \
                 'Expected dragonfly Story. Got {}'.format(type(story))
@@ -2232,11 +2234,15 @@ class Building(_BaseGeometry):
         msgs = []
         if len(self._unique_stories) > 1:
             stories = self._unique_stories
+            st_rects = []  # bounding rectangles to quickly rule out collisions
+            for story in stories:
+                st_min, st_max = story.min, story.max
+                st_rects.append((st_min.x, st_min.y, st_max.x, st_max.y))
             for i, story1 in enumerate(stories):
                 fh1 = story1.min_room_2d_floor_height
                 ch1 = story1.max_room_2d_ceiling_height
                 try:
-                    for story2 in stories[i + 1:]:
+                    for story2, rect2 in zip(stories[i + 1:], st_rects[i + 1:]):
                         fh2 = story2.min_room_2d_floor_height
                         ch2 = story2.max_room_2d_ceiling_height
                         v_overlap = 0
@@ -2244,7 +2250,9 @@ class Building(_BaseGeometry):
                             v_overlap = ch1 - fh2
                         elif fh2 < fh1 and ch2 - tolerance > fh1:
                             v_overlap = ch2 - fh1
-                        if v_overlap != 0:
+                        # double the tolerance so that the check is conservative
+                        if v_overlap != 0 and RectangleGrid.rectangles_overlap(
+                                st_rects[i], rect2, tolerance * 2):
                             col_msg = story1.check_collision_with_story(
                                 story2, tolerance, False, detailed)
                             if col_msg:
@@ -2518,7 +2526,7 @@ class Building(_BaseGeometry):
     @staticmethod
     def district_to_honeybee(
             buildings, use_multiplier=True, exclude_plenums=False, tolerance=0.01,
-            enforce_adj=True, enforce_solid=True):
+            enforce_adj=True, enforce_solid=True, workers=None, executor=None):
         """Convert an array of Building objects into a single district honeybee Model.
 
         Args:
@@ -2550,28 +2558,34 @@ class Building(_BaseGeometry):
                 room geometry should be allowed to remain in the result (False).
                 The latter is useful for understanding why a particular roof
                 geometry has produced a non-solid result. (Default: True).
+            workers: An optional integer for the number of processes to be used
+                to translate the Buildings in parallel. If None or 1, all Buildings
+                will be translated serially in the current process. Set to 0 to
+                use all available CPUs. (Default: None).
+            executor: An optional concurrent.futures Executor to be used to translate
+                the Buildings in parallel (eg. a pool that is shared across several
+                operations). When specified, the workers input is ignored and
+                the executor is not shut down after translation. (Default: None).
 
         Returns:
             A honeybee Model that represent the district.
         """
-        # create a base model to which everything will be added
-        base_model = buildings[0].to_honeybee(
-            use_multiplier, exclude_plenums=exclude_plenums, tolerance=tolerance,
-            enforce_adj=enforce_adj, enforce_solid=enforce_solid)
-        # loop through each Building, create a model, and add it to the base one
-        for bldg in buildings[1:]:
-            base_model.add_model(
-                bldg.to_honeybee(use_multiplier, exclude_plenums=exclude_plenums,
-                                 tolerance=tolerance, enforce_adj=enforce_adj,
-                                 enforce_solid=enforce_solid)
-            )
+        # translate each Building into a Model, optionally in parallel processes
+        bldg_args = [(bldg, use_multiplier, exclude_plenums, tolerance,
+                      enforce_adj, enforce_solid) for bldg in buildings]
+        bldg_models = parallel_map(
+            Building._building_to_honeybee, bldg_args, workers, executor)
+        # add each of the Building Models to the base one
+        base_model = bldg_models[0]
+        for model in bldg_models[1:]:
+            base_model.add_model(model)
         return base_model
 
     @staticmethod
     def buildings_to_honeybee(
             buildings, context_shades=None, shade_distance=None,
             use_multiplier=True, exclude_plenums=False, cap=False, tolerance=0.01,
-            enforce_adj=True, enforce_solid=True):
+            enforce_adj=True, enforce_solid=True, workers=None, executor=None):
         """Convert an array of Buildings into several honeybee Models with self-shading.
 
         Each input Building will be exported into its own Model. For each Model,
@@ -2622,30 +2636,112 @@ class Building(_BaseGeometry):
                 room geometry should be allowed to remain in the result (False).
                 The latter is useful for understanding why a particular roof
                 geometry has produced a non-solid result. (Default: True).
+            workers: An optional integer for the number of processes to be used
+                to translate the Buildings in parallel. If None or 1, all Buildings
+                will be translated serially in the current process. Set to 0 to
+                use all available CPUs. (Default: None).
+            executor: An optional concurrent.futures Executor to be used to translate
+                the Buildings in parallel (eg. a pool that is shared across several
+                operations). When specified, the workers input is ignored and
+                the executor is not shut down after translation. (Default: None).
 
         Returns:
             A list of honeybee Models that represent the Building.
         """
+        return list(Building.iter_buildings_to_honeybee(
+            buildings, context_shades, shade_distance, use_multiplier, exclude_plenums,
+            cap, tolerance, enforce_adj, enforce_solid, workers, executor))
+
+    @staticmethod
+    def iter_buildings_to_honeybee(
+            buildings, context_shades=None, shade_distance=None,
+            use_multiplier=True, exclude_plenums=False, cap=False, tolerance=0.01,
+            enforce_adj=True, enforce_solid=True, workers=None, executor=None):
+        """Get an iterator that converts Buildings into honeybee Models one at a time.
+
+        This yields the same Models as the buildings_to_honeybee method but each
+        Model is only created when it is requested from the iterator. So the
+        Models can be written to files and released one by one, keeping memory
+        bounded by the largest Building rather than the whole list of Buildings.
+
+        Args:
+            buildings: An array of Building objects to be converted into honeybee
+                Models that account for their own shading of one another.
+            context_shades: An optional array of ContextShade objects that will be
+                added to the honeybee Models if their bounding box overlaps with a
+                given building within the shade_distance.
+            shade_distance: An optional number to note the distance beyond which other
+                objects' shade should not be exported into a given Model. This is
+                helpful for reducing the simulation run time of each Model when other
+                connected buildings are too far away to have a meaningful impact on
+                the results. If None, all other buildings will be included as context
+                shade in each and every Model. Set to 0 to exclude all neighboring
+                buildings from the resulting models. Default: None.
+            use_multiplier: If True, the multipliers on this Building's Stories will be
+                passed along to the generated Honeybee Room objects, indicating the
+                simulation will be run once for each unique room and then results
+                will be multiplied. If False, full geometry objects will be written
+                for each and every floor in the building that are represented through
+                multipliers and all room multipliers will be 1. (Default: True).
+            exclude_plenums: Boolean to indicate whether ceiling/floor plenum depths
+                assigned to Room2Ds should be ignored during translation. This
+                results in each Room2D translating to a single Honeybee Room at
+                the full floor_to_ceiling_height instead of a base Room with (a)
+                plenum Room(s). (Default: False).
+            cap: Boolean to note whether building shade representations should be capped
+                with a top face. Usually, this is not necessary to account for
+                blocked sun and is only needed when it's important to account for
+                reflected sun off of roofs. (Default: False).
+            tolerance: The minimum distance in z values of floor_height and
+                floor_to_ceiling_height at which adjacent Faces will be split.
+                Default: 0.01, suitable for objects in meters.
+            enforce_adj: Boolean to note whether an exception should be raised if
+                an adjacency between two Room2Ds is invalid (True) or if the invalid
+                Surface boundary condition should be replaced with an Outdoor
+                boundary condition (False). If False, any Walls containing
+                WindowParameters and an illegal boundary condition will also
+                be replaced with an Outdoor boundary condition. (Default: True).
+            enforce_solid: Boolean to note whether rooms should be translated
+                as solid extrusions whenever translating them with custom
+                roof geometry produces a non-solid result (True) or the non-solid
+                room geometry should be allowed to remain in the result (False).
+                The latter is useful for understanding why a particular roof
+                geometry has produced a non-solid result. (Default: True).
+            workers: An optional integer for the number of processes to be used
+                to translate the Buildings in parallel. If None or 1, all Buildings
+                will be translated serially in the current process. Set to 0 to
+                use all available CPUs. (Default: None).
+            executor: An optional concurrent.futures Executor to be used to translate
+                the Buildings in parallel (eg. a pool that is shared across several
+                operations). When specified, the workers input is ignored and
+                the executor is not shut down after translation. (Default: None).
+
+        Returns:
+            An iterator of honeybee Models that represent the Buildings.
+        """
         # create lists with all context representations of the buildings + shade
-        bldg_shades, bldg_pts, con_shades, con_pts = Building._honeybee_shades(
-            buildings, context_shades, shade_distance, cap, tolerance)
-        # loop through each Building and create a model
-        models = []  # list to be filled with Honeybee Models
+        bldg_shades, bldg_pts, con_shades, con_pts, grids = \
+            Building._honeybee_shades(
+                buildings, context_shades, shade_distance, cap, tolerance)
+        # translate each Building into a Model, optionally in parallel processes
+        bldg_args = ((bldg, use_multiplier, exclude_plenums, tolerance,
+                      enforce_adj, enforce_solid) for bldg in buildings)
+        models = parallel_imap(
+            Building._building_to_honeybee, bldg_args, workers, executor)
+        # add the context shades to each Building model
         num_bldg = len(buildings)
-        for i, bldg in enumerate(buildings):
-            model = bldg.to_honeybee(
-                use_multiplier, exclude_plenums=exclude_plenums, tolerance=tolerance,
-                enforce_adj=enforce_adj, enforce_solid=enforce_solid)
-            Building._add_context_to_honeybee(model, bldg_shades, bldg_pts, con_shades,
-                                              con_pts, shade_distance, num_bldg, i)
-            models.append(model)  # append to the final list of Models
-        return models
+        for i, model in enumerate(models):
+            Building._add_context_to_honeybee(
+                model, bldg_shades, bldg_pts, con_shades, con_pts,
+                shade_distance, num_bldg, i, grids)
+            yield model
+            model = None  # release the model before the next one is translated
 
     @staticmethod
     def stories_to_honeybee(
             buildings, context_shades=None, shade_distance=None,
             use_multiplier=True, exclude_plenums=False, cap=False, tolerance=0.01,
-            enforce_adj=True, enforce_solid=True):
+            enforce_adj=True, enforce_solid=True, workers=None, executor=None):
         """Convert an array of Buildings into one honeybee Model per story.
 
         Each Story of each input Building will be exported into its own Model. For each
@@ -2697,80 +2793,223 @@ class Building(_BaseGeometry):
                 room geometry should be allowed to remain in the result (False).
                 The latter is useful for understanding why a particular roof
                 geometry has produced a non-solid result. (Default: True).
+            workers: An optional integer for the number of processes to be used
+                to translate the Stories in parallel. If None or 1, all Stories
+                will be translated serially in the current process. Set to 0 to
+                use all available CPUs. (Default: None).
+            executor: An optional concurrent.futures Executor to be used to translate
+                the Stories in parallel (eg. a pool that is shared across several
+                operations). When specified, the workers input is ignored and
+                the executor is not shut down after translation. (Default: None).
 
         Returns:
             A list of honeybee Models that represent the Stories.
         """
+        return list(Building.iter_stories_to_honeybee(
+            buildings, context_shades, shade_distance, use_multiplier, exclude_plenums,
+            cap, tolerance, enforce_adj, enforce_solid, workers, executor))
+
+    @staticmethod
+    def iter_stories_to_honeybee(
+            buildings, context_shades=None, shade_distance=None,
+            use_multiplier=True, exclude_plenums=False, cap=False, tolerance=0.01,
+            enforce_adj=True, enforce_solid=True, workers=None, executor=None):
+        """Get an iterator that converts Buildings into one honeybee Model per story.
+
+        This yields the same Models as the stories_to_honeybee method but each
+        Model is only created when it is requested from the iterator. So the
+        Models can be written to files and released one by one, keeping memory
+        bounded by the largest Story rather than all of the Buildings.
+
+        Args:
+            buildings: An array of Building objects to be converted into an array of
+                honeybee Models with one story per model.
+            context_shades: An optional array of ContextShade objects that will be
+                added to the honeybee Models if their bounding box overlaps with a
+                given building within the shade_distance.
+            shade_distance: An optional number to note the distance beyond which other
+                objects' shade should not be exported into a given Model. This is
+                helpful for reducing the simulation run time of each Model when other
+                connected buildings are too far away to have a meaningful impact on
+                the results. If None, all other buildings will be included as context
+                shade in each and every Model. Set to 0 to exclude all neighboring
+                buildings from the resulting models. Default: None.
+            use_multiplier: If True, the multipliers on this Building's Stories will be
+                passed along to the generated Honeybee Room objects, indicating the
+                simulation will be run once for each unique room and then results
+                will be multiplied. If False, full geometry objects will be written
+                for each and every floor in the building that are represented through
+                multipliers and all room multipliers will be 1. (Default: True).
+            exclude_plenums: Boolean to indicate whether ceiling/floor plenum depths
+                assigned to Room2Ds should be ignored during translation. This
+                results in each Room2D translating to a single Honeybee Room at
+                the full floor_to_ceiling_height instead of a base Room with (a)
+                plenum Room(s). (Default: False).
+            cap: Boolean to note whether building shade representations should be capped
+                with a top face. Usually, this is not necessary to account for
+                blocked sun and is only needed when it's important to account for
+                reflected sun off of roofs. (Default: False).
+            tolerance: The minimum distance in z values of floor_height and
+                floor_to_ceiling_height at which adjacent Faces will be split.
+                Default: 0.01, suitable for objects in meters.
+            enforce_adj: Boolean to note whether an exception should be raised if
+                an adjacency between two Room2Ds is invalid (True) or if the invalid
+                Surface boundary condition should be replaced with an Outdoor
+                boundary condition (False). If False, any Walls containing
+                WindowParameters and an illegal boundary condition will also
+                be replaced with an Outdoor boundary condition. (Default: True).
+            enforce_solid: Boolean to note whether rooms should be translated
+                as solid extrusions whenever translating them with custom
+                roof geometry produces a non-solid result (True) or the non-solid
+                room geometry should be allowed to remain in the result (False).
+                The latter is useful for understanding why a particular roof
+                geometry has produced a non-solid result. (Default: True).
+            workers: An optional integer for the number of processes to be used
+                to translate the Stories in parallel. If None or 1, all Stories
+                will be translated serially in the current process. Set to 0 to
+                use all available CPUs. (Default: None).
+            executor: An optional concurrent.futures Executor to be used to translate
+                the Stories in parallel (eg. a pool that is shared across several
+                operations). When specified, the workers input is ignored and
+                the executor is not shut down after translation. (Default: None).
+
+        Returns:
+            An iterator of honeybee Models that represent the Stories.
+        """
         # create lists with all context representations of the buildings + shade
-        bldg_shades, bldg_pts, con_shades, con_pts = Building._honeybee_shades(
-            buildings, context_shades, shade_distance, cap, tolerance)
-        # loop through each Building and create a model
-        models = []  # list to be filled with Honeybee Models
+        bldg_shades, bldg_pts, con_shades, con_pts, grids = \
+            Building._honeybee_shades(
+                buildings, context_shades, shade_distance, cap, tolerance)
         num_bldg = len(buildings)
-        for i, bldg in enumerate(buildings):
-            dummy_model = Model(bldg.identifier)  # blank model to hold context shade
-            Building._add_context_to_honeybee(
-                dummy_model, bldg_shades, bldg_pts, con_shades, con_pts,
-                shade_distance, num_bldg, i)
-            bldg_con = list(dummy_model.orphaned_shades)
-            if use_multiplier:
-                for j, story in enumerate(bldg.unique_stories):
-                    if not exclude_plenums and story.has_plenums:
-                        plenum_bldg = Building(story.identifier, [story.duplicate()])
-                        dummy_model = plenum_bldg.to_honeybee(
-                            True, False, tolerance=tolerance,
-                            enforce_adj=enforce_adj, enforce_solid=enforce_solid)
-                        hb_rooms = dummy_model.rooms
-                    else:
-                        hb_rooms = story.to_honeybee(
-                            True, tolerance=tolerance,
-                            enforce_adj=enforce_adj, enforce_solid=enforce_solid)
-                    if bldg.has_room_3ds:
-                        hb_rooms.extend(bldg.room_3ds_by_story(story.display_name))
-                    shds = bldg_con + bldg.shade_representation(j, cap, False, tolerance)
-                    model = Model(story.identifier, hb_rooms, orphaned_shades=shds)
-                    model.display_name = story.display_name
-                    models.append(model)  # append to the final list of Models
-            else:
-                self_shds = [story.shade_representation(cap, tolerance)
-                             for story in bldg.unique_stories if not story.is_plenum]
-                full_shades = []
-                for j, story in enumerate(bldg.unique_stories):
-                    if not story.is_plenum:
-                        for k in range(story.multiplier):
-                            mult_shd = story.shade_representation_multiplier(
-                                k, cap=cap, tolerance=tolerance)
-                            mult_shd.extend([s for s_ar in self_shds[:j] for s in s_ar])
-                            mult_shd.extend([s for s_ar in self_shds[j + 1:] for s in s_ar])
-                            full_shades.append(mult_shd)
-                for story, shades in zip(bldg.all_stories(), full_shades):
-                    if not exclude_plenums and story.has_plenums:
-                        plenum_bldg = Building(story.identifier, [story.duplicate()])
-                        dummy_model = plenum_bldg.to_honeybee(
-                            True, False, tolerance=tolerance,
-                            enforce_adj=enforce_adj, enforce_solid=enforce_solid)
-                        hb_rooms = dummy_model.rooms
-                    else:
-                        hb_rooms = story.to_honeybee(
-                            True, tolerance=tolerance,
-                            enforce_adj=enforce_adj, enforce_solid=enforce_solid)
-                    if bldg.has_room_3ds:
-                        hb_rooms.extend(bldg.room_3ds_by_story(story.display_name))
-                    shds = bldg_con + shades
-                    model = Model(story.identifier, hb_rooms, orphaned_shades=shds)
-                    model.display_name = story.display_name
-                    models.append(model)  # append to the final list of Models
-            if bldg.has_room_3ds:  # organize them by story and add them
-                accounted_for = bldg.room_2d_story_names
-                r3_story_dict = bldg._story_dict_room_3d()
-                shds = bldg_con + bldg.shade_representation(
-                    None, cap, False, tolerance)
-                for story_id, hb_rooms in r3_story_dict.items():
-                    if story_id not in accounted_for:
-                        model = Model(story_id, hb_rooms, orphaned_shades=shds)
-                        models.append(model)  # append to the final list of Models
+        bldg_cons = {}  # context shades of each Building that is being translated
+        story_info = deque()  # Building index, Story and shades of each submitted Story
+
+        def story_args():
+            """Lazily gather the Stories of each Building with their shades."""
+            for i, bldg in enumerate(buildings):
+                dummy_model = Model(bldg.identifier)  # blank model to hold context
+                Building._add_context_to_honeybee(
+                    dummy_model, bldg_shades, bldg_pts, con_shades, con_pts,
+                    shade_distance, num_bldg, i, grids)
+                bldg_con = list(dummy_model.orphaned_shades)
+                bldg_cons[i] = bldg_con
+                if use_multiplier:
+                    for j, story in enumerate(bldg.unique_stories):
+                        shds = bldg_con + \
+                            bldg.shade_representation(j, cap, False, tolerance)
+                        story_info.append((i, story, shds))
+                        yield story, exclude_plenums, tolerance, enforce_adj, \
+                            enforce_solid
+                else:
+                    self_shds = [story.shade_representation(cap, tolerance)
+                                 for story in bldg.unique_stories if not story.is_plenum]
+                    full_shades = []
+                    for j, story in enumerate(bldg.unique_stories):
+                        if not story.is_plenum:
+                            for k in range(story.multiplier):
+                                mult_shd = story.shade_representation_multiplier(
+                                    k, cap=cap, tolerance=tolerance)
+                                mult_shd.extend(
+                                    [s for s_ar in self_shds[:j] for s in s_ar])
+                                mult_shd.extend(
+                                    [s for s_ar in self_shds[j + 1:] for s in s_ar])
+                                full_shades.append(mult_shd)
+                    for story, shades in zip(bldg.all_stories(), full_shades):
+                        story_info.append((i, story, bldg_con + shades))
+                        yield story, exclude_plenums, tolerance, enforce_adj, \
+                            enforce_solid
+
+        # translate each Story into Rooms, optionally in parallel processes
+        story_rooms = parallel_imap(
+            Building._story_to_honeybee, story_args(), workers, executor)
+
+        # create a Model for each Story after all Stories of previous Buildings
+        bldg_i = 0
+        for hb_rooms in story_rooms:
+            i, story, shds = story_info.popleft()
+            while bldg_i < i:  # all Stories of the previous Building are done
+                for model in Building._room_3d_story_models(
+                        buildings[bldg_i], bldg_cons.pop(bldg_i), cap, tolerance):
+                    yield model
+                bldg_i += 1
+            bldg = buildings[i]
+            if bldg.has_room_3ds:
+                hb_rooms.extend(bldg.room_3ds_by_story(story.display_name))
+            model = Model(story.identifier, hb_rooms, orphaned_shades=shds)
+            model.display_name = story.display_name
+            hb_rooms = shds = None
+            yield model
+            model = None  # release the model before the next one is translated
+        while bldg_i < num_bldg:
+            for model in Building._room_3d_story_models(
+                    buildings[bldg_i], bldg_cons.pop(bldg_i), cap, tolerance):
+                yield model
+            bldg_i += 1
+
+    @staticmethod
+    def _room_3d_story_models(bldg, bldg_con, cap, tolerance):
+        """Get Models for the stories of a Building that only have 3D Rooms."""
+        models = []
+        if bldg.has_room_3ds:  # organize them by story and add them
+            accounted_for = bldg.room_2d_story_names
+            r3_story_dict = bldg._story_dict_room_3d()
+            shds = bldg_con + bldg.shade_representation(None, cap, False, tolerance)
+            for story_id, hb_rooms in r3_story_dict.items():
+                if story_id not in accounted_for:
+                    models.append(Model(story_id, hb_rooms, orphaned_shades=shds))
         return models
 
+    @staticmethod
+    def _building_to_honeybee(args):
+        """Translate a Building to a Honeybee Model using a tuple of arguments.
+
+        This is used to translate Buildings in parallel processes.
+        """
+        bldg, use_multiplier, exclude_plenums, tolerance, enforce_adj, enforce_solid = \
+            args
+        return bldg.to_honeybee(
+            use_multiplier, exclude_plenums=exclude_plenums, tolerance=tolerance,
+            enforce_adj=enforce_adj, enforce_solid=enforce_solid)
+
+    @staticmethod
+    def _story_to_honeybee(args):
+        """Translate a Story to a list of Honeybee Rooms using a tuple of arguments.
+
+        This is used to translate Stories in parallel processes.
+        """
+        story, exclude_plenums, tolerance, enforce_adj, enforce_solid = args
+        if not exclude_plenums and story.has_plenums:
+            plenum_bldg = Building(story.identifier, [story.duplicate()])
+            dummy_model = plenum_bldg.to_honeybee(
+                True, False, tolerance=tolerance,
+                enforce_adj=enforce_adj, enforce_solid=enforce_solid)
+            return dummy_model.rooms
+        return story.to_honeybee(
+            True, tolerance=tolerance,
+            enforce_adj=enforce_adj, enforce_solid=enforce_solid)
+
+    def _story_index(self):
+        """Get a dictionary of the unique Stories in this Building with identifier keys.
+
+        The dictionary is only rebuilt when the Stories of the Building have changed
+        or one of them has been renamed since the last time it was requested.
+        If several Stories share an identifier, the first one is in the dictionary.
+        """
+        index = self._identifier_index
+        if index is None or index[0] is not self._unique_stories:
+            story_index = {}
+            for story in self._unique_stories:
+                if story._identifier not in story_index:
+                    story_index[story._identifier] = story
+            index = self._identifier_index = (self._unique_stories, story_index)
+        return index[1]
+
+    @staticmethod
+    def _real_stories(stories):
+        """Get a list of Stories with any OffsetStoryViews replaced by real Stories."""
+        return [st.to_story() if isinstance(st, OffsetStoryView) else st
+                for st in stories]
+
     def _compute_roof_heights(self):
         """Get a list with the center height of each RoofSpecification in the Building.
 
@@ -2933,9 +3172,31 @@ class Building(_BaseGeometry):
 
     @staticmethod
     def _honeybee_shades(buildings, context_shades, shade_distance, cap, tolerance):
-        """Get lists of Honeybee shades from Building and ContextShade objects."""
+        """Get lists of Honeybee shades from Building and ContextShade objects.
+
+        When a shade_distance is specified, the bounding rectangles of the
+        Buildings and ContextShades are also indexed in RectangleGrids such that
+        the shades within the distance of each Building can be found quickly.
+
+        Returns:
+            A tuple with five items.
+
+            -   bldg_shades: A list with a list of Honeybee Shades for each Building.
+
+            -   bldg_pts: A list with Point2Ds (min, center, max) for each Building.
+
+            -   con_shades: A list with a list of Honeybee Shades and ShadeMeshes
+                for each ContextShade.
+
+            -   con_pts: A list with Point2Ds (min, center, max) for each ContextShade.
+
+            -   grids: A tuple with a RectangleGrid of the Buildings and a
+                RectangleGrid of the ContextShades (or None if there are no
+                ContextShades). Will be None if shade_distance is None.
+        """
         bldg_shades, bldg_pts = [], []
         con_shades, con_pts = [], []
+        grids = None
         if shade_distance is None or shade_distance > 0:
             for bldg in buildings:
                 b_shades = bldg.shade_representation(
@@ -2950,12 +3211,24 @@ class Building(_BaseGeometry):
                     c_min, c_max = con.min, con.max
                     center = Point2D((c_min.x + c_max.x) / 2, (c_min.y + c_max.y) / 2)
                     con_pts.append((c_min, center, c_max))
-        return bldg_shades, bldg_pts, con_shades, con_pts
+            if shade_distance is not None:
+                bldg_grid = RectangleGrid(Building._bound_pts_rectangle(pts)
+                                          for pts in bldg_pts)
+                con_grid = RectangleGrid(
+                    Building._bound_pts_rectangle(pts) for pts in con_pts) \
+                    if len(con_pts) != 0 else None
+                grids = (bldg_grid, con_grid)
+        return bldg_shades, bldg_pts, con_shades, con_pts, grids
 
     @staticmethod
     def _add_context_to_honeybee(model, bldg_shades, bldg_pts, con_shades, con_pts,
-                                 shade_distance, num_bldg, i):
-        """Add context shades to a Honeybee Model based on shade distance."""
+                                 shade_distance, num_bldg, i, grids=None):
+        """Add context shades to a Honeybee Model based on shade distance.
+
+        If the grids from _honeybee_shades are input, they will be used to find
+        the Buildings and ContextShades that are candidates for being within the
+        shade_distance instead of checking all of them.
+        """
         if shade_distance is None:  # add all other bldg shades to the model
             for j in xrange(i + 1, num_bldg):  # buildings before this one
                 for shd in bldg_shades[j]:
@@ -2970,17 +3243,23 @@ class Building(_BaseGeometry):
                     else:
                         model.add_shade_mesh(shd)
         elif shade_distance > 0:  # add only shade within the distance
-            for j in xrange(i + 1, num_bldg):  # buildings before this one
+            if grids is not None:
+                rect = Building._bound_pts_rectangle(bldg_pts[i])
+                bldg_grid, con_grid = grids
+                near_bldgs = bldg_grid.query(rect, shade_distance)
+                other_bldgs = [j for j in near_bldgs if j > i] + \
+                    [k for k in near_bldgs if k < i]
+                near_cons = con_grid.query(rect, shade_distance) \
+                    if con_grid is not None else []
+            else:
+                other_bldgs = list(xrange(i + 1, num_bldg)) + list(xrange(i))
+                near_cons = xrange(len(con_shades))
+            for j in other_bldgs:  # buildings before and then after this one
                 if Building._bound_rect_in_dist(bldg_pts[i], bldg_pts[j],
                                                 shade_distance):
                     for shd in bldg_shades[j]:
                         model.add_shade(shd)
-            for k in xrange(i):  # buildings after this one
-                if Building._bound_rect_in_dist(bldg_pts[i], bldg_pts[k],
-                                                shade_distance):
-                    for shd in bldg_shades[k]:
-                        model.add_shade(shd)
-            for s in xrange(len(con_shades)):  # context shades
+            for s in near_cons:  # context shades
                 if Building._bound_rect_in_dist(bldg_pts[i], con_pts[s],
                                                 shade_distance):
                     for shd in con_shades[s]:
@@ -3091,6 +3370,12 @@ class Building(_BaseGeometry):
             return False  # no overlap
         return True  # overlap exists
 
+    @staticmethod
+    def _bound_pts_rectangle(bound_pts):
+        """Get a (min_x, min_y, max_x, max_y) tuple from (min, center, max) Point2Ds.
+        """
+        return (bound_pts[0].x, bound_pts[0].y, bound_pts[2].x, bound_pts[2].y)
+
     @staticmethod
     def _separated_ground_floor(base_story):
         """Get a separated ground floor from a base_story."""
@@ -47,13 +47,35 @@ Note:
 """
 import click
 
+from dragonfly import load_extensions, _pending_extensions
 from dragonfly.cli.validate import validate
 from dragonfly.cli.create import create
 from dragonfly.cli.translate import translate
 from dragonfly.cli.edit import edit
 
 
-@click.group()
+class _ExtensionGroup(click.Group):
+    """A click Group that loads pending extensions only when a command is not found.
+
+    This ensures that the commands of extensions are available even when they
+    are imported lazily (with the DRAGONFLY_LAZY_EXTENSIONS environment variable).
+    The commands of pending extensions are listed using the names in the cached
+    extension manifest (eg. "energy" for dragonfly_energy) without importing them.
+    """
+
+    def list_commands(self, ctx):
+        commands = set(click.Group.list_commands(self, ctx))
+        commands.update(name[len('dragonfly_'):] for name in _pending_extensions)
+        return sorted(commands)
+
+    def get_command(self, ctx, cmd_name):
+        command = click.Group.get_command(self, ctx, cmd_name)
+        if command is None and load_extensions(cmd_name):
+            command = click.Group.get_command(self, ctx, cmd_name)
+        return command
+
+
+@click.group(cls=_ExtensionGroup)
 @click.version_option()
 def main():
     pass
@@ -180,12 +180,22 @@ def from_honeybee(base_model, conversion_method='ExtrudedOnly',
 @click.option('--tolerance', '-t', help='The maximum difference between x, y, and z '
               'values at which vertices are considered equivalent.',
               type=float, default=None)
+@click.option('--full-load/--stream', ' /-st', help='Flag to indicate whether the '
+              'features of the geojson should be read from the file one at a time '
+              'instead of loading the whole file into memory at once. This is '
+              'recommended for very large geojson files.',
+              default=True, show_default=True)
+@click.option('--workers', '-w', help='An optional integer for the number of '
+              'processes to be used to create the Buildings in parallel. If '
+              'unspecified, everything will be created in a single process. Set to 0 '
+              'to use all available CPUs.', type=int, default=None)
 @click.option('--output-file', '-f', help='Optional file to output the Model JSON '
               'string. By default it will be printed out to stdout',
               type=click.File('w'), default='-')
 def from_geojson_cli(
         geojson, location, point, window_ratio, buildings_only,
-        no_context, separate_top_bottom, units, tolerance, output_file):
+        no_context, separate_top_bottom, units, tolerance, full_load, workers,
+        output_file):
     """Create a Dragonfly model from a geojson file with building footprints.
 
     \b
@@ -197,9 +207,11 @@ def from_geojson_cli(
         all_to_buildings = not buildings_only
         existing_to_context = not no_context
         no_separation = not separate_top_bottom
+        stream = not full_load
         from_geojson(
             geojson, location, point, window_ratio, all_to_buildings,
-            existing_to_context, no_separation, units, tolerance, output_file)
+            existing_to_context, no_separation, units, tolerance, output_file,
+            stream=stream, workers=workers)
     except Exception as e:
         _logger.exception('Model creation from geoJSON failed.\n{}'.format(e))
         sys.exit(1)
@@ -211,7 +223,8 @@ def from_geojson(
         geojson, location=None, point=None, window_ratio=None,
         all_to_buildings=False, existing_to_context=False, no_separation=False,
         units='Meters', tolerance=None, output_file=None,
-        buildings_only=True, no_context=True, separate_top_bottom=True):
+        buildings_only=True, no_context=True, separate_top_bottom=True,
+        stream=False, workers=None, full_load=True):
     """Create a Dragonfly model from a geojson file with building footprints.
 
     Args:
@@ -246,6 +259,12 @@ def from_geojson(
             vertices are considered equivalent.
         output_file: Optional file to output the Model JSON string. If None,
             The string will be returned from this method.
+        stream: Boolean to note whether the features of the geojson should be
+            read from the file one at a time instead of loading the whole file
+            into memory at once. (Default: False).
+        workers: An optional integer for the number of processes to be used to
+            create the Buildings in parallel. If None, everything will be
+            created in a single process. Set to 0 to use all available CPUs.
     """
     # parse the location and point if they are specified
     if location is not None:
@@ -260,7 +279,7 @@ def from_geojson(
     tolerance = tolerance if tolerance is not None else UNITS_TOLERANCES[units]
     model, _ = Model.from_geojson(
         geojson, location, point, all_to_buildings, existing_to_context,
-        units=units, tolerance=tolerance)
+        units=units, tolerance=tolerance, stream=stream, workers=workers)
 
     # apply windows if the window ratio and top/bottom separation if specified
     if window_ratio is not None:
@@ -71,6 +71,11 @@ def translate():
               'in the result. The latter is useful for understanding why a '
               'particular roof geometry has produced a non-solid result.',
               default=True, show_default=True)
+@click.option('--workers', '-w', help='An optional integer for the number of '
+              'processes to be used to translate the Buildings (or the Stories when '
+              'obj-per-model is Story) in parallel. If unspecified, everything will '
+              'be translated in a single process. Set to 0 to use all available '
+              'CPUs.', type=int, default=None, show_default=True)
 @click.option('--folder', '-f', help='Folder on this computer, into which the HBJSON '
               'files will be written. By default, the files will be output '
               'to the honeybee default simulation folder and placed in a project '
@@ -83,7 +88,7 @@ def translate():
               'stdout', type=click.File('w'), default='-', show_default=True)
 def model_to_honeybee_cli(
     model_file, obj_per_model, multiplier, plenum, no_ceil_adjacency, merge_method,
-    shade_dist, no_cap, enforce_adj_check, enforce_solid, folder, log_file
+    shade_dist, no_cap, enforce_adj_check, enforce_solid, workers, folder, log_file
 ):
     """Translate a Dragonfly Model file into one or more Honeybee Models.
 
@@ -101,7 +106,7 @@ def model_to_honeybee_cli(
         model_to_honeybee(
             model_file, obj_per_model, full_geometry,
             no_plenum, ceil_adjacency, merge_method, shade_dist, cap,
-            bypass_adj_check, permit_non_solid, folder, log_file)
+            bypass_adj_check, permit_non_solid, folder, log_file, workers=workers)
     except Exception as e:
         _logger.exception('Model translation failed.\n{}'.format(e))
         sys.exit(1)
@@ -115,7 +120,7 @@ def model_to_honeybee(
         bypass_adj_check=False, permit_non_solid=False,
         folder=None, log_file=None,
         multiplier=True, plenum=True, no_cap=True, no_ceil_adjacency=True,
-        enforce_adj_check=True, enforce_solid=True):
+        enforce_adj_check=True, enforce_solid=True, workers=None):
     """Translate a Dragonfly Model file into one or more Honeybee Models.
 
     Args:
@@ -192,6 +197,10 @@ def model_to_honeybee(
         log_file: Optional log file to output a JSON array of dictionaries with
             information about each of the generated HBJSONs, including their
             file paths. If None, the string will be returned from this method.
+        workers: An optional integer for the number of processes to be used to
+            translate the Buildings (or the Stories when obj_per_model is Story)
+            in parallel. If None, everything will be translated in a single
+            process. Set to 0 to use all available CPUs. (Default: None).
     """
     # set the default folder to the default if it's not specified
     if folder is None:
@@ -208,12 +217,12 @@ def model_to_honeybee(
     multiplier = not full_geometry
     enforce_adj_check = not bypass_adj_check
     enforce_solid = not permit_non_solid
-    hb_models = model.to_honeybee(
+    hb_models = model.iter_honeybee(
         obj_per_model, shade_dist, multiplier, no_plenum, cap,
         ceil_adjacency, merge_method,
-        enforce_adj=enforce_adj_check, enforce_solid=enforce_solid)
+        enforce_adj=enforce_adj_check, enforce_solid=enforce_solid, workers=workers)
 
-    # write out the honeybee JSONs and collect the info about them
+    # write out each honeybee JSON as it is translated and collect the info about it
     hb_jsons = []
     for hb_model in hb_models:
         model_dict = hb_model.to_dict(triangulate_sub_faces=True)
@@ -227,6 +236,7 @@ def model_to_honeybee(
             'full_path': os.path.abspath(file_path)
         }
         hb_jsons.append(hb_info)
+        hb_model = model_dict = None  # release the model before translating the next
     return process_content_to_output(json.dumps(hb_jsons, indent=4), log_file)
 
 
@@ -43,11 +43,19 @@ def validate():
     '--room-overlaps', 'room_overlaps', flag_value='True',
     help='Deprecated flag used to check room collisions. '
     'Use `dragonfly validate room-collisions` instead.')
+@click.option(
+    '--workers', '-w', help='An optional integer for the number of processes to be '
+    'used to check the Buildings of the Model in parallel. This only applies to the '
+    'dragonfly-core geometry checks that are run when the extension is Generic. '
+    'If unspecified, everything will be checked in a single process. Set to 0 to '
+    'use all available CPUs.', type=int, default=None, show_default=True)
 @click.option(
     '--output-file', '-f', help='Optional file to output the full report '
     'of any errors detected. By default it will be printed out to stdout',
     type=click.File('w'), default='-')
-def validate_model_cli(model_file, extension, plain_text, room_overlaps, output_file):
+def validate_model_cli(
+    model_file, extension, plain_text, room_overlaps, workers, output_file
+):
     """Validate a Model file against the Dragonfly schema.
 
     \b
@@ -62,7 +70,7 @@ def validate_model_cli(model_file, extension, plain_text, room_overlaps, output_
                   'Use `dragonfly validate room-collisions` instead.')
             validate_room_collisions(model_file, json, output_file)
         else:
-            validate_model(model_file, extension, json, output_file)
+            validate_model(model_file, extension, json, output_file, workers=workers)
     except Exception as e:
         _logger.exception('Model validation failed.\n{}'.format(e))
         sys.exit(1)
@@ -71,7 +79,7 @@ def validate_model_cli(model_file, extension, plain_text, room_overlaps, output_
 
 
 def validate_model(model_file, extension='Generic', json=False, output_file=None,
-                   plain_text=True):
+                   plain_text=True, workers=None):
     """Validate all properties of a Model file against the Dragonfly schema.
 
     This includes checking basic compliance of dragonfly geometry with the rules
@@ -102,8 +110,13 @@ def validate_model(model_file, extension='Generic', json=False, output_file=None
             formatted as a JSON object instead of plain text. (Default: False).
         output_file: Optional file to output the full report of the validation.
             If None, the string will simply be returned from this method.
+        workers: An optional integer for the number of processes to be used to
+            check the Buildings of the Model in parallel. If None, everything
+            will be checked in a single process. Set to 0 to use all available
+            CPUs. (Default: None).
     """
-    report = Model.validate(model_file, 'check_for_extension', [extension], json)
+    report = Model.validate(
+        model_file, 'check_for_extension', [extension], json, workers=workers)
     return process_content_to_output(report, output_file)
 
 
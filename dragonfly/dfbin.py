@@ -0,0 +1,269 @@
+# coding: utf-8
+"""Utilities to write and read Dragonfly Models in a compact binary format (DFbin).
+
+A DFbin file starts with a short preamble and a JSON header, which contains the
+Model attributes along with the byte offset and length of a separate block for
+each Building. Each Building block stores the floor vertices and heights of all
+of its Room2Ds as contiguous arrays of 64-bit floats, which are indexed by
+arrays of 32-bit offsets for each loop, Room2D and Story. Room2D identifiers
+and boundary conditions are stored once in a table of interned strings and
+all other attributes are stored in a JSON remainder of the Building. All arrays
+are little-endian and aligned to 8 bytes such that they can be memory-mapped.
+
+Because every Building has its own block, a single Building can be loaded by
+reading only the header and the bytes of its block.
+"""
+import sys
+import json
+import struct
+from array import array
+try:
+    import mmap
+except ImportError:  # platform without memory-mapped files
+    mmap = None
+
+from honeybee.boundarycondition import boundary_conditions as hb_bcs
+
+MAGIC = b'DFBIN\x00'
+VERSION = 1
+_PREAMBLE = struct.Struct('<6sHI')  # magic, version and header length
+_BLOCK = struct.Struct('<10I')  # item counts at the start of each block
+_SWAP = sys.byteorder != 'little'
+_ROOM_KEYS = ('identifier', 'floor_boundary', 'floor_holes', 'floor_height',
+              'floor_to_ceiling_height', 'boundary_conditions')
+
+
+def is_dfbin(file_path):
+    """Get a boolean for whether a file is a DFbin file from its first bytes."""
+    with open(file_path, 'rb') as inf:
+        return inf.read(len(MAGIC)) == MAGIC
+
+
+def write_dfbin(model_dict, file_path):
+    """Write a Model dictionary to a DFbin file.
+
+    Args:
+        model_dict: A Model dictionary such as that produced by Model.to_dict.
+            The Buildings of this dictionary are not altered.
+        file_path: The path to the DFbin file to be written.
+    """
+    header = {k: v for k, v in model_dict.items()
+              if k not in ('buildings', 'context_shades')}
+    blocks, index, position = [], [], 0
+    for bldg_dict in model_dict.get('buildings') or []:
+        block = encode_building(bldg_dict)
+        index.append((bldg_dict['identifier'], position, len(block)))
+        blocks.append(block)
+        position += len(block)
+    shades = model_dict.get('context_shades')
+    shades = _pad(json.dumps(shades).encode('utf-8'))
+    header['_dfbin'] = {'buildings': index,
+                        'context_shades': (position, len(shades))}
+    header = _pad(json.dumps(header).encode('utf-8'), _PREAMBLE.size)
+    with open(file_path, 'wb') as fp:
+        fp.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        fp.write(header)
+        for block in blocks:
+            fp.write(block)
+        fp.write(shades)
+    return file_path
+
+
+def read_dfbin(file_path, building_identifiers=None):
+    """Read the contents of a DFbin file.
+
+    Args:
+        file_path: The path to a DFbin file.
+        building_identifiers: An optional list of Building identifiers to be
+            read from the file. When specified, only the blocks of these
+            Buildings are read and the ContextShades are not read. If None,
+            all Buildings and ContextShades are read. (Default: None).
+
+    Returns:
+        A tuple with three items.
+
+        -   data: A Model dictionary without the buildings or context_shades.
+
+        -   buildings: An iterator over the Building dictionaries, which are
+            decoded one at a time in the order they appear in the file.
+
+        -   context_shades: A list of ContextShade dictionaries.
+    """
+    with open(file_path, 'rb') as inf:
+        magic, version, header_len = _PREAMBLE.unpack(inf.read(_PREAMBLE.size))
+        assert magic == MAGIC, '"{}" is not a DFbin file.'.format(file_path)
+        assert version <= VERSION, 'DFbin version {} is not supported. ' \
+            'Update dragonfly-core to read it.'.format(version)
+        data = json.loads(inf.read(header_len).decode('utf-8'))
+    start, index = _PREAMBLE.size + header_len, data.pop('_dfbin')
+    bldg_index = index['buildings']
+    if building_identifiers is not None:
+        bldg_ids = set(building_identifiers)
+        bldg_index = [b for b in bldg_index if b[0] in bldg_ids]
+        shades = []
+    else:
+        offset, length = index['context_shades']
+        shades = _read_bytes(file_path, start + offset, length)
+        shades = json.loads(shades.decode('utf-8')) or []
+    buildings = _iter_buildings(file_path, start, bldg_index)
+    return data, buildings, shades
+
+
+def encode_building(data):
+    """Get the bytes of a DFbin block from a Building dictionary.
+
+    Args:
+        data: A Building dictionary. This dictionary is not altered.
+    """
+    strings, string_ids = [], {}
+
+    def intern(text):
+        try:
+            return string_ids[text]
+        except KeyError:
+            string_ids[text] = len(strings)
+            strings.append(text)
+            return string_ids[text]
+
+    coords, heights = array('d'), array('d')
+    loops, room_loops, story_rooms = array('I', [0]), array('I', [0]), array('I', [0])
+    names, bcs = array('I'), array('I')
+    rest = dict(data)
+    if rest.get('unique_stories') is not None:
+        rest['unique_stories'] = []
+        for story in data['unique_stories']:
+            story = dict(story)
+            rest_rooms = []
+            for room in story.get('room_2ds') or []:
+                loop_st = loops[-1]
+                for loop in [room['floor_boundary']] + (room.get('floor_holes') or []):
+                    for pt in loop:
+                        coords.extend((pt[0], pt[1]))
+                    loops.append(len(coords) // 2)
+                room_loops.append(len(loops) - 1)
+                heights.extend((room['floor_height'], room['floor_to_ceiling_height']))
+                names.append(intern(room['identifier']))
+                room_bcs = room.get('boundary_conditions')
+                if room_bcs is None:  # use the default of Room2D
+                    ceil_hgt = room['floor_height'] + room['floor_to_ceiling_height']
+                    bc = hb_bcs.outdoors if ceil_hgt > 0 else hb_bcs.ground
+                    room_bcs = [bc.to_dict()] * (loops[-1] - loop_st)
+                bcs.extend(intern(json.dumps(bc, sort_keys=True)) for bc in room_bcs)
+                rest_rooms.append({k: v for k, v in room.items() if k not in _ROOM_KEYS})
+            story['room_2ds'] = rest_rooms
+            story_rooms.append(len(names))
+            rest['unique_stories'].append(story)
+
+    strings = json.dumps(strings).encode('utf-8')
+    rest = json.dumps(rest).encode('utf-8')
+    arrays = (coords, heights, loops, room_loops, story_rooms, names, bcs)
+    counts = [len(strings), len(rest)] + [len(a) for a in arrays] + [0]
+    parts = [_BLOCK.pack(*counts)]
+    for arr in arrays:
+        if _SWAP:
+            arr = array(arr.typecode, arr)
+            arr.byteswap()
+        parts.append(_array_bytes(arr))
+    parts.append(b' ' * (-sum(len(p) for p in parts) % 8))
+    parts.extend((strings, rest))
+    return _pad(b''.join(parts))
+
+
+def decode_building(block):
+    """Get a Building dictionary from the bytes of a DFbin block.
+
+    Args:
+        block: A bytes-like object for a DFbin block, which may be a slice of
+            a memory-mapped file.
+    """
+    counts = _BLOCK.unpack_from(block, 0)
+    position, arrays = _BLOCK.size, []
+    for typecode, count in zip('ddIIIII', counts[2:9]):
+        arr, position = _read_array(typecode, block, position, count)
+        arrays.append(arr)
+    coords, heights, loops, room_loops, story_rooms, names, bcs = arrays
+    position += -position % 8
+    strings = json.loads(bytes(block[position:position + counts[0]]).decode('utf-8'))
+    position += counts[0]
+    data = json.loads(bytes(block[position:position + counts[1]]).decode('utf-8'))
+
+    bc_dicts = {}  # decode each unique boundary condition once
+    bc_i = 0
+    for s_i, story in enumerate(data.get('unique_stories') or []):
+        r_st = story_rooms[s_i]
+        for r_i, room in enumerate(story['room_2ds'], r_st):
+            room_pts = []
+            for l_i in range(room_loops[r_i], room_loops[r_i + 1]):
+                room_pts.append([(coords[2 * v], coords[2 * v + 1])
+                                 for v in range(loops[l_i], loops[l_i + 1])])
+            room['identifier'] = strings[names[r_i]]
+            room['floor_boundary'] = room_pts[0]
+            if len(room_pts) > 1:
+                room['floor_holes'] = room_pts[1:]
+            room['floor_height'] = heights[2 * r_i]
+            room['floor_to_ceiling_height'] = heights[2 * r_i + 1]
+            room_bcs, seg_count = [], loops[room_loops[r_i + 1]] - loops[room_loops[r_i]]
+            for b_i in bcs[bc_i:bc_i + seg_count]:  # one per segment of all loops
+                try:
+                    room_bcs.append(bc_dicts[b_i])
+                except KeyError:
+                    bc_dicts[b_i] = json.loads(strings[b_i])
+                    room_bcs.append(bc_dicts[b_i])
+            bc_i += seg_count
+            room['boundary_conditions'] = room_bcs
+    return data
+
+
+def _iter_buildings(file_path, start, bldg_index):
+    """Iterate over the Building dictionaries of a DFbin file."""
+    if len(bldg_index) == 0:
+        return
+    with open(file_path, 'rb') as inf:
+        try:
+            buffer = mmap.mmap(inf.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:  # no mmap support; seek to each block instead
+            buffer = None
+        try:
+            for _, offset, length in bldg_index:
+                if buffer is not None:
+                    block = buffer[start + offset:start + offset + length]
+                else:
+                    inf.seek(start + offset)
+                    block = inf.read(length)
+                yield decode_building(block)
+        finally:
+            if buffer is not None:
+                buffer.close()
+
+
+def _read_bytes(file_path, offset, length):
+    """Read a given number of bytes from a file starting at an offset."""
+    with open(file_path, 'rb') as inf:
+        inf.seek(offset)
+        return inf.read(length)
+
+
+def _read_array(typecode, buffer, position, count):
+    """Read an array from a buffer and get the position after the array."""
+    arr = array(typecode)
+    end = position + count * arr.itemsize
+    try:
+        arr.frombytes(buffer[position:end])
+    except AttributeError:  # Python 2 or IronPython
+        arr.fromstring(bytes(buffer[position:end]))
+    if _SWAP:
+        arr.byteswap()
+    return arr, end
+
+
+def _array_bytes(arr):
+    """Get the bytes of an array."""
+    try:
+        return arr.tobytes()
+    except AttributeError:  # Python 2 or IronPython
+        return arr.tostring()
+
+
+def _pad(content, offset=0):
+    """Pad bytes with spaces such that they end on a multiple of 8 bytes."""
+    return content + b' ' * (-(len(content) + offset) % 8)
@@ -2,6 +2,81 @@
 """A series of utility functions that are useful across several dragonfly extensions."""
 from __future__ import division
 
+import os
+import sys
+import json
+import pkgutil
+
+
+def extension_names(cache_file=None):
+    """Get the names of all dragonfly extension packages installed on the sys.path.
+
+    Args:
+        cache_file: An optional path to a JSON file in which the names of the
+            extensions will be cached. If the file exists and none of the sys.path
+            folders have been modified since it was written, the names will be
+            read from this file instead of searching the whole sys.path. The
+            file will be rewritten whenever the cache is found to be out of
+            date. If None, the sys.path will always be searched. (Default: None).
+
+    Returns:
+        A list of text for the names of the dragonfly extension packages
+        (eg. ["dragonfly_energy", "dragonfly_radiance"]).
+    """
+    # check whether the names can be loaded from the cache
+    if cache_file is not None:
+        path_key = _sys_path_key()
+        try:
+            with open(cache_file) as inf:
+                cache = json.load(inf)
+            if cache['python'] == sys.version and cache['sys_path'] == path_key:
+                return cache['extensions']
+        except Exception:  # no cache exists or it is not readable
+            pass
+    # search the sys.path for all of the dragonfly extensions
+    names = [name for _, name, _ in pkgutil.iter_modules()
+             if name.startswith('dragonfly_')]
+    # write the names into the cache if requested
+    if cache_file is not None:
+        cache = {'python': sys.version, 'sys_path': path_key, 'extensions': names}
+        try:
+            cache_dir = os.path.dirname(cache_file)
+            if cache_dir and not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            with open(cache_file, 'w') as outf:
+                json.dump(cache, outf)
+        except Exception:  # the cache folder is not writable
+            pass
+    return names
+
+
+def default_extension_cache():
+    """Get the path to the file used to cache the names of the dragonfly extensions.
+
+    This is the value of the DRAGONFLY_EXTENSION_CACHE environment variable if
+    it is set. Otherwise, it is a file in the .dragonfly folder of the user's
+    home directory.
+    """
+    cache_file = os.environ.get('DRAGONFLY_EXTENSION_CACHE')
+    if cache_file:
+        return cache_file
+    return os.path.join(os.path.expanduser('~'), '.dragonfly', 'extensions.json')
+
+
+def _sys_path_key():
+    """Get a list of sys.path entries and their modified times to validate the cache.
+
+    Installing or removing a package changes the modified time of the folder
+    where it is installed, which invalidates any cache with the previous times.
+    """
+    path_key = []
+    for path in sys.path:
+        try:
+            path_key.append([path, os.path.getmtime(path or os.curdir)])
+        except (OSError, TypeError):  # path does not exist
+            path_key.append([path, None])
+    return path_key
+
 
 def model_extension_dicts(data, extension_key, building_ext_dicts, story_ext_dicts,
                           room2d_ext_dicts, context_shade_ext_dicts):
@@ -0,0 +1,35 @@
+# coding: utf-8
+"""Utilities to share identical instances of immutable parameter objects.
+
+Shading parameters like Overhang or ExtrudedBorder are often repeated across all
+wall segments of a Model. Sharing one instance of each unique parameter reduces
+the memory used by large Models. Only parameter classes with an _internable
+attribute that is True can be shared and these classes must not have any
+attributes that can be changed after initialization (eg. user_data). Otherwise,
+a change to one shared instance would change all parameters equal to it.
+"""
+import weakref
+
+_PARAMETERS = weakref.WeakValueDictionary()
+
+
+def intern_parameter(parameter):
+    """Get a shared instance that is equivalent to an input parameter object.
+
+    Args:
+        parameter: A shading parameter object. None is also acceptable and
+            will simply be returned.
+
+    Returns:
+        An instance that is equal to the input parameter. This is the same
+        instance for all equal parameters that have been interned and are still
+        in use. If the parameter cannot be shared, the input parameter is returned.
+    """
+    if not getattr(parameter, '_internable', False):
+        return parameter
+    key = (parameter.__class__, hash(parameter))
+    shared = _PARAMETERS.get(key)
+    if shared is not None and shared == parameter:
+        return shared
+    _PARAMETERS[key] = parameter
+    return parameter
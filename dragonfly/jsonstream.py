@@ -0,0 +1,123 @@
+# coding: utf-8
+"""Utilities to read large JSON files without loading them entirely into memory."""
+import re
+import json
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def iter_json_object(file_obj, array_keys=(), chunk_size=1048576):
+    """Iterate over the items of a JSON object in a file while it is being read.
+
+    Values are decoded one at a time such that only the current value (and not
+    the whole JSON object) needs to be held in memory. Furthermore, the values
+    of the array_keys are not decoded as whole lists but are instead returned as
+    iterators that decode one item of the array at a time. Such iterators must
+    be used before moving to the next item of the object since they read from
+    the same file. Any items that remain unread when moving to the next key
+    of the object are decoded and discarded.
+
+    Args:
+        file_obj: A text file object, which has been opened for reading and is
+            positioned at the start of a JSON object.
+        array_keys: A list of text for keys of the JSON object that are expected
+            to have large arrays as values. When one of these keys has an array
+            as its value, the value is returned as an iterator over the array
+            items. Otherwise, the value is returned as decoded. (Default: ()).
+        chunk_size: An integer for the number of characters to be read from the
+            file at a time. Individual values larger than this are read in
+            progressively larger chunks. (Default: 1048576).
+
+    Returns:
+        An iterator of (key, value) tuples for each item of the JSON object in
+        the order in which they appear in the file.
+    """
+    reader = _JSONReader(file_obj, chunk_size)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        key = reader.decode()
+        reader.expect(':')
+        if key in array_keys and reader.peek() == '[':
+            array_items = reader.iter_array()
+            yield key, array_items
+            for _ in array_items:  # discard any array items that were not read
+                pass
+        else:
+            yield key, reader.decode()
+        if reader.next_delimiter('}'):
+            return
+
+
+class _JSONReader(object):
+    """A buffered reader that decodes JSON values from a file one at a time."""
+    __slots__ = ('_file', '_chunk_size', '_buffer', '_position', '_eof', '_decoder')
+
+    def __init__(self, file_obj, chunk_size):
+        self._file = file_obj
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def peek(self):
+        """Get the next non-whitespace character without consuming it."""
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer) or self._eof:
+                return self._buffer[self._position:self._position + 1]
+            self._read()
+
+    def expect(self, character):
+        """Consume the next non-whitespace character, checking that it is expected."""
+        found = self.peek()
+        if found != character:
+            raise ValueError('Invalid JSON. Expected "{}" but got "{}".'.format(
+                character, found or 'end of file'))
+        self._position += 1
+
+    def next_delimiter(self, closing):
+        """Consume a comma or closing bracket and get whether it was the closing one."""
+        found = self.peek()
+        if found == closing:
+            self._position += 1
+            return True
+        self.expect(',')
+        return False
+
+    def decode(self):
+        """Decode the next JSON value in the file."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except ValueError:  # the value is either incomplete or invalid
+                if self._eof:
+                    raise
+            else:  # make sure that numbers are not cut off at the end of the buffer
+                if end < len(self._buffer) or self._eof:
+                    self._position = end
+                    return value
+            self._read()
+
+    def iter_array(self):
+        """Get an iterator that decodes the items of the next JSON array one by one."""
+        self.expect('[')
+        if self.peek() == ']':
+            self._position += 1
+            return
+        while True:
+            yield self.decode()
+            if self.next_delimiter(']'):
+                return
+
+    def _read(self):
+        """Read more characters from the file into the buffer."""
+        buffer = self._buffer[self._position:]
+        chunk = self._file.read(max(self._chunk_size, len(buffer)))
+        if not chunk:
+            self._eof = True
+        self._buffer = buffer + chunk
+        self._position = 0
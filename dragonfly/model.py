@@ -4,6 +4,7 @@ from __future__ import division
 
 import os
 import io
+import math
 import re
 import json
 import datetime
@@ -17,7 +18,7 @@ except ImportError:  # wea re in cPython
     import pickle
 
 from ladybug_geometry.geometry2d import Point2D, LineSegment2D, Polyline2D, Polygon2D
-from ladybug_geometry.geometry3d import Vector3D, Point3D, Plane, Face3D, Polyface3D
+from ladybug_geometry.geometry3d import Vector3D, Point3D, Plane, Face3D
 from ladybug.futil import preparedir, unzip_file
 from ladybug.location import Location
 
@@ -35,11 +36,16 @@ from honeybee.model import Model as HBModel
 from ._base import _BaseGeometry
 from .properties import ModelProperties
 from .building import Building
+from .story import Story
 from .roof import RoofSpecification
 from .context import ContextShade
+from .jsonstream import iter_json_object
+from .dfbin import is_dfbin, read_dfbin, write_dfbin
 from .windowparameter import SimpleWindowRatio
-from .projection import meters_to_long_lat_factors, polygon_to_lon_lat, \
-    origin_long_lat_from_location, lon_lat_to_polygon
+from .parallel import parallel_map, parallel_imap, worker_count
+from .spatialindex import RectangleGrid
+from .projection import meters_to_long_lat_factors, origin_long_lat_from_location, \
+    flatten_rings, coordinates_to_lon_lat, lon_lat_to_coordinates
 from dragonfly.config import folders as df_folders
 import dragonfly.writer.model as writer
 
@@ -104,7 +110,8 @@ class Model(_BaseGeometry):
         * user_data
     """
     __slots__ = ('_buildings', '_context_shades',
-                 '_units', '_tolerance', '_angle_tolerance', '_reference_vector')
+                 '_units', '_tolerance', '_angle_tolerance', '_reference_vector',
+                 '_identifier_index')
     # dictionary mapping validation error codes to a corresponding check function
     ERROR_MAP = {
         '100001': 'check_duplicate_context_shade_identifiers',
@@ -126,12 +133,29 @@ class Model(_BaseGeometry):
         '101002': 'check_small_gaps_in_floor_plate',
         '101003': 'check_small_gaps_in_floor_plate'
     }
+    # headers of the reports of checks that are run for each Story of the Model
+    _STORY_CHECK_HEADERS = {
+        'check_no_room2d_overlaps':
+            'The following Buildings have overlaps in their Room2D geometry',
+        'check_roofs_above_rooms':
+            'The following Buildings have roof geometries located below '
+            'their assigned story',
+        'check_room2d_floor_heights_valid':
+            'The following Buildings have Stories with invalid floor elevations',
+        'check_missing_adjacencies':
+            'The following Stories have missing adjacencies in the Model',
+        'check_no_roof_overlaps':
+            'The following Buildings have overlaps in their roof geometry',
+        'check_small_gaps_in_floor_plate':
+            'The following Buildings have small gaps or holes'
+    }
 
     def __init__(self, identifier, buildings=None, context_shades=None,
                  units='Meters', tolerance=None, angle_tolerance=1.0,
                  reference_vector=None):
         """A collection of Buildings and ContextShades for an entire model."""
         _BaseGeometry.__init__(self, identifier)  # process the identifier
+        self._identifier_index = {}  # dictionaries of objects set upon request
         self.units = units
         self.tolerance = tolerance
         self.angle_tolerance = angle_tolerance
@@ -159,15 +183,7 @@ class Model(_BaseGeometry):
             'Got {}.'.format(data['type'])
 
         # import the units and tolerance values
-        units = 'Meters' if 'units' not in data or data['units'] is None \
-            else data['units']
-        tol = UNITS_TOLERANCES[units] if 'tolerance' not in data or \
-            data['tolerance'] is None else data['tolerance']
-        angle_tol = 1.0 if 'angle_tolerance' not in data or \
-            data['angle_tolerance'] is None else data['angle_tolerance']
-        ref_vec = None if 'reference_vector' not in data or \
-            data['reference_vector'] is None else \
-            Vector3D.from_array(data['reference_vector'])
+        units, tol, angle_tol, ref_vec = cls._header_from_dict(data)
 
         # clean the irrational objects out if requested
         if cleanup_irrational:
@@ -179,26 +195,10 @@ class Model(_BaseGeometry):
         if 'buildings' in data and data['buildings'] is not None:
             buildings = []
             for bldg in data['buildings']:
-                try:
-                    unique_stories = bldg['unique_stories'] \
-                        if 'unique_stories' in bldg else None
-                    room_3ds = bldg['room_3ds'] \
-                        if 'room_3ds' in bldg else None
-                    if (unique_stories is None or len(unique_stories) == 0) and \
-                            (room_3ds is None or len(room_3ds) == 0):
-                        continue  # empty Building object that should be ignored
-                    if 'roof' in bldg and bldg['roof'] is not None \
-                            and 'geometry' in bldg['roof'] \
-                            and len(bldg['roof']['geometry']) > 0:
-                        roof = RoofSpecification.from_dict(bldg['roof'], tol)
-                        building_roofs.append(roof.geometry)
-                        bldg['roof'] = None
-                    else:
-                        building_roofs.append([])
-                    bldg = Building.from_dict(bldg, tol, angle_tol, sort_stories=False)
+                bldg, roof_geo = cls._building_from_dict(bldg, tol, angle_tol)
+                if bldg is not None:
                     buildings.append(bldg)
-                except Exception as e:
-                    invalid_dict_error(bldg, e)
+                    building_roofs.append(roof_geo)
         context_shades = None  # import context shades
         if 'context_shades' in data and data['context_shades'] is not None:
             context_shades = []
@@ -211,31 +211,18 @@ class Model(_BaseGeometry):
         # build the model object
         model = Model(data['identifier'], buildings, context_shades,
                       units, tol, angle_tol, ref_vec)
-        if 'display_name' in data and data['display_name'] is not None:
-            model.display_name = data['display_name']
-        if 'user_data' in data and data['user_data'] is not None:
-            model.user_data = data['user_data']
-
-        # assign extension properties to the model
-        model.properties.apply_properties_from_dict(data)
-
-        # sort stories now that properties were ordered correctly during assignment
-        for building, bldg_roof in zip(model.buildings, building_roofs):
-            building.sort_stories()
-            if len(bldg_roof) != 0:
-                building.add_roof_geometry(bldg_roof, tol)
-        return model
+        return cls._finish_from_dict(model, data, building_roofs)
 
     @classmethod
     def from_file(cls, df_file, cleanup_irrational=False):
-        """Initialize a Model from a DFJSON or DFpkl file, auto-sensing the type.
+        """Initialize a Model from a DFJSON, DFbin or DFpkl file, auto-sensing the type.
 
         This will also sense if the input is a Honeybee Model and, if so,
         the loaded Dragonfly model will be derived from the Honeybee one.
 
         Args:
-            df_file: Path to either a DFJSON or DFpkl file. This can also be a
-                HBJSON or a HBpkl from which a Dragonfly model should be derived.
+            df_file: Path to either a DFJSON, DFbin or DFpkl file. This can also be
+                a HBJSON or a HBpkl from which a Dragonfly model should be derived.
             cleanup_irrational: Boolean to note whether common types of irrational
                 objects should be cleaned or removed from the dictionary before
                 serializing the model to Python. Typical cases that are removed
@@ -246,6 +233,8 @@ class Model(_BaseGeometry):
         # sense the file type by first checking it it's a zip file
         if zipfile.is_zipfile(df_file):
             return cls.from_pomf(df_file, cleanup_irrational)
+        if is_dfbin(df_file):
+            return cls.from_dfbin(df_file, cleanup_irrational=cleanup_irrational)
         # check the first character to avoid maxing memory with JSON
         with io.open(df_file, encoding='utf-8') as inf:
             first_char = inf.read(1)
@@ -257,7 +246,7 @@ class Model(_BaseGeometry):
         return cls.from_dfpkl(df_file, cleanup_irrational)
 
     @classmethod
-    def from_dfjson(cls, dfjson_file, cleanup_irrational=False):
+    def from_dfjson(cls, dfjson_file, cleanup_irrational=False, stream=False):
         """Initialize a Model from a DFJSON file.
 
         Args:
@@ -268,11 +257,22 @@ class Model(_BaseGeometry):
                 serializing the model to Python. Typical cases that are removed
                 this way include Face3Ds with fewer than 3 vertices, Stories that
                 have no Room2D geometry, etc. (Default: False).
+            stream: Boolean to note whether the buildings and context_shades of
+                the DFJSON should be read from the file one at a time, such that
+                each one is converted to a Python object and its dictionary is
+                discarded before the next one is read. This greatly reduces the
+                peak memory needed to load large models since the whole DFJSON
+                dictionary is never held in memory at once. Only the extension
+                properties of each object are retained until the end in order to
+                apply the model-level properties. (Default: False).
         """
         assert os.path.isfile(dfjson_file), 'Failed to find %s' % dfjson_file
         with io.open(dfjson_file, encoding='utf-8') as inf:
             inf.read(1)
             second_char = inf.read(1)
+        if stream:
+            return cls._from_dfjson_stream(
+                dfjson_file, second_char == '{', cleanup_irrational)
         with io.open(dfjson_file, encoding='utf-8') as inf:
             if second_char == '{':
                 inf.read(1)
@@ -305,6 +305,58 @@ class Model(_BaseGeometry):
             hb_model = HBModel.from_dict(data, cleanup_irrational)
             return cls.from_honeybee(hb_model)
 
+    @classmethod
+    def from_dfbin(cls, dfbin_file, building_identifiers=None,
+                   cleanup_irrational=False):
+        """Initialize a Model from a DFbin file.
+
+        Args:
+            dfbin_file: Path to a DFbin file, which can be written with the
+                Model.to_dfbin method.
+            building_identifiers: An optional list of Building identifiers to be
+                loaded from the file. When specified, only these Buildings are
+                read from the file and the resulting Model will have no
+                ContextShades. If None, all objects will be loaded. (Default: None).
+            cleanup_irrational: Boolean to note whether common types of irrational
+                objects should be cleaned or removed from the dictionary before
+                serializing the model to Python. Typical cases that are removed
+                this way include Face3Ds with fewer than 3 vertices, Stories that
+                have no Room2D geometry, etc. (Default: False).
+        """
+        assert os.path.isfile(dfbin_file), 'Failed to find %s' % dfbin_file
+        data, bldg_dicts, shd_dicts = read_dfbin(dfbin_file, building_identifiers)
+        units, tol, angle_tol, ref_vec = cls._header_from_dict(data)
+        # load the buildings one at a time as they are decoded from the file
+        data['buildings'], buildings, building_roofs = [], [], []
+        for bldg_dict in bldg_dicts:
+            if cleanup_irrational:
+                clean_dict = {'buildings': [bldg_dict]}
+                clean_dict.update((k, v) for k, v in data.items() if k != 'buildings')
+                cls.clean_irrational_geometry(clean_dict)
+                if len(clean_dict['buildings']) == 0:
+                    continue
+            data['buildings'].append(cls._extension_skeleton(bldg_dict))
+            bldg, roof_geo = cls._building_from_dict(bldg_dict, tol, angle_tol)
+            if bldg is not None:
+                buildings.append(bldg)
+                building_roofs.append(roof_geo)
+        # load the context shades
+        if cleanup_irrational:
+            clean_dict = {'context_shades': shd_dicts}
+            cls.clean_irrational_geometry(clean_dict)
+            shd_dicts = clean_dict['context_shades']
+        data['context_shades'], context_shades = [], []
+        for shd_dict in shd_dicts:
+            data['context_shades'].append(cls._extension_skeleton(shd_dict))
+            try:
+                context_shades.append(ContextShade.from_dict(shd_dict))
+            except Exception as e:
+                invalid_dict_error(shd_dict, e)
+
+        model = Model(data['identifier'], buildings, context_shades,
+                      units, tol, angle_tol, ref_vec)
+        return cls._finish_from_dict(model, data, building_roofs)
+
     @classmethod
     def from_pomf(cls, pomf_file, cleanup_irrational=False):
         """Initialize a Model from a Pollination Model File (POMF).
@@ -370,7 +422,8 @@ class Model(_BaseGeometry):
     @classmethod
     def from_geojson(cls, geojson_file_path, location=None, point=Point2D(0, 0),
                      all_polygons_to_buildings=False, existing_to_context=False,
-                     units='Meters', tolerance=None, angle_tolerance=1.0):
+                     units='Meters', tolerance=None, angle_tolerance=1.0,
+                     stream=False, workers=None, batch_size=500):
         """Make a Model from a geojson file.
 
         Args:
@@ -414,6 +467,18 @@ class Model(_BaseGeometry):
                 are allowed to differ from one another in order to consider them
                 colinear. Zero indicates that no angle tolerance checks should
                 be performed. (Default: 1.0).
+            stream: Boolean to note whether the features of the geoJSON should be
+                read from the file one at a time instead of loading the whole
+                FeatureCollection into memory at once. When no location is input,
+                the file is read twice in this case, once to get the origin
+                and once to create the objects. (Default: False).
+            workers: An optional integer for the number of processes to be used
+                to create the Buildings and ContextShades in parallel. If None,
+                everything will be created in a single process. Set to 0 to use
+                all available CPUs. (Default: None).
+            batch_size: An integer for the number of geoJSON features that are
+                converted to dragonfly objects at once (and sent to each process
+                when workers is not None). (Default: 500).
 
         Returns:
             A tuple with the two items below.
@@ -424,26 +489,18 @@ class Model(_BaseGeometry):
                 longitude information and can be used to re-serialize the model
                 back to geoJSON.
         """
-        # parse the geoJSON into a dictionary
-        with open(geojson_file_path, 'r') as fp:
-            data = json.load(fp)
-
-        # Get the list of building data
-        if all_polygons_to_buildings:
-            p_types = ('Polygon', 'MultiPolygon')
-            bldgs_data = \
-                [bldg_data for bldg_data in data['features']
-                 if 'geometry' in bldg_data and bldg_data['geometry']['type'] in p_types]
-        else:
-            bldgs_data = []
-            for bldg_data in data['features']:
-                if 'type' in bldg_data['properties']:
-                    if bldg_data['properties']['type'] == 'Building':
-                        bldgs_data.append(bldg_data)
-
-        # Check if buildings exist
-        assert len(bldgs_data) > 0, 'No building footprints were found in {}.\n' \
-            'Try setting "all_polygons_to_buildings" to True.'.format(geojson_file_path)
+        no_bldg_msg = 'No building footprints were found in {}.\nTry setting ' \
+            '"all_polygons_to_buildings" to True.'.format(geojson_file_path)
+        if stream:  # read the features one at a time from the file
+            data = {}
+            bldgs_data = cls._iter_geojson_features(
+                geojson_file_path, data, all_polygons_to_buildings)
+        else:  # parse the geoJSON into a dictionary and get the building data
+            with open(geojson_file_path, 'r') as fp:
+                data = json.load(fp)
+            bldgs_data = list(cls._geojson_building_features(
+                data['features'], all_polygons_to_buildings))
+            assert len(bldgs_data) > 0, no_bldg_msg
 
         # if model units is not Meters, convert non-meter user inputs to meters
         scale_to_meters = conversion_factor_to_meters(units)
@@ -454,6 +511,13 @@ class Model(_BaseGeometry):
         # If location is None, derive coordinates from the geojson geometry.
         if location is None:
             point_lon_lat = None
+            if stream:  # read the whole file once to get the bottom-left corner
+                bl_pts = [cls._bottom_left_coordinate_from_geojson([bldg_data])
+                          for bldg_data in bldgs_data]
+                assert len(bl_pts) > 0, no_bldg_msg
+                point_lon_lat = min(pt[0] for pt in bl_pts), min(pt[1] for pt in bl_pts)
+                bldgs_data = cls._iter_geojson_features(
+                    geojson_file_path, {}, all_polygons_to_buildings)
             if 'project' in data:
                 proj_data = data['project']
                 if 'latitude' in proj_data and 'longitude' in proj_data:
@@ -468,10 +532,16 @@ class Model(_BaseGeometry):
         _convert_facs = meters_to_long_lat_factors(origin_lon_lat)
         convert_facs = 1 / _convert_facs[0], 1 / _convert_facs[1]
 
-        # Extract buildings
-        bldgs, contexts = cls._objects_from_geojson(
-            bldgs_data, existing_to_context, scale_to_meters, origin_lon_lat,
-            convert_facs)
+        # Extract buildings in batches, which are optionally run in parallel
+        batches = cls._geojson_batches(
+            bldgs_data, batch_size, existing_to_context, scale_to_meters,
+            origin_lon_lat, convert_facs)
+        bldgs, contexts = [], []
+        for b_bldgs, b_contexts in parallel_imap(
+                cls._objects_from_geojson_batch, batches, workers):
+            bldgs.extend(b_bldgs)
+            contexts.extend(b_contexts)
+        assert len(bldgs) + len(contexts) > 0, no_bldg_msg
 
         # Make model, in meters and then convert to user-defined units
         m_id, m_name = 'Model_1', None
@@ -551,6 +621,7 @@ class Model(_BaseGeometry):
 
     @buildings.setter
     def buildings(self, value):
+        self._identifier_index = {}
         self._buildings = []
         if value is not None:
             for bldg in value:
@@ -710,6 +781,7 @@ class Model(_BaseGeometry):
             else:
                 bldg_to_add.append(o_bldg)
         self._buildings = bldg_to_add
+        self._identifier_index = {}
         # add the ContextShades while checking for duplicate IDs
         if len(other_model._context_shades) != 0:
             new_context = self._context_shades
@@ -736,6 +808,7 @@ class Model(_BaseGeometry):
                 break
         else:
             self._buildings.append(obj)
+            self._identifier_index = {}
 
     def add_context_shade(self, obj):
         """Add a ContextShade object to the model."""
@@ -747,39 +820,33 @@ class Model(_BaseGeometry):
         """Get a list of Building objects in the model given Building identifiers."""
         buildings = []
         for identifier in identifiers:
-            for bldg in self._buildings:
-                if bldg.identifier == identifier:
-                    buildings.append(bldg)
-                    break
-            else:
+            bldg = self._object_by_identifier('Building', identifier)
+            if bldg is None:
                 raise ValueError(
                     'Building "{}" was not found in the model.'.format(identifier))
+            buildings.append(bldg)
         return buildings
 
     def stories_by_identifier(self, identifiers):
         """Get a list of Story objects in the model given Story identifiers."""
-        stories, model_stories = [], self.stories
+        stories = []
         for identifier in identifiers:
-            for story in model_stories:
-                if story.identifier == identifier:
-                    stories.append(story)
-                    break
-            else:
+            story = self._object_by_identifier('Story', identifier)
+            if story is None:
                 raise ValueError(
                     'Story "{}" was not found in the model.'.format(identifier))
+            stories.append(story)
         return stories
 
     def room_2ds_by_identifier(self, identifiers):
         """Get a list of Room2D objects in the model given Room2D identifiers."""
-        room_2ds, model_room_2ds = [], self.room_2ds
+        room_2ds = []
         for identifier in identifiers:
-            for room in model_room_2ds:
-                if room.identifier == identifier:
-                    room_2ds.append(room)
-                    break
-            else:
+            room = self._object_by_identifier('Room2D', identifier)
+            if room is None:
                 raise ValueError(
                     'Room2D "{}" was not found in the model.'.format(identifier))
+            room_2ds.append(room)
         return room_2ds
 
     def room_3ds_by_identifier(self, identifiers):
@@ -847,6 +914,7 @@ class Model(_BaseGeometry):
             else:
                 merged_buildings.append(o_bldg)
         self._buildings = merged_buildings
+        self._identifier_index = {}
         # loop through all Rooms and ensure their identifiers are unique
         rm_dict = {}
         for room_2d in self.room_2ds + self.room_3ds:
@@ -1181,7 +1249,7 @@ class Model(_BaseGeometry):
 
     def check_for_extension(
         self, extension_name='Generic', raise_exception=True, detailed=False,
-        include_warnings=False, gap_distance='0.4m'
+        include_warnings=False, gap_distance='0.4m', workers=None
     ):
         """Check that the Model is valid for a specific Dragonfly extension.
 
@@ -1234,6 +1302,11 @@ class Model(_BaseGeometry):
                 when include_warnings is set to True. This input can include the
                 units of the distance (eg. 1ft) or, if no units are provided, the
                 value will be interpreted in the dragonfly model units. (Default: 0.4m).
+            workers: An optional integer for the number of processes to be used
+                to run the dragonfly-core geometry checks in parallel when the
+                extension_name is Generic or All. If None or 1, all checks will
+                be run serially in the current process. Set to 0 to use all
+                available CPUs. (Default: None).
 
         Returns:
             A text string with all errors that were found or a list if detailed is True.
@@ -1245,7 +1318,7 @@ class Model(_BaseGeometry):
         if extension_name in ('all', 'generic'):
             all_ext_checks = extension_name == 'all'
             return self.check_all(raise_exception, detailed, all_ext_checks,
-                                  include_warnings, gap_distance)
+                                  include_warnings, gap_distance, workers)
         energy_extensions = ('energyplus', 'openstudio', 'designbuilder', 'trace700')
         if extension_name in energy_extensions:
             extension_name = 'energy'
@@ -1319,7 +1392,8 @@ class Model(_BaseGeometry):
         return check_func(raise_exception=raise_exception, detailed=detailed)
 
     def check_all(self, raise_exception=True, detailed=False,
-                  all_ext_checks=False, include_warnings=False, gap_distance='0.4m'):
+                  all_ext_checks=False, include_warnings=False, gap_distance='0.4m',
+                  workers=None):
         """Check all of the aspects of the Model for validation errors.
 
         Args:
@@ -1348,6 +1422,11 @@ class Model(_BaseGeometry):
                 when include_warnings is set to True. This input can include the
                 units of the distance (eg. 1ft) or, if no units are provided, the
                 value will be interpreted in the dragonfly model units. (Default: 0.4m).
+            workers: An optional integer for the number of processes to be used
+                to run the checks of the Room2Ds, Stories and Buildings in parallel.
+                If None or 1, all checks will be run serially in the current
+                process. Set to 0 to use all available CPUs. The result is the
+                same regardless of the number of processes. (Default: None).
 
         Returns:
             A text string with all errors that were found or a list if detailed is True.
@@ -1361,19 +1440,29 @@ class Model(_BaseGeometry):
         tol, a_tol = self.tolerance, self.angle_tolerance
         # perform checks for key dragonfly model schema rules
         msgs.append(self.check_all_duplicate_identifiers(False, detailed))
-        msgs.append(self.check_degenerate_room_2ds(tol, False, detailed))
-        msgs.append(self.check_self_intersecting_room_2ds(tol, False, detailed))
-        msgs.append(self.check_plenum_depths(tol, False, detailed))
-        msgs.append(self.check_window_parameters_valid(tol, False, detailed))
-        msgs.append(self.check_no_room2d_overlaps(tol, False, detailed))
-        msgs.append(self.check_collisions_between_stories(tol, False, detailed))
-        msgs.append(self.check_roofs_above_rooms(tol, False, detailed))
-        msgs.append(self.check_room2d_floor_heights_valid(False, detailed))
-        msgs.append(self.check_missing_adjacencies(False, detailed))
-        msgs.append(self.check_all_room3d(tol, a_tol, False, detailed))
-        if include_warnings:
-            wrn = self.check_small_gaps_in_floor_plate(gap_distance, tol, False, detailed)
-            msgs.append(wrn)
+        if worker_count(workers) > 1 and len(self._buildings) > 1:
+            gap_dist = parse_distance_string(str(gap_distance), self.units) \
+                if include_warnings else None
+            geo_msgs = self._check_buildings_parallel(tol, detailed, gap_dist, workers)
+            msgs.extend(geo_msgs[:-1])
+            msgs.append(self.check_all_room3d(tol, a_tol, False, detailed))
+            if include_warnings:
+                msgs.append(geo_msgs[-1])
+        else:
+            msgs.append(self.check_degenerate_room_2ds(tol, False, detailed))
+            msgs.append(self.check_self_intersecting_room_2ds(tol, False, detailed))
+            msgs.append(self.check_plenum_depths(tol, False, detailed))
+            msgs.append(self.check_window_parameters_valid(tol, False, detailed))
+            msgs.append(self.check_no_room2d_overlaps(tol, False, detailed))
+            msgs.append(self.check_collisions_between_stories(tol, False, detailed))
+            msgs.append(self.check_roofs_above_rooms(tol, False, detailed))
+            msgs.append(self.check_room2d_floor_heights_valid(False, detailed))
+            msgs.append(self.check_missing_adjacencies(False, detailed))
+            msgs.append(self.check_all_room3d(tol, a_tol, False, detailed))
+            if include_warnings:
+                wrn = self.check_small_gaps_in_floor_plate(
+                    gap_distance, tol, False, detailed)
+                msgs.append(wrn)
         # check the extension attributes
         ext_msgs = self._properties._check_all_extension_attr(detailed, all_ext_checks)
         if detailed:
@@ -1541,19 +1630,9 @@ class Model(_BaseGeometry):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
-        msgs = []
-        for room in self.room_2ds:
-            msg = room.check_degenerate(tolerance, False, detailed)
-            if detailed:
-                msgs.extend(msg)
-            elif msg != '':
-                msgs.append(msg)
-        if detailed:
-            return msgs
-        full_msg = '\n'.join(msgs)
-        if raise_exception and len(msgs) != 0:
-            raise ValueError(full_msg)
-        return full_msg
+        msgs = [room.check_degenerate(tolerance, False, detailed)
+                for room in self.room_2ds]
+        return self._join_check_msgs(msgs, raise_exception, detailed)
 
     def check_self_intersecting_room_2ds(self, tolerance=None, raise_exception=True,
                                          detailed=False):
@@ -1576,19 +1655,9 @@ class Model(_BaseGeometry):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
-        msgs = []
-        for room in self.room_2ds:
-            msg = room.check_self_intersecting(tolerance, False, detailed)
-            if detailed:
-                msgs.extend(msg)
-            elif msg != '':
-                msgs.append(msg)
-        if detailed:
-            return msgs
-        full_msg = '\n'.join(msgs)
-        if raise_exception and len(msgs) != 0:
-            raise ValueError(full_msg)
-        return full_msg
+        msgs = [room.check_self_intersecting(tolerance, False, detailed)
+                for room in self.room_2ds]
+        return self._join_check_msgs(msgs, raise_exception, detailed)
 
     def check_room2d_floor_heights_valid(self, raise_exception=True, detailed=False):
         """Check that all Room2Ds have floor elevations in range to be on the same Story.
@@ -1602,24 +1671,10 @@ class Model(_BaseGeometry):
         Returns:
             A string with the message or a list with a dictionary if detailed is True.
         """
-        bldg_ids = []
-        for bldg in self._buildings:
-            for story in bldg._unique_stories:
-                ov_msg = story.check_room2d_floor_heights_valid(False, detailed)
-                if ov_msg:
-                    if detailed:
-                        bldg_ids.extend(ov_msg)
-                    else:
-                        bldg_ids.append('{}\n {}'.format(bldg.full_id, ov_msg))
-        if detailed:
-            return bldg_ids
-        if bldg_ids != []:
-            msg = 'The following Buildings have Stories with invalid floor elevations' \
-                ':\n{}'.format('\n'.join(bldg_ids))
-            if raise_exception:
-                raise ValueError(msg)
-            return msg
-        return ''
+        msgs = [(bldg.full_id, story.check_room2d_floor_heights_valid(False, detailed))
+                for bldg in self._buildings for story in bldg._unique_stories]
+        header = self._STORY_CHECK_HEADERS['check_room2d_floor_heights_valid']
+        return self._story_check_report(msgs, header, raise_exception, detailed)
 
     def check_plenum_depths(self, tolerance=0.01, raise_exception=True, detailed=False):
         """Check that all Room2Ds have valid plenum depths.
@@ -1640,19 +1695,9 @@ class Model(_BaseGeometry):
             A string with the message or a list with a dictionary if detailed is True.
         """
         detailed = False if raise_exception else detailed
-        msgs = []
-        for room in self.room_2ds:
-            msg = room.check_plenum_depths(tolerance, False, detailed)
-            if detailed:
-                msgs.extend(msg)
-            elif msg != '':
-                msgs.append(msg)
-        if detailed:
-            return msgs
-        full_msg = '\n'.join(msgs)
-        if raise_exception and len(msgs) != 0:
-            raise ValueError(full_msg)
-        return full_msg
+        msgs = [room.check_plenum_depths(tolerance, False, detailed)
+                for room in self.room_2ds]
+        return self._join_check_msgs(msgs, raise_exception, detailed)
 
     def check_window_parameters_valid(
             self, tolerance=0.01, raise_exception=True, detailed=False):
@@ -1674,19 +1719,9 @@ class Model(_BaseGeometry):
             A string with the message or a list with a dictionary if detailed is True.
         """
         detailed = False if raise_exception else detailed
-        msgs = []
-        for room in self.room_2ds:
-            msg = room.check_window_parameters_valid(tolerance, False, detailed)
-            if detailed:
-                msgs.extend(msg)
-            elif msg != '':
-                msgs.append(msg)
-        if detailed:
-            return msgs
-        full_msg = '\n'.join(msgs)
-        if raise_exception and len(msgs) != 0:
-            raise ValueError(full_msg)
-        return full_msg
+        msgs = [room.check_window_parameters_valid(tolerance, False, detailed)
+                for room in self.room_2ds]
+        return self._join_check_msgs(msgs, raise_exception, detailed)
 
     def check_missing_adjacencies(self, raise_exception=True, detailed=False):
         """Check that all Room2Ds have adjacent objects that exist within each Story.
@@ -1700,24 +1735,22 @@ class Model(_BaseGeometry):
         Returns:
             A string with the message or a list with a dictionary if detailed is True.
         """
-        bldg_ids = []
-        for bldg in self._buildings:
-            for story in bldg._unique_stories:
-                adj_msg = story.check_missing_adjacencies(False, detailed)
-                if adj_msg:
-                    if detailed:
-                        bldg_ids.extend(adj_msg)
-                    else:
-                        bldg_ids.append('{}\n {}'.format(story.full_id, adj_msg))
-        if detailed:
-            return bldg_ids
-        if bldg_ids != []:
-            msg = 'The following Stories have missing adjacencies in ' \
-                'the Model:\n{}'.format('\n'.join(bldg_ids))
-            if raise_exception:
-                raise ValueError(msg)
-            return msg
-        return ''
+        # map the identifiers of all Room2Ds in the model in one pass
+        stories = [story for bldg in self._buildings for story in bldg._unique_stories]
+        room_map = {}
+        for story in stories:
+            for room in story._room_2ds:
+                try:
+                    room_map[room.identifier].append((story, room))
+                except KeyError:
+                    room_map[room.identifier] = [(story, room)]
+        # check the Surface boundary conditions of each Story against the map
+        msgs = []
+        for story in stories:
+            s_msgs = story._missing_adjacency_msgs(room_map, detailed)
+            msgs.append((story.full_id, s_msgs if detailed else '\n '.join(s_msgs)))
+        header = self._STORY_CHECK_HEADERS['check_missing_adjacencies']
+        return self._story_check_report(msgs, header, raise_exception, detailed)
 
     def check_no_room2d_overlaps(
             self, tolerance=None, raise_exception=True, detailed=False):
@@ -1739,24 +1772,11 @@ class Model(_BaseGeometry):
             A string with the message or a list with a dictionary if detailed is True.
         """
         tolerance = self.tolerance if tolerance is None else tolerance
-        bldg_ids = []
-        for bldg in self._buildings:
-            for story in bldg._unique_stories:
-                ov_msg = story.check_no_room2d_overlaps(tolerance, False, detailed)
-                if ov_msg:
-                    if detailed:
-                        bldg_ids.extend(ov_msg)
-                    else:
-                        bldg_ids.append('{}\n {}'.format(bldg.full_id, ov_msg))
-        if detailed:
-            return bldg_ids
-        if bldg_ids != []:
-            msg = 'The following Buildings have overlaps in their Room2D geometry' \
-                ':\n{}'.format('\n'.join(bldg_ids))
-            if raise_exception:
-                raise ValueError(msg)
-            return msg
-        return ''
+        msgs = [(bldg.full_id,
+                 story.check_no_room2d_overlaps(tolerance, False, detailed))
+                for bldg in self._buildings for story in bldg._unique_stories]
+        header = self._STORY_CHECK_HEADERS['check_no_room2d_overlaps']
+        return self._story_check_report(msgs, header, raise_exception, detailed)
 
     def check_collisions_between_stories(
             self, tolerance=None, raise_exception=True, detailed=False):
@@ -1775,22 +1795,9 @@ class Model(_BaseGeometry):
             A string with the message or a list with a dictionary if detailed is True.
         """
         tolerance = self.tolerance if tolerance is None else tolerance
-        bldg_msgs = []
-        for bldg in self._buildings:
-            ov_msg = bldg.check_collisions_between_stories(tolerance, False, detailed)
-            if ov_msg:
-                if detailed:
-                    bldg_msgs.extend(ov_msg)
-                else:
-                    bldg_msgs.append(ov_msg)
-        if detailed:
-            return bldg_msgs
-        if bldg_msgs != []:
-            msg = '\n'.join(bldg_msgs)
-            if raise_exception:
-                raise ValueError(msg)
-            return msg
-        return ''
+        msgs = [bldg.check_collisions_between_stories(tolerance, False, detailed)
+                for bldg in self._buildings]
+        return self._join_check_msgs(msgs, raise_exception, detailed)
 
     def check_roofs_above_rooms(
             self, tolerance=None, raise_exception=True, detailed=False):
@@ -1814,24 +1821,10 @@ class Model(_BaseGeometry):
             A string with the message or a list with a dictionary if detailed is True.
         """
         tolerance = self.tolerance if tolerance is None else tolerance
-        bldg_ids = []
-        for bldg in self._buildings:
-            for story in bldg._unique_stories:
-                ov_msg = story.check_roofs_above_rooms(tolerance, False, detailed)
-                if ov_msg:
-                    if detailed:
-                        bldg_ids.extend(ov_msg)
-                    else:
-                        bldg_ids.append('{}\n {}'.format(bldg.full_id, ov_msg))
-        if detailed:
-            return bldg_ids
-        if bldg_ids != []:
-            msg = 'The following Buildings have roof geometries located below ' \
-                'their assigned story:\n{}'.format('\n'.join(bldg_ids))
-            if raise_exception:
-                raise ValueError(msg)
-            return msg
-        return ''
+        msgs = [(bldg.full_id, story.check_roofs_above_rooms(tolerance, False, detailed))
+                for bldg in self._buildings for story in bldg._unique_stories]
+        header = self._STORY_CHECK_HEADERS['check_roofs_above_rooms']
+        return self._story_check_report(msgs, header, raise_exception, detailed)
 
     def check_no_roof_overlaps(
             self, tolerance=None, raise_exception=True, detailed=False):
@@ -1854,24 +1847,10 @@ class Model(_BaseGeometry):
             A string with the message or a list with a dictionary if detailed is True.
         """
         tolerance = self.tolerance if tolerance is None else tolerance
-        bldg_ids = []
-        for bldg in self._buildings:
-            for story in bldg._unique_stories:
-                ov_msg = story.check_no_roof_overlaps(tolerance, False, detailed)
-                if ov_msg:
-                    if detailed:
-                        bldg_ids.extend(ov_msg)
-                    else:
-                        bldg_ids.append('{}\n {}'.format(bldg.full_id, ov_msg))
-        if detailed:
-            return bldg_ids
-        if bldg_ids != []:
-            msg = 'The following Buildings have overlaps in their roof geometry' \
-                ':\n{}'.format('\n'.join(bldg_ids))
-            if raise_exception:
-                raise ValueError(msg)
-            return msg
-        return ''
+        msgs = [(bldg.full_id, story.check_no_roof_overlaps(tolerance, False, detailed))
+                for bldg in self._buildings for story in bldg._unique_stories]
+        header = self._STORY_CHECK_HEADERS['check_no_roof_overlaps']
+        return self._story_check_report(msgs, header, raise_exception, detailed)
 
     def check_all_room3d(
             self, tolerance=None, angle_tolerance=None,
@@ -1938,27 +1917,11 @@ class Model(_BaseGeometry):
         gap_distance = parse_distance_string(str(gap_distance), self.units)
 
         # run the check to find small gaps and holes
-        bldg_ids = []
-        for bldg in self._buildings:
-            for story in bldg._unique_stories:
-                ov_msg = story.check_small_gaps_in_floor_plate(
-                    gap_distance, tolerance, False, detailed
-                )
-                if ov_msg:
-                    if detailed:
-                        bldg_ids.extend(ov_msg)
-                    else:
-                        bldg_ids.append('{}\n {}'.format(bldg.full_id, ov_msg))
-
-        if detailed:
-            return bldg_ids
-        if bldg_ids != []:
-            msg = 'The following Buildings have small gaps or holes' \
-                ':\n{}'.format('\n'.join(bldg_ids))
-            if raise_exception:
-                raise ValueError(msg)
-            return msg
-        return ''
+        msgs = [(bldg.full_id, story.check_small_gaps_in_floor_plate(
+                 gap_distance, tolerance, False, detailed))
+                for bldg in self._buildings for story in bldg._unique_stories]
+        header = self._STORY_CHECK_HEADERS['check_small_gaps_in_floor_plate']
+        return self._story_check_report(msgs, header, raise_exception, detailed)
 
     def to_honeybee(
         self, object_per_model='Building', shade_distance=None,
@@ -1966,7 +1929,8 @@ class Model(_BaseGeometry):
         solve_ceiling_adjacencies=False, merge_method=None,
         tolerance=None, enforce_adj=True, enforce_solid=True,
         face_rename_format='{parent.display_name} - {gbxml_type} - {cardinal_direction}',
-        subface_rename_format='{parent.display_name} - {gbxml_type} - {cardinal_direction}'
+        subface_rename_format='{parent.display_name} - {gbxml_type} - {cardinal_direction}',
+        workers=None, executor=None
     ):
         """Convert Dragonfly Model to an array of Honeybee Models.
 
@@ -2064,10 +2028,154 @@ class Model(_BaseGeometry):
                 return string outputs can also be passed here as long as these
                 functions defaults specified for all arguments. If None, the names
                 of sub-faces will match the identifiers.
+            workers: An optional integer for the number of processes to be used
+                to translate the Buildings (or the Stories when object_per_model
+                is Story) in parallel. If None or 1, everything will be translated
+                serially in the current process. Set to 0 to use all available
+                CPUs. The resulting Honeybee Models are the same regardless of
+                the number of workers. (Default: None).
+            executor: An optional concurrent.futures Executor to be used to translate
+                the Buildings (or Stories) in parallel (eg. a pool that is shared
+                across several operations). When specified, the workers input is
+                ignored and the executor is not shut down after translation.
+                (Default: None).
 
         Returns:
             An array of Honeybee Models that together represent this Dragonfly Model.
         """
+        return list(self.iter_honeybee(
+            object_per_model, shade_distance, use_multiplier, exclude_plenums, cap,
+            solve_ceiling_adjacencies, merge_method, tolerance, enforce_adj,
+            enforce_solid, face_rename_format, subface_rename_format,
+            workers, executor))
+
+    def iter_honeybee(
+        self, object_per_model='Building', shade_distance=None,
+        use_multiplier=True, exclude_plenums=False, cap=False,
+        solve_ceiling_adjacencies=False, merge_method=None,
+        tolerance=None, enforce_adj=True, enforce_solid=True,
+        face_rename_format='{parent.display_name} - {gbxml_type} - {cardinal_direction}',
+        subface_rename_format='{parent.display_name} - {gbxml_type} - {cardinal_direction}',
+        workers=None, executor=None
+    ):
+        """Get an iterator that converts this Model to Honeybee Models one at a time.
+
+        This yields the same Models as the to_honeybee method but each Honeybee
+        Model is only created when it is requested from the iterator. So each
+        Model can be written to a file and released before the next one is
+        created, keeping the memory bounded by the largest Building (or Story)
+        rather than the whole Dragonfly Model.
+
+        Args:
+            object_per_model: Text to describe how the input Buildings should be
+                divided across the output Models. (Default: 'Building'). Choose from
+                the following options:
+
+                * District - All buildings will be added to a single Honeybee Model.
+                  Such a Model can take a long time to simulate so this is only
+                  recommended for small numbers of buildings or cases where
+                  exchange of data between Buildings is necessary.
+                * Building - Each building will be exported into its own Model.
+                  For each Model, the other buildings input to this component will
+                  appear as context shade geometry.
+                * Story - Each Story of each Building will be exported into its
+                  own Model. For each Honeybee Model, the other input Buildings
+                  will appear as context shade geometry as will all of the other
+                  stories of the same building.
+
+            shade_distance: An optional number to note the distance beyond which other
+                objects' shade should not be exported into a given Model. This is
+                helpful for reducing the simulation run time of each Model when other
+                connected buildings are too far away to have a meaningful impact on
+                the results. If None, all other buildings will be included as context
+                shade in each and every Model. Set to 0 to exclude all neighboring
+                buildings from the resulting models. (Default: None).
+            use_multiplier: If True, the multipliers on this Model's Stories will be
+                passed along to the generated Honeybee Room objects, indicating the
+                simulation will be run once for each unique room and then results
+                will be multiplied. If False, full geometry objects will be written
+                for each and every floor in the building that are represented through
+                multipliers and all resulting multipliers will be 1. (Default: True).
+            exclude_plenums: Boolean to indicate whether ceiling/floor plenum depths
+                assigned to Room2Ds should be ignored during translation. This
+                results in each Room2D translating to a single Honeybee Room at
+                the full floor_to_ceiling_height instead of a base Room with (a)
+                plenum Room(s). (Default: False).
+            cap: Boolean to note whether building shade representations should be capped
+                with a top face. Usually, this is not necessary to account for
+                blocked sun and is only needed when it's important to account for
+                reflected sun off of roofs. (Default: False).
+            solve_ceiling_adjacencies: Boolean to note whether adjacencies should be
+                solved between interior stories when Room2D floor and ceiling
+                geometries are coplanar. This ensures that Surface boundary
+                conditions are used instead of Adiabatic ones. Note that this input
+                has no effect when the object_per_model is Story. (Default: False).
+            merge_method: An optional text string to describe how the Room2Ds should
+                be merged into individual Rooms during the translation. Specifying a
+                value here can be an effective way to reduce the number of Room
+                volumes in the resulting 3D Honeybee Model and, ultimately, yield
+                a faster simulation time in the destination engine with fewer results
+                to manage. Note that Room2Ds will only be merged if they form a
+                continuous volume. Otherwise, there will be multiple Rooms per
+                zone or story, each with an integer added at the end of their
+                identifiers. Choose from the following options:
+
+                * None - No merging of Room2Ds will occur
+                * Zones - Room2Ds in the same zone will be merged
+                * PlenumZones - Only plenums in the same zone will be merged
+                * Stories - Rooms in the same story will be merged
+                * PlenumStories - Only plenums in the same story will be merged
+
+            tolerance: The minimum distance in z values of floor_height and
+                floor_to_ceiling_height at which adjacent Faces will be split.
+                This is also used in the generation of Windows. This must be a
+                positive, non-zero number. If None, the Model's own tolerance
+                will be used. (Default: None).
+            enforce_adj: Boolean to note whether an exception should be raised if
+                an adjacency between two Room2Ds is invalid (True) or if the invalid
+                Surface boundary condition should be replaced with an Outdoor
+                boundary condition (False). If False, any Walls containing
+                WindowParameters and an illegal boundary condition will also
+                be replaced with an Outdoor boundary condition. (Default: True).
+            enforce_solid: Boolean to note whether rooms should be translated
+                as solid extrusions whenever translating them with custom
+                roof geometry produces a non-solid result (True) or the non-solid
+                room geometry should be allowed to remain in the result (False).
+                The latter is useful for understanding why a particular roof
+                geometry has produced a non-solid result. (Default: True).
+            face_rename_format: An optional text string for the pattern with which
+                faces will be renamed. Any property on the honeybee Face class may be
+                used (eg. gbxml_str) and each property should be put in curly brackets.
+                Nested properties can be specified by using "." to denote nesting levels
+                (eg. properties.energy.construction.display_name). Functions that
+                return string outputs can also be passed here as long as these
+                functions defaults specified for all arguments. If None, the names
+                of sub-faces will match the identifiers.
+            subface_rename_format: An optional text string for the pattern with which
+                apertures and doors will be renamed. Any property that exists on both
+                the honeybee Aperture and honeybee Door class may be used (eg. gbxml_str)
+                and each property should be put in curly brackets. Nested
+                properties can be specified by using "." to denote nesting levels
+                (eg. properties.energy.construction.display_name). Functions that
+                return string outputs can also be passed here as long as these
+                functions defaults specified for all arguments. If None, the names
+                of sub-faces will match the identifiers.
+            workers: An optional integer for the number of processes to be used
+                to translate the Buildings (or the Stories when object_per_model
+                is Story) in parallel. If None or 1, everything will be translated
+                serially in the current process. Set to 0 to use all available
+                CPUs. The resulting Honeybee Models are the same regardless of
+                the number of workers. (Default: None).
+            executor: An optional concurrent.futures Executor to be used to translate
+                the Buildings (or Stories) in parallel (eg. a pool that is shared
+                across several operations). When specified, the workers input is
+                ignored and the executor is not shut down after translation.
+                (Default: None).
+
+        Returns:
+            An iterator of Honeybee Models that together represent this
+            Dragonfly Model.
+        """
         # check the tolerance, which is required to convert to honeybee
         tolerance = self.tolerance if tolerance is None else tolerance
         assert tolerance != 0, \
@@ -2091,19 +2199,22 @@ class Model(_BaseGeometry):
             h_model.display_name = self.display_name
             models = [h_model]
         elif object_per_model is None or opm == 'Building':
-            models = Building.buildings_to_honeybee(
+            models = Building.iter_buildings_to_honeybee(
                 self._buildings, self._context_shades, shade_distance,
                 use_multiplier, exclude_plenums, cap, tolerance=tolerance,
-                enforce_adj=enforce_adj, enforce_solid=enforce_solid)
+                enforce_adj=enforce_adj, enforce_solid=enforce_solid,
+                workers=workers, executor=executor)
         elif opm == 'Story':
-            models = Building.stories_to_honeybee(
+            models = Building.iter_stories_to_honeybee(
                 self._buildings, self._context_shades, shade_distance,
                 use_multiplier, exclude_plenums, cap, tolerance=tolerance,
-                enforce_adj=enforce_adj, enforce_solid=enforce_solid)
+                enforce_adj=enforce_adj, enforce_solid=enforce_solid,
+                workers=workers, executor=executor)
         elif opm == 'District':
             models = [Building.district_to_honeybee(
                 self._buildings, use_multiplier, exclude_plenums, tolerance=tolerance,
-                enforce_adj=enforce_adj, enforce_solid=enforce_solid)]
+                enforce_adj=enforce_adj, enforce_solid=enforce_solid,
+                workers=workers, executor=executor)]
             for shd_group in self._context_shades:
                 for shd in shd_group.to_honeybee():
                     for model in models:
@@ -2115,7 +2226,8 @@ class Model(_BaseGeometry):
             raise ValueError('Unrecognized object_per_model input: '
                              '{}'.format(object_per_model))
 
-        # solve ceiling adjacencies if requested
+        # get the types of ceiling adjacencies to solve if requested
+        has_flr_ceil = None
         if solve_ceiling_adjacencies and len(self.buildings) != 0 and \
                 opm in ('Building', 'District'):
             story_rel_types = {}
@@ -2136,24 +2248,23 @@ class Model(_BaseGeometry):
                     if story.multiplier == 1:
                         rel_types.append(RoofCeiling)
                     story_rel_types[story.display_name] = tuple(rel_types)
-            for model, flr_ceil in zip(models, has_flr_ceil):
-                self._solve_ceil_adj(model.rooms, story_rel_types, flr_ceil,
+
+        for m_count, model in enumerate(models):
+            # solve ceiling adjacencies if requested
+            if has_flr_ceil is not None and m_count < len(has_flr_ceil):
+                self._solve_ceil_adj(model.rooms, story_rel_types, has_flr_ceil[m_count],
                                      tolerance, self.angle_tolerance)
 
-        # transfer tolerance, units system and Model extension attributes
-        for model in models:
+            # transfer tolerance, units system and Model extension attributes
             model.units = self.units
             model.tolerance = tolerance
             model.angle_tolerance = self.angle_tolerance
             model._properties = self.properties.to_honeybee(model)
 
-        # merge rooms in the models together if there is a merge_map
-        if merge_map is not None:
-            for model in models:
+            # merge rooms in the model together if there is a merge_map
+            if merge_map is not None:
                 self._apply_merge_map(model, merge_map, tolerance)
 
-        # ensure all sub-face IDs are unique and rename them to be human-readable
-        for model in models:
             # set all window/door identifiers to be unique
             existing_dict = {}
             for room in model._rooms:
@@ -2171,7 +2282,8 @@ class Model(_BaseGeometry):
             if subface_rename_format:
                 model.rename_apertures_by_attribute(subface_rename_format)
                 model.rename_doors_by_attribute(subface_rename_format)
-        return models
+            yield model
+            model = None  # release the model before the next one is translated
 
     def to_geojson_dict(self, location, point=Point2D(0, 0), tolerance=None):
         """Convert Dragonfly Model to a geoJSON-style Python dictionary.
@@ -2223,31 +2335,19 @@ class Model(_BaseGeometry):
         convert_facs = meters_to_long_lat_factors(origin_lon_lat)
         tolerance = self.tolerance if tolerance is None else tolerance
 
+        # convert the first footprint of all buildings to (longitude, latitude) at once
+        footprints = [bldg.footprint(tolerance)[0] for bldg in model.buildings]
+        all_coords = self._face3ds_to_geojson_coordinates(
+            footprints, origin_lon_lat, convert_facs)
+
         # export each building as a feature in the file
-        for bldg in model.buildings:
+        for bldg, bldg_coords in zip(model.buildings, all_coords):
             # create the base dictionary
             feature_dict = {'geometry': {}, 'properties': {}, 'type': 'Feature'}
 
             # add the geometry including coordinates
-            footprint = bldg.footprint(tolerance)
-            if len(footprint) == 1:
-                feature_dict['geometry']['type'] = 'Polygon'
-                feature_dict['geometry']['coordinates'] = \
-                    self._face3d_to_geojson_coordinates(
-                        footprint[0], origin_lon_lat, convert_facs)
-            else:
-                # TODO: uncomment once URBANopt supports MultiPolygon
-                # feature_dict['geometry']['type'] = 'MultiPolygon'
-                # all_coords = []
-                # for floor in footprint:
-                #     coord = self._face3d_to_geojson_coordinates(
-                #         floor, origin_lon_lat, convert_facs)
-                #     all_coords.append(coord)
-                # feature_dict['geometry']['coordinates'] = all_coords
-                feature_dict['geometry']['type'] = 'Polygon'
-                feature_dict['geometry']['coordinates'] = \
-                    self._face3d_to_geojson_coordinates(
-                        footprint[0], origin_lon_lat, convert_facs)
+            feature_dict['geometry']['type'] = 'Polygon'
+            feature_dict['geometry']['coordinates'] = bldg_coords
 
             # add several of the properties to the geoJSON
             feature_dict['properties']['building_type'] = 'Mixed use'
@@ -2411,6 +2511,37 @@ class Model(_BaseGeometry):
             pickle.dump(df_dict, fp)
         return df_file
 
+    def to_dfbin(self, name=None, folder=None, included_prop=None):
+        """Write Dragonfly model to a compact binary file (DFbin).
+
+        The floor vertices and heights of all Room2Ds are written as contiguous
+        arrays of floats with a separate block for each Building, such that
+        large models load faster than from DFJSON and single Buildings can be
+        loaded without reading the rest of the file using Model.from_dfbin.
+
+        Args:
+            name: A text string for the name of the DFbin file. If None, the model
+                identifier wil be used. (Default: None).
+            folder: A text string for the directory where the DFbin will be written.
+                If unspecified, the default simulation folder will be used. This
+                is usually at "C:\\Users\\USERNAME\\simulation."
+            included_prop: List of properties to filter keys that must be included in
+                output dictionary. For example ['energy'] will include 'energy' key if
+                available in properties to_dict. By default all the keys will be
+                included. To exclude all the keys from extensions use an empty list.
+        """
+        # create dictionary from the Dragonfly Model
+        df_dict = self.to_dict(included_prop=included_prop)
+        # set up a name and folder for the DFbin
+        if name is None:
+            name = self.identifier
+        file_name = name if name.lower().endswith('.dfbin') \
+            else '{}.dfbin'.format(name)
+        folder = folder if folder is not None else folders.default_simulation_folder
+        df_file = os.path.join(folder, file_name)
+        # write the Model dictionary into a file
+        return write_dfbin(df_dict, df_file)
+
     @property
     def to(self):
         """Model writer object.
@@ -2421,7 +2552,7 @@ class Model(_BaseGeometry):
 
     @staticmethod
     def validate(model, check_function='check_for_extension', check_args=None,
-                 json_output=False):
+                 json_output=False, workers=None):
         """Get a string of a validation report given a specific check_function.
 
         Args:
@@ -2438,6 +2569,12 @@ class Model(_BaseGeometry):
                 will be used. (Default: None).
             json_output: Boolean to note whether the output validation report
                 should be formatted as a JSON object instead of plain text.
+            workers: An optional integer for the number of processes to be used
+                to run the checks in parallel. This is only used when the
+                check_function accepts a workers argument (eg. check_all or
+                check_for_extension). If None, the checks will be run serially
+                in the current process. Set to 0 to use all available
+                CPUs. (Default: None).
         """
         # process the input model if it's not already serialized
         report = ''
@@ -2471,6 +2608,8 @@ class Model(_BaseGeometry):
             # process the arguments and options
             args = [] if check_args is None else [] + list(check_args)
             kwargs = {'raise_exception': False}
+            if workers is not None:
+                kwargs['workers'] = workers
 
         # create the report
         if not json_output:  # create a plain text report
@@ -2813,6 +2952,195 @@ class Model(_BaseGeometry):
                 if len(c_dict['geometry']) == 0:  # the entire ContextShade is irrational
                     model_dict['context_shades'].pop(ci)
 
+    def _object_by_identifier(self, object_type, identifier):
+        """Get a Building, Story or Room2D in the Model using a dictionary of identifiers.
+
+        The dictionary for the object type is only rebuilt when the identifier is
+        not found in it or the object that is found is no longer in the Model
+        with the identifier (eg. because it was renamed or removed from its Story).
+
+        Args:
+            object_type: Text for the type of object to get. Choose from Building,
+                Story and Room2D.
+            identifier: Text for the identifier of the object.
+
+        Returns:
+            The first object in the Model with the identifier. None if the Model
+            has no object of the type with the identifier.
+        """
+        index = self._identifier_index.get(object_type)
+        if index is not None:
+            obj = index.get(identifier)
+            if obj is not None and self._object_in_model(obj, identifier):
+                return obj
+        objects = self._buildings if object_type == 'Building' else \
+            self.stories if object_type == 'Story' else self.room_2ds
+        index = {}
+        for obj in objects:
+            if obj._identifier not in index:
+                index[obj._identifier] = obj
+        self._identifier_index[object_type] = index
+        return index.get(identifier)
+
+    def _object_in_model(self, obj, identifier):
+        """Check that an object from the dictionaries of identifiers is in the Model."""
+        if obj._identifier != identifier:
+            return False
+        if isinstance(obj, Building):  # the dictionary is reset with the buildings
+            return True
+        parent = obj._parent
+        if parent is None:
+            return False
+        if isinstance(obj, Story):
+            return parent._story_index().get(identifier) is obj and \
+                self._object_by_identifier('Building', parent._identifier) is parent
+        return parent._room_2d_index().get(identifier) is obj and \
+            self._object_in_model(parent, parent._identifier)
+
+    def _check_buildings_parallel(self, tolerance, detailed, gap_distance, workers):
+        """Run the geometry checks of check_all for each Building in parallel processes.
+
+        Args:
+            tolerance: The tolerance to be used for the checks.
+            detailed: Boolean for whether the messages should be detailed lists.
+            gap_distance: A number for the gap_distance of the check for small gaps
+                in the floor plates. If None, this check will not be run.
+            workers: An integer for the number of processes to be used.
+
+        Returns:
+            A list with the report of each check in the order that they are
+            run in check_all (excluding duplicate identifiers and 3D Rooms). The
+            last item is the report of the check for small gaps in floor plates,
+            which is empty if the gap_distance is None.
+        """
+        # run the checks for each Building, which returns results of each Story
+        args = [(bldg, tolerance, detailed, gap_distance) for bldg in self._buildings]
+        results = parallel_map(Model._check_building, args, workers)
+        # merge the results of the Buildings in the order of the Model
+        room_msgs = [[], [], [], []]
+        story_msgs = [[], [], [], [], []]
+        coll_msgs = []
+        for bldg, (b_room_msgs, b_story_msgs, b_coll_msg) in \
+                zip(self._buildings, results):
+            for all_msgs, msgs in zip(room_msgs, b_room_msgs):
+                all_msgs.extend(msgs)
+            for story, st_msgs in zip(bldg._unique_stories, b_story_msgs):
+                for i, msg in enumerate(st_msgs):
+                    full_id = story.full_id if i == 3 else bldg.full_id
+                    story_msgs[i].append((full_id, msg))
+            coll_msgs.append(b_coll_msg)
+        # format the messages in the same manner as the Model check methods
+        headers = self._STORY_CHECK_HEADERS
+        story_checks = (
+            'check_no_room2d_overlaps', 'check_roofs_above_rooms',
+            'check_room2d_floor_heights_valid', 'check_missing_adjacencies',
+            'check_small_gaps_in_floor_plate'
+        )
+        st_reports = [
+            self._story_check_report(msgs, headers[check], False, detailed)
+            for msgs, check in zip(story_msgs, story_checks)]
+        reports = [self._join_check_msgs(msgs, False, detailed) for msgs in room_msgs]
+        reports.append(st_reports[0])
+        reports.append(self._join_check_msgs(coll_msgs, False, detailed))
+        reports.extend(st_reports[1:])
+        return reports
+
+    @staticmethod
+    def _check_building(args):
+        """Run the check_all geometry checks for a Building from a tuple of arguments.
+
+        This is used to check Buildings in parallel processes.
+
+        Returns:
+            A tuple with three items.
+
+            -   room_msgs: A list with four lists for the degenerate,
+                self-intersecting, plenum depth and window parameter checks.
+                Each list has the result of the check for each Room2D.
+
+            -   story_msgs: A list with a tuple for each unique Story of the
+                Building. Each tuple has the results of the Room2D overlap,
+                roofs above rooms, floor heights, missing adjacency and small
+                gap checks for the Story.
+
+            -   coll_msg: The result of the check for collisions between Stories.
+        """
+        bldg, tol, detailed, gap_dist = args
+        room_msgs = [[], [], [], []]
+        for room in bldg.unique_room_2ds:
+            room_msgs[0].append(room.check_degenerate(tol, False, detailed))
+            room_msgs[1].append(room.check_self_intersecting(tol, False, detailed))
+            room_msgs[2].append(room.check_plenum_depths(tol, False, detailed))
+            room_msgs[3].append(room.check_window_parameters_valid(tol, False, detailed))
+        story_msgs = []
+        for story in bldg._unique_stories:
+            gap_msg = '' if gap_dist is None else \
+                story.check_small_gaps_in_floor_plate(gap_dist, tol, False, detailed)
+            story_msgs.append((
+                story.check_no_room2d_overlaps(tol, False, detailed),
+                story.check_roofs_above_rooms(tol, False, detailed),
+                story.check_room2d_floor_heights_valid(False, detailed),
+                story.check_missing_adjacencies(False, detailed),
+                gap_msg
+            ))
+        coll_msg = bldg.check_collisions_between_stories(tol, False, detailed)
+        return room_msgs, story_msgs, coll_msg
+
+    @staticmethod
+    def _join_check_msgs(msgs, raise_exception=True, detailed=False):
+        """Join the results of a check that was run for several objects into a report.
+
+        Args:
+            msgs: A list with the result of the check for each object, which is
+                either a string or a list of dictionaries when detailed is True.
+            raise_exception: Boolean to note whether a ValueError should be raised
+                if any errors were found.
+            detailed: Boolean for whether the msgs are detailed lists of dicts.
+        """
+        errors = []
+        for msg in msgs:
+            if detailed:
+                errors.extend(msg)
+            elif msg:
+                errors.append(msg)
+        if detailed:
+            return errors
+        full_msg = '\n'.join(errors)
+        if raise_exception and len(errors) != 0:
+            raise ValueError(full_msg)
+        return full_msg
+
+    @staticmethod
+    def _story_check_report(msgs, header, raise_exception=True, detailed=False):
+        """Get a report from the results of a check that was run for each Story.
+
+        Args:
+            msgs: A list of tuples with two items for each Story. The first is
+                the full_id of the object to which the result is reported (either
+                the Building or the Story) and the second is the result of
+                the check for the Story.
+            header: Text for the header of the report, which precedes the
+                full_id and message of each Story with errors.
+            raise_exception: Boolean to note whether a ValueError should be raised
+                if any errors were found.
+            detailed: Boolean for whether the msgs are detailed lists of dicts.
+        """
+        obj_msgs = []
+        for full_id, msg in msgs:
+            if msg:
+                if detailed:
+                    obj_msgs.extend(msg)
+                else:
+                    obj_msgs.append('{}\n {}'.format(full_id, msg))
+        if detailed:
+            return obj_msgs
+        if obj_msgs != []:
+            msg = '{}:\n{}'.format(header, '\n'.join(obj_msgs))
+            if raise_exception:
+                raise ValueError(msg)
+            return msg
+        return ''
+
     def _extract_merge_map(
         self, merge_method=None, exclude_plenums=False, tolerance=None
     ):
@@ -2922,20 +3250,17 @@ class Model(_BaseGeometry):
                 merged_id = merged_rooms[0].identifier
                 for rm in room_group:
                     final_merge_map[rm.identifier] = merged_id
-            else:
+            else:  # map each face ID to the first merged room that contains it
+                face_homes = {}
+                for m_i, merge_rm in enumerate(merged_rooms):
+                    for new_face in merge_rm.faces:
+                        face_homes.setdefault(new_face.identifier, m_i)
                 for rm in room_group:
-                    room_mapped = False
-                    for merge_rm in merged_rooms:
-                        if room_mapped:
-                            break
-                        for old_face in rm.faces:
-                            if room_mapped:
-                                break
-                            for new_face in merge_rm.faces:
-                                if old_face.identifier == new_face.identifier:
-                                    final_merge_map[rm.identifier] = merge_rm.identifier
-                                    room_mapped = True
-                                    break
+                    homes = [face_homes[f.identifier] for f in rm.faces
+                             if f.identifier in face_homes]
+                    if len(homes) != 0:
+                        merged_id = merged_rooms[min(homes)].identifier
+                        final_merge_map[rm.identifier] = merged_id
         model.rooms = new_rooms
 
         # update any Surface boundary conditions with the new room IDs
@@ -2944,30 +3269,107 @@ class Model(_BaseGeometry):
                 face_bc = face.boundary_condition
                 if isinstance(face_bc, Surface):
                     bc_face, bc_room = face_bc.boundary_condition_objects
-                    try:
-                        new_bc_room = final_merge_map[bc_room]
-                        face.boundary_condition = Surface((bc_face, new_bc_room))
-                        for sf in face.sub_faces:
-                            sf_bc = sf.boundary_condition
-                            bc_sf, bc_face, bc_room = sf_bc.boundary_condition_objects
-                            new_bc_objs = (bc_sf, bc_face, new_bc_room)
-                            sf.boundary_condition = Surface(new_bc_objs, sub_face=True)
-                    except KeyError:  # not adjacent to a merged room
-                        insert_count += 1
+                    if bc_room not in final_merge_map:
+                        continue  # not adjacent to a merged room
+                    new_bc_room = final_merge_map[bc_room]
+                    face.boundary_condition = Surface((bc_face, new_bc_room))
+                    for sf in face.sub_faces:
+                        sf_bc = sf.boundary_condition
+                        bc_sf, bc_face, bc_room = sf_bc.boundary_condition_objects
+                        new_bc_objs = (bc_sf, bc_face, new_bc_room)
+                        sf.boundary_condition = Surface(new_bc_objs, sub_face=True)
+
+    @staticmethod
+    def _overlapping_room_geometries(room_geos, tolerance):
+        """Get the indices of the Room geometries that overlap each Room geometry.
+
+        Args:
+            room_geos: A list of Polyface3D for the geometry of each Room.
+            tolerance: The minimum distance between objects that is considered meaningful.
+
+        Returns:
+            A list with a sorted list of integers for each Room geometry. The integers
+            are the indices of all other Room geometries with bounding boxes that
+            overlap within twice the tolerance, which is conservative for Room
+            geometries that are intersected with one another.
+        """
+        pad = 2 * tolerance
+        grid = RectangleGrid.from_polygons(room_geos)
+        neighbors = []
+        for i, geo in enumerate(room_geos):
+            z_min, z_max = geo.min.z, geo.max.z
+            neighbors.append([
+                j for j in grid.query_polygon(geo, pad) if j != i and
+                room_geos[j].min.z - z_max <= pad and z_min - room_geos[j].max.z <= pad
+            ])
+        return neighbors
+
+    @staticmethod
+    def _centered_face_rooms(rooms, tolerance):
+        """Get the Rooms with Faces that could be centered adjacent to each Room.
+
+        Faces with a Surface boundary condition are excluded since they already
+        have an adjacency. All other Face centers are indexed in a grid of cubes
+        with twice the tolerance as their dimension such that Faces with centers
+        that are equivalent within the tolerance are always in neighboring cubes.
+
+        Args:
+            rooms: A list of Honeybee Rooms.
+            tolerance: The minimum distance between objects that is considered meaningful.
+
+        Returns:
+            A list with a sorted list of integers for each Room. The integers are the
+            indices of all Rooms after it in the input list that have a Face with a
+            center in a cube next to the center of a Face of the Room.
+        """
+        cell_size, cells, room_cells = 2 * tolerance, {}, []
+        for i, room in enumerate(rooms):
+            r_cells = set()
+            for face in room._faces:
+                if isinstance(face.boundary_condition, Surface):
+                    continue
+                cent = face.geometry.center
+                r_cells.add((int(math.floor(cent.x / cell_size)),
+                             int(math.floor(cent.y / cell_size)),
+                             int(math.floor(cent.z / cell_size))))
+            for cell in r_cells:
+                try:
+                    cells[cell].append(i)
+                except KeyError:
+                    cells[cell] = [i]
+            room_cells.append(r_cells)
+        candidates = []
+        offsets = (-1, 0, 1)
+        for i, r_cells in enumerate(room_cells):
+            rms = set()
+            for x, y, z in r_cells:
+                for dx in offsets:
+                    for dy in offsets:
+                        for dz in offsets:
+                            try:
+                                rms.update(cells[(x + dx, y + dy, z + dz)])
+                            except KeyError:
+                                pass
+            candidates.append(sorted(j for j in rms if j > i))
+        return candidates
 
     @staticmethod
     def _solve_ceil_adj(rooms, story_rel_types, has_floor_ceil,
                         tolerance=0.01, angle_tolerance=1):
         """Solve Floor/Ceiling adjacencies between a list of rooms."""
         # intersect the Rooms with one another for matching adjacencies
-        HBRoom.intersect_adjacency(rooms, tolerance, angle_tolerance)
-        # solve all adjacencies between rooms
+        room_geos = [r.geometry for r in rooms]
+        room_neighbors = Model._overlapping_room_geometries(room_geos, tolerance)
+        for room, neighbors in zip(rooms, room_neighbors):
+            room.coplanar_split([room_geos[j] for j in neighbors],
+                                tolerance, angle_tolerance)
+            room.remove_duplicate_faces(tolerance)
+        # solve all adjacencies between rooms with faces that share a center
+        room_candidates = Model._centered_face_rooms(rooms, tolerance)
         for i, (room_1, fc_1) in enumerate(zip(rooms, has_floor_ceil)):
             try:
-                for room_2, fc_2 in zip(rooms[i + 1:], has_floor_ceil[i + 1:]):
-                    if not Polyface3D.overlapping_bounding_boxes(
-                            room_1.geometry, room_2.geometry, tolerance):
-                        continue  # no overlap in bounding box; adjacency impossible
+                for j in room_candidates[i]:
+                    room_2, fc_2 = rooms[j], has_floor_ceil[j]
                     for face_1 in room_1._faces:
                         if isinstance(face_1.boundary_condition, Surface):
                             continue  # face is not the right type for ceiling adj
@@ -3021,7 +3423,7 @@ class Model(_BaseGeometry):
 
     @staticmethod
     def _objects_from_geojson(bldgs_data, existing_to_context, scale_to_meters,
-                              origin_lon_lat, convert_facs):
+                              origin_lon_lat, convert_facs, start_index=0):
         """Get Dragonfly Building and ContextShade objects from a geoJSON dictionary.
 
         Args:
@@ -3034,23 +3436,28 @@ class Model(_BaseGeometry):
             origin_lon_lat: An array of two numbers in degrees for origin lat and lon.
             convert_facs: A tuple with two values used to translate between
             meters and longitude, latitude.
+            start_index: An integer for the index of the first geoJSON object in
+                the whole geoJSON file, which is used to generate identifiers for
+                objects without an id. (Default: 0).
         """
-        bldgs, contexts = [], []
-        for i, bldg_data in enumerate(bldgs_data):
-            # get footprints
-            footprint = []
+        # convert the polygons of all footprints to Face3D at once
+        polygons, poly_offsets = [], [0]
+        for bldg_data in bldgs_data:
             geojson_coordinates = bldg_data['geometry']['coordinates']
-            prop = bldg_data['properties']
-
             if bldg_data['geometry']['type'] == 'Polygon':
-                face3d = Model._geojson_coordinates_to_face3d(
-                    geojson_coordinates, origin_lon_lat, convert_facs)
-                footprint.append(face3d)
+                polygons.append(geojson_coordinates)
             else:  # if MultiPolygon, account for multiple polygons
-                for _geojson_coordinates in geojson_coordinates:
-                    face3d = Model._geojson_coordinates_to_face3d(
-                        _geojson_coordinates, origin_lon_lat, convert_facs)
-                    footprint.append(face3d)
+                polygons.extend(geojson_coordinates)
+            poly_offsets.append(len(polygons))
+        face3ds = Model._geojson_coordinates_to_face3ds(
+            polygons, origin_lon_lat, convert_facs)
+
+        bldgs, contexts = [], []
+        for j, bldg_data in enumerate(bldgs_data):
+            # get footprints
+            i = start_index + j
+            footprint = face3ds[poly_offsets[j]:poly_offsets[j + 1]]
+            prop = bldg_data['properties']
 
             # determine whether the footprint should be context or a building
             if existing_to_context and 'building_status' in prop \
@@ -3090,19 +3497,90 @@ class Model(_BaseGeometry):
             bldgs.append(bldg)
         return bldgs, contexts
 
+    @staticmethod
+    def _objects_from_geojson_batch(batch):
+        """Get Buildings and ContextShades from a batch made by _geojson_batches.
+
+        This is a separate function such that it can be run in parallel processes.
+        """
+        return Model._objects_from_geojson(*batch)
+
+    @staticmethod
+    def _geojson_batches(bldgs_data, batch_size, existing_to_context,
+                         scale_to_meters, origin_lon_lat, convert_facs):
+        """Iterate over the arguments of _objects_from_geojson for batches of features.
+
+        The geoJSON features are only consumed as each batch is requested such
+        that an iterator of features is never loaded into memory all at once.
+        """
+        batch, start_index = [], 0
+        for bldg_data in bldgs_data:
+            batch.append(bldg_data)
+            if len(batch) == batch_size:
+                yield (batch, existing_to_context, scale_to_meters,
+                       origin_lon_lat, convert_facs, start_index)
+                batch, start_index = [], start_index + batch_size
+        if len(batch) != 0:
+            yield (batch, existing_to_context, scale_to_meters,
+                   origin_lon_lat, convert_facs, start_index)
+
+    @staticmethod
+    def _geojson_building_features(features, all_polygons_to_buildings=False):
+        """Iterate over the geoJSON features that should be imported as buildings."""
+        p_types = ('Polygon', 'MultiPolygon')
+        for bldg_data in features:
+            if all_polygons_to_buildings:
+                if 'geometry' in bldg_data and bldg_data['geometry']['type'] in p_types:
+                    yield bldg_data
+            elif 'type' in bldg_data['properties'] and \
+                    bldg_data['properties']['type'] == 'Building':
+                yield bldg_data
+
+    @staticmethod
+    def _iter_geojson_features(geojson_file_path, data,
+                               all_polygons_to_buildings=False):
+        """Iterate over the building features of a geoJSON file while it is read.
+
+        Args:
+            geojson_file_path: Text for the full path to the geojson file.
+            data: A dictionary to which all keys of the geoJSON other than the
+                features will be added as they are read.
+            all_polygons_to_buildings: Boolean to indicate if all geometries in
+                the geojson file should be considered buildings.
+        """
+        with io.open(geojson_file_path, encoding='utf-8') as inf:
+            for key, value in iter_json_object(inf, ('features',)):
+                if key != 'features' or value is None:
+                    data[key] = value
+                    continue
+                for bldg_data in Model._geojson_building_features(
+                        value, all_polygons_to_buildings):
+                    yield bldg_data
+
     @staticmethod
     def _face3d_to_geojson_coordinates(face3d, origin_lon_lat, convert_facs):
         """Convert a horizontal Face3D to geoJSON coordinates."""
-        coords = [polygon_to_lon_lat(
-            [(pt.x, pt.y) for pt in face3d.boundary], origin_lon_lat, convert_facs)]
-        coords[0].append(coords[0][0])
-        if face3d.has_holes:
-            for hole in face3d.holes:
-                hole_verts = polygon_to_lon_lat(
-                    [(pt.x, pt.y) for pt in hole], origin_lon_lat, convert_facs)
-                hole_verts.append(hole_verts[0])
-                coords.append(hole_verts)
-        return coords
+        return Model._face3ds_to_geojson_coordinates(
+            [face3d], origin_lon_lat, convert_facs)[0]
+
+    @staticmethod
+    def _face3ds_to_geojson_coordinates(face3ds, origin_lon_lat, convert_facs):
+        """Convert a list of horizontal Face3Ds to geoJSON coordinates.
+
+        The vertices of all Face3Ds are converted to (longitude, latitude) at once,
+        which is much faster than converting each Face3D separately.
+        """
+        rings, ring_offsets = [], [0]
+        for face3d in face3ds:
+            rings.append([(pt.x, pt.y) for pt in face3d.boundary])
+            if face3d.has_holes:
+                rings.extend([(pt.x, pt.y) for pt in hole] for hole in face3d.holes)
+            ring_offsets.append(len(rings))
+        coords, ring_pts = flatten_rings(rings)
+        rings = coordinates_to_lon_lat(coords, ring_pts, origin_lon_lat, convert_facs)
+        for ring in rings:
+            ring.append(ring[0])
+        return [rings[st:end] for st, end in zip(ring_offsets[:-1], ring_offsets[1:])]
 
     @staticmethod
     def _geojson_coordinates_to_face3d(geojson_coordinates, origin_lon_lat,
@@ -3123,20 +3601,210 @@ class Model(_BaseGeometry):
             A Face3D object in model space coordinates converted from the geojson
             coordinates. The height of the Face3D vertices will be 0.
         """
-        holes = None
-        coords = lon_lat_to_polygon(geojson_coordinates[0], origin_lon_lat, convert_facs)
-        coords = [Point3D(pt2d[0], pt2d[1], 0) for pt2d in coords][:-1]
+        return Model._geojson_coordinates_to_face3ds(
+            [geojson_coordinates], origin_lon_lat, convert_facs)[0]
+
+    @staticmethod
+    def _geojson_coordinates_to_face3ds(polygons, origin_lon_lat, convert_facs):
+        """Convert a list of geoJSON polygon coordinates to horizontal Face3Ds.
 
-        # If there are more then 1 polygons, then the other polygons are holes.
-        if len(geojson_coordinates) > 1:
-            holes = []
-            for hole_geojson_coordinates in geojson_coordinates[1:]:
-                hole_coords = lon_lat_to_polygon(
-                    hole_geojson_coordinates, origin_lon_lat, convert_facs)
-                hole_coords = [Point3D(pt2d[0], pt2d[1], 0) for pt2d in hole_coords][:-1]
-                holes.append(hole_coords)
+        The vertices of all polygons are converted from (longitude, latitude) at
+        once, which is much faster than converting each polygon separately.
 
-        return Face3D(coords, plane=Plane(n=Vector3D(0, 0, 1)), holes=holes)
+        Args:
+            polygons: A list of coordinates from the geojson file, each of which
+                is a list of rings with the first ring being the boundary and
+                any subsequent rings being holes.
+            origin_lon_lat: An array of two numbers in degrees representing the
+                longitude and latitude of the scene origin in degrees.
+            convert_facs: A tuple with two values used to translate between
+                longitude, latitude and meters.
+
+        Returns:
+            A list of Face3D objects in model space coordinates converted from
+            the geojson coordinates. The height of the Face3D vertices will be 0.
+        """
+        coords, ring_offsets = flatten_rings(ring for poly in polygons for ring in poly)
+        rings = lon_lat_to_coordinates(coords, ring_offsets, origin_lon_lat, convert_facs)
+        face3ds, plane, r_i = [], Plane(n=Vector3D(0, 0, 1)), 0
+        for poly in polygons:
+            # the first ring is the boundary and any others are holes
+            face_rings = [[Point3D(pt2d[0], pt2d[1], 0) for pt2d in ring][:-1]
+                          for ring in rings[r_i:r_i + len(poly)]]
+            holes = face_rings[1:] if len(face_rings) > 1 else None
+            face3ds.append(Face3D(face_rings[0], plane=plane, holes=holes))
+            r_i += len(poly)
+        return face3ds
+
+    @classmethod
+    def _from_dfjson_stream(cls, dfjson_file, skip_first_char=False,
+                            cleanup_irrational=False):
+        """Initialize a Model by reading the objects of a DFJSON file one at a time.
+
+        Args:
+            dfjson_file: Path to DFJSON file. This can also be a HBJSON from which
+                a Dragonfly model should be derived.
+            skip_first_char: Boolean to note whether the first character of the
+                file should be skipped (eg. because it is a byte order mark).
+            cleanup_irrational: Boolean to note whether irrational objects should
+                be removed from each dictionary before serializing it to Python.
+        """
+        data, buildings, building_roofs, context_shades = {}, None, [], None
+        header_loaded = False
+        with io.open(dfjson_file, encoding='utf-8') as inf:
+            if skip_first_char:
+                inf.read(1)
+            for key, value in iter_json_object(inf, ('buildings', 'context_shades')):
+                if key not in ('buildings', 'context_shades') or value is None:
+                    data[key] = value
+                    continue
+                if not header_loaded:  # get the tolerance needed to load geometry
+                    cls._load_dfjson_header(data, dfjson_file, skip_first_char)
+                    units, tol, angle_tol, _ = cls._header_from_dict(data)
+                    header_loaded = True
+                if key == 'buildings':
+                    data['buildings'], buildings = [], []
+                    for bldg_dict in value:
+                        if cleanup_irrational:
+                            clean_dict = {'buildings': [bldg_dict]}
+                            clean_dict.update((k, v) for k, v in data.items()
+                                              if k != 'buildings')
+                            cls.clean_irrational_geometry(clean_dict)
+                            if len(clean_dict['buildings']) == 0:
+                                continue
+                        data['buildings'].append(cls._extension_skeleton(bldg_dict))
+                        bldg, roof_geo = \
+                            cls._building_from_dict(bldg_dict, tol, angle_tol)
+                        if bldg is not None:
+                            buildings.append(bldg)
+                            building_roofs.append(roof_geo)
+                else:
+                    data['context_shades'], context_shades = [], []
+                    for shd_dict in value:
+                        if cleanup_irrational:
+                            clean_dict = {'context_shades': [shd_dict]}
+                            cls.clean_irrational_geometry(clean_dict)
+                            if len(clean_dict['context_shades']) == 0:
+                                continue
+                        data['context_shades'].append(
+                            cls._extension_skeleton(shd_dict))
+                        try:
+                            context_shades.append(ContextShade.from_dict(shd_dict))
+                        except Exception as e:
+                            invalid_dict_error(shd_dict, e)
+
+        if 'buildings' not in data and 'context_shades' not in data:
+            # assume that it's a Honeybee Model to translate
+            hb_model = HBModel.from_dict(data, cleanup_irrational)
+            return cls.from_honeybee(hb_model)
+        assert data['type'] == 'Model', 'Expected Model dictionary. ' \
+            'Got {}.'.format(data['type'])
+        units, tol, angle_tol, ref_vec = cls._header_from_dict(data)
+        model = Model(data['identifier'], buildings, context_shades,
+                      units, tol, angle_tol, ref_vec)
+        return cls._finish_from_dict(model, data, building_roofs)
+
+    @staticmethod
+    def _load_dfjson_header(data, dfjson_file, skip_first_char=False):
+        """Add the units and tolerances of a DFJSON file to a partially-loaded dict.
+
+        Model.to_dict writes these keys after the buildings. So the file is read
+        a second time (skipping over the buildings) whenever they have not yet
+        been found when the first building is reached.
+        """
+        header_keys = ('units', 'tolerance', 'angle_tolerance', 'reference_vector',
+                       'identifier')
+        if all(key in data for key in header_keys[:3]):
+            return
+        with io.open(dfjson_file, encoding='utf-8') as inf:
+            if skip_first_char:
+                inf.read(1)
+            for key, value in iter_json_object(inf, ('buildings', 'context_shades')):
+                if key in header_keys:
+                    data[key] = value
+
+    @staticmethod
+    def _header_from_dict(data):
+        """Get the units, tolerance, angle tolerance and reference vector of a dict."""
+        units = 'Meters' if 'units' not in data or data['units'] is None \
+            else data['units']
+        tol = UNITS_TOLERANCES[units] if 'tolerance' not in data or \
+            data['tolerance'] is None else data['tolerance']
+        angle_tol = 1.0 if 'angle_tolerance' not in data or \
+            data['angle_tolerance'] is None else data['angle_tolerance']
+        ref_vec = None if 'reference_vector' not in data or \
+            data['reference_vector'] is None else \
+            Vector3D.from_array(data['reference_vector'])
+        return units, tol, angle_tol, ref_vec
+
+    @staticmethod
+    def _building_from_dict(data, tolerance, angle_tolerance):
+        """Get a Building and its roof geometry from a Building dictionary.
+
+        None will be returned for the Building if the dictionary has no geometry.
+        """
+        try:
+            unique_stories = data['unique_stories'] \
+                if 'unique_stories' in data else None
+            room_3ds = data['room_3ds'] if 'room_3ds' in data else None
+            if (unique_stories is None or len(unique_stories) == 0) and \
+                    (room_3ds is None or len(room_3ds) == 0):
+                return None, []  # empty Building object that should be ignored
+            roof_geo = []
+            if 'roof' in data and data['roof'] is not None \
+                    and 'geometry' in data['roof'] \
+                    and len(data['roof']['geometry']) > 0:
+                roof = RoofSpecification.from_dict(data['roof'], tolerance)
+                roof_geo = roof.geometry
+                data['roof'] = None
+            bldg = Building.from_dict(
+                data, tolerance, angle_tolerance, sort_stories=False)
+            return bldg, roof_geo
+        except Exception as e:
+            invalid_dict_error(data, e)
+
+    @staticmethod
+    def _finish_from_dict(model, data, building_roofs):
+        """Assign the attributes and extension properties of a dict to a new Model.
+
+        Args:
+            model: A Model that has been created from the dictionary geometry.
+            data: The Model dictionary. The buildings and context_shades of this
+                dictionary only need to contain the extension properties.
+            building_roofs: A list of roof geometry for each Building of the Model.
+        """
+        if 'display_name' in data and data['display_name'] is not None:
+            model.display_name = data['display_name']
+        if 'user_data' in data and data['user_data'] is not None:
+            model.user_data = data['user_data']
+
+        # assign extension properties to the model
+        model.properties.apply_properties_from_dict(data)
+
+        # sort stories now that properties were ordered correctly during assignment
+        for building, bldg_roof in zip(model.buildings, building_roofs):
+            building.sort_stories()
+            if len(bldg_roof) != 0:
+                building.add_roof_geometry(bldg_roof, model.tolerance)
+        return model
+
+    @staticmethod
+    def _extension_skeleton(data):
+        """Get a copy of an object dictionary with only its extension properties.
+
+        The copy includes all nested Stories, Room2Ds and 3D Rooms (along with
+        their Faces, Apertures, Doors and Shades), such that the extension
+        dictionaries are collected in the same order as for the full dictionary.
+        """
+        skeleton = {'type': data['type']}
+        for key in ('identifier', 'properties'):
+            if key in data:
+                skeleton[key] = data[key]
+        for key in ('unique_stories', 'room_2ds', 'room_3ds', 'faces', 'apertures',
+                    'doors', 'outdoor_shades', 'indoor_shades'):
+            if key in data and data[key] is not None:
+                skeleton[key] = [Model._extension_skeleton(d) for d in data[key]]
+        return skeleton
 
     @staticmethod
     def _bottom_left_coordinate_from_geojson(bldgs_data):
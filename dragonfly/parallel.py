@@ -0,0 +1,126 @@
+# coding: utf-8
+"""Utilities for distributing dragonfly computations across several processes."""
+from __future__ import division
+
+import os
+from collections import deque
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # Python 2 or IronPython; everything will run serially
+    ProcessPoolExecutor = None
+
+
+def worker_count(workers=None):
+    """Get an integer for the number of processes to be used from a workers input.
+
+    Args:
+        workers: An optional integer for the number of processes to use. If None
+            or 1, all computation will be done serially in the current process.
+            If 0 or a negative number, the number of processes will be equal to
+            the number of CPUs available on the machine. (Default: None).
+
+    Returns:
+        An integer for the number of processes, which is 1 when everything
+        should run serially.
+    """
+    if workers is None:
+        return 1
+    workers = int(workers)
+    if workers <= 0:
+        try:
+            workers = len(os.sched_getaffinity(0))
+        except AttributeError:  # not available on all platforms
+            workers = os.cpu_count() if hasattr(os, 'cpu_count') else 1
+    return max(workers or 1, 1)
+
+
+def parallel_map(function, arguments, workers=None, executor=None, chunksize=1):
+    """Apply a function to each item in a list of arguments, optionally in parallel.
+
+    The results are always returned in the same order as the input arguments,
+    such that the output matches that of a serial map regardless of how many
+    processes are used.
+
+    Args:
+        function: A function that takes a single argument. When running in
+            parallel processes, this function and its arguments must be
+            picklable (eg. a module-level function or a static method).
+        arguments: A list of arguments to be passed to the function.
+        workers: An optional integer for the number of processes to use. If None
+            or 1, the function will be run serially in the current process.
+            If 0 or a negative number, all available CPUs will be used. This
+            input is ignored when an executor is specified. (Default: None).
+        executor: An optional concurrent.futures Executor (or any object with
+            an equivalent map method) to be used to evaluate the function.
+            This is useful for sharing a single process pool across several
+            operations or for using a custom pool. (Default: None).
+        chunksize: An integer for the number of arguments to be sent to each
+            process at once when a process pool is created here. (Default: 1).
+
+    Returns:
+        A list of the function results in the same order as the arguments.
+    """
+    arguments = list(arguments)
+    if executor is not None:
+        return list(executor.map(function, arguments))
+    workers = min(worker_count(workers), len(arguments))
+    if workers <= 1 or ProcessPoolExecutor is None:
+        return [function(arg) for arg in arguments]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(function, arguments, chunksize=chunksize))
+
+
+def parallel_imap(function, arguments, workers=None, executor=None, buffer_size=None):
+    """Lazily apply a function to each item in an iterable, optionally in parallel.
+
+    Unlike parallel_map, the arguments are only consumed as the results are
+    requested and only a limited number of results are held in memory at once.
+    This makes it suitable for large translations where each result should be
+    written to a file and released before the next one is computed. The results
+    are always yielded in the same order as the input arguments.
+
+    Args:
+        function: A function that takes a single argument. When running in
+            parallel processes, this function and its arguments must be
+            picklable (eg. a module-level function or a static method).
+        arguments: An iterable of arguments to be passed to the function.
+        workers: An optional integer for the number of processes to use. If None
+            or 1, the function will be run serially in the current process.
+            If 0 or a negative number, all available CPUs will be used. This
+            input is ignored when an executor is specified. (Default: None).
+        executor: An optional concurrent.futures Executor (or any object with
+            an equivalent submit method) to be used to evaluate the function.
+            (Default: None).
+        buffer_size: An optional integer for the maximum number of arguments that
+            are submitted to the processes ahead of the result being yielded.
+            If None, it will be twice the number of workers. (Default: None).
+
+    Returns:
+        An iterator over the function results in the same order as the arguments.
+    """
+    if executor is not None:
+        buffer_size = buffer_size or 2 * worker_count(0)
+        for result in _submit_buffered(executor, function, arguments, buffer_size):
+            yield result
+        return
+    workers = worker_count(workers)
+    if workers <= 1 or ProcessPoolExecutor is None:
+        for arg in arguments:
+            yield function(arg)
+        return
+    buffer_size = buffer_size or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in _submit_buffered(pool, function, arguments, buffer_size):
+            yield result
+
+
+def _submit_buffered(executor, function, arguments, buffer_size):
+    """Yield the results of an executor in order with a limited number pending."""
+    pending = deque()
+    for arg in arguments:
+        pending.append(executor.submit(function, arg))
+        if len(pending) >= buffer_size:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -2,6 +2,10 @@
 from __future__ import division
 
 import math
+try:  # use numpy to convert many coordinates at once when it is available
+    import numpy
+except ImportError:  # numpy is not available (eg. IronPython)
+    numpy = None
 
 
 def meters_to_long_lat_factors(origin_lon_lat=(0, 0)):
@@ -113,6 +117,119 @@ def lon_lat_to_polygon(polygon_lon_lat_coords, origin_lon_lat=(0, 0),
             for pt in polygon_lon_lat_coords]
 
 
+def flatten_rings(rings):
+    """Get flat coordinate and ring offset arrays from a list of polygon rings.
+
+    Args:
+        rings: A list of rings where each ring is an array of (X, Y) or
+            (longitude, latitude) values.
+
+    Returns:
+        A tuple with two values:
+
+        coordinates -- A flat list of numbers alternating between the first and
+            second value of each vertex of all the rings.
+
+        ring_offsets -- A list of integers for the index of the first vertex of
+            each ring. The last item is the total number of vertices such that
+            there is one more offset than the number of rings.
+    """
+    coordinates, ring_offsets = [], [0]
+    for ring in rings:
+        for pt in ring:
+            coordinates.append(pt[0])
+            coordinates.append(pt[1])
+        ring_offsets.append(len(coordinates) // 2)
+    return coordinates, ring_offsets
+
+
+def coordinates_to_lon_lat(coordinates, ring_offsets, origin_lon_lat=(0, 0),
+                           conversion_factors=None):
+    """Convert many rings of (X, Y) coordinates in meters to (longitude, latitude).
+
+    This function produces the same result as running polygon_to_lon_lat over
+    each ring but it converts all coordinates at once, using numpy when it is
+    available. So it is much faster when converting the polygons of a whole
+    model or geoJSON feature collection.
+
+    Args:
+        coordinates: A flat array of numbers alternating between the X and Y
+            values of each vertex in meters, such as that from flatten_rings.
+        ring_offsets: An array of integers for the index of the first vertex
+            of each ring followed by the total number of vertices.
+        origin_lon_lat: An array of two numbers in degrees for the longitude
+            and latitude of the scene origin. Default: (0, 0).
+        conversion_factors: A tuple with two values used to translate between
+            meters and longitude, latitude. If None, these values will be automatically
+            calculated from the origin_lon_lat using the meters_to_long_lat_factors
+            method.
+
+    Returns:
+        A list with a sub-list for each ring, which contains a (longitude, latitude)
+        tuple for each vertex of the ring.
+    """
+    if not conversion_factors:
+        conversion_factors = meters_to_long_lat_factors(origin_lon_lat)
+    return _convert_rings(coordinates, ring_offsets, origin_lon_lat,
+                          conversion_factors, True)
+
+
+def lon_lat_to_coordinates(coordinates, ring_offsets, origin_lon_lat=(0, 0),
+                           conversion_factors=None):
+    """Convert many rings of (longitude, latitude) to (X, Y) coordinates in meters.
+
+    This function produces the same result as running lon_lat_to_polygon over
+    each ring but it converts all coordinates at once, using numpy when it is
+    available. So it is much faster when converting all of the polygons of
+    a geoJSON feature collection.
+
+    Args:
+        coordinates: A flat array of numbers alternating between the longitude
+            and latitude of each vertex, such as that from flatten_rings.
+        ring_offsets: An array of integers for the index of the first vertex
+            of each ring followed by the total number of vertices.
+        origin_lon_lat: An array of two numbers in degrees for the longitude
+            and latitude of the scene origin. Default: (0, 0).
+        conversion_factors: A tuple with two values used to translate between
+            longitude, latitude and meters. If None, these values will be automatically
+            calculated from the origin_lon_lat using the inverse of the
+            factors computed from the meters_to_long_lat_factors method.
+
+    Returns:
+        A list with a sub-list for each ring, which contains an (X, Y) tuple
+        in meters for each vertex of the ring.
+    """
+    if not conversion_factors:
+        meters_to_lon, meters_to_lat = meters_to_long_lat_factors(origin_lon_lat)
+        conversion_factors = 1.0 / meters_to_lon, 1.0 / meters_to_lat
+    return _convert_rings(coordinates, ring_offsets, origin_lon_lat,
+                          conversion_factors, False)
+
+
+def _convert_rings(coordinates, ring_offsets, origin_lon_lat, factors, to_lon_lat):
+    """Convert flat coordinates between meters and degrees and split them into rings.
+
+    The arithmetic is the same as that of polygon_to_lon_lat (when to_lon_lat
+    is True) and lon_lat_to_polygon (when False) such that the results match.
+    """
+    if numpy is not None:
+        verts = numpy.asarray(coordinates, dtype=float).reshape(-1, 2)
+        if to_lon_lat:
+            verts = verts / factors + origin_lon_lat
+        else:
+            verts = (verts - origin_lon_lat) / factors
+        verts = [tuple(pt) for pt in verts.tolist()]
+    else:
+        o_1, o_2 = origin_lon_lat
+        f_1, f_2 = factors
+        c_1, c_2 = coordinates[0::2], coordinates[1::2]
+        if to_lon_lat:
+            verts = [(o_1 + x / f_1, o_2 + y / f_2) for x, y in zip(c_1, c_2)]
+        else:
+            verts = [((x - o_1) / f_1, (y - o_2) / f_2) for x, y in zip(c_1, c_2)]
+    return [verts[st:end] for st, end in zip(ring_offsets[:-1], ring_offsets[1:])]
+
+
 def origin_long_lat_from_location(location, point):
     """Get the (longitude, latitude) of the scene origin from a location and a point.
 
@@ -9,8 +9,34 @@ from __future__ import division
 
 import honeybee.properties as hb_properties
 
+import dragonfly
 
-class _Properties(object):
+
+_EXTENSION_ATTRIBUTES = {}  # cache of extension attributes for each Properties class
+
+
+class _PropertiesMeta(type):
+    """Metaclass for Properties that tracks when extensions add attributes to them.
+
+    Any attribute that is set or deleted on a Properties class (eg. when an
+    extension like dragonfly-energy adds its properties) clears the cache of
+    extension attributes such that it is recomputed upon next request.
+    """
+
+    def __setattr__(cls, name, value):
+        type.__setattr__(cls, name, value)
+        _EXTENSION_ATTRIBUTES.clear()
+
+    def __delattr__(cls, name):
+        type.__delattr__(cls, name)
+        _EXTENSION_ATTRIBUTES.clear()
+
+
+# base class created without class syntax so that it works in Python 2 and 3
+_PropertiesBase = _PropertiesMeta('_PropertiesBase', (object,), {})
+
+
+class _Properties(_PropertiesBase):
     """Base class for all Properties classes.
 
     Args:
@@ -35,8 +61,22 @@ class _Properties(object):
 
     @property
     def _extension_attributes(self):
-        return (atr for atr in dir(self) if not atr.startswith('_')
-                and atr not in self._exclude)
+        if dragonfly._pending_extensions:  # load extensions before listing them
+            dragonfly.load_extensions()
+        try:
+            return _EXTENSION_ATTRIBUTES[self.__class__]
+        except KeyError:  # first time that the attributes are requested
+            ext_attr = tuple(atr for atr in dir(self.__class__)
+                             if not atr.startswith('_') and atr not in self._exclude)
+            _EXTENSION_ATTRIBUTES[self.__class__] = ext_attr
+            return ext_attr
+
+    def __getattr__(self, name):
+        # only called when the attribute is not found; it may be a pending extension
+        if not name.startswith('_') and dragonfly.load_extensions(name):
+            return getattr(self, name)
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
 
     def move(self, moving_vec):
         """Apply a move transform to extension attributes.
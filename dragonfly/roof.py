@@ -12,6 +12,7 @@ from ladybug_geometry.intersection2d import closest_point2d_on_line2d, \
 from ladybug_geometry.bounding import overlapping_bounding_boxes
 
 import dragonfly.clerestoryparameter as clear_par
+from dragonfly.spatialindex import polygon_gap_points
 
 
 class RoofSpecification(object):
@@ -45,7 +46,8 @@ class RoofSpecification(object):
         * altitudes
         * tilts
     """
-    __slots__ = ('_geometry', '_clerestory_parameters', '_parent', '_is_resolved')
+    __slots__ = ('_geometry', '_clerestory_parameters', '_parent', '_is_resolved',
+                 '_resolved_cache')
     _ANG_TOL = 0.0174533  # angle tolerance in radians for determining X or Y alignment
 
     def __init__(self, geometry, clerestory_parameters=None):
@@ -209,6 +211,7 @@ class RoofSpecification(object):
             assert isinstance(geo, Face3D), \
                 'Expected Face3D for RoofSpecification. Got {}'.format(type(geo))
         self._geometry = value
+        self._resolved_cache = None
 
     @property
     def geometry_2d(self):
@@ -422,6 +425,9 @@ class RoofSpecification(object):
         This method can also optionally split any roof geometries with holes such
         that they can be accurately accounted for in the room volume calculation.
 
+        The result is cached for each tolerance such that repeated calls do not
+        repeat the resolution until the roof geometry is changed.
+
         Args:
             tolerance: The minimum distance that two Roof geometries can overlap
                 with one another and still be considered distinct. (Default: 0.01,
@@ -435,6 +441,24 @@ class RoofSpecification(object):
         Returns:
             A list of Face3D that have no overlaps in plan.
         """
+        # check whether the geometry has already been resolved at the tolerance
+        cache = self._resolved_cache
+        if cache is None or cache[0] is not self._geometry:
+            cache = self._resolved_cache = (self._geometry, {})
+        key = (tolerance, split_through_holes)
+        try:
+            return list(cache[1][key])
+        except KeyError:  # geometry not yet resolved
+            res_geo = self._resolve_geometry(tolerance, split_through_holes)
+            cache[1][key] = tuple(res_geo)
+            return res_geo
+
+    def _resolve_geometry(self, tolerance, split_through_holes):
+        """Resolve the overlaps in plan without using any cached result.
+
+        The resolved geometry is cached on the RoofSpecification by the
+        resolved_geometry method and so this should only be called from there.
+        """
         # if split_through_holes is requested, perform the split
         if split_through_holes:
             base_geo = []
@@ -610,27 +634,7 @@ class RoofSpecification(object):
             room_2ds, which are larger than the tolerance but less than the
             gap_distance.
         """
-        roof_polys = self.boundary_geometry_2d
-        gap_points = []
-        for i, poly_1 in enumerate(roof_polys):
-            try:
-                for poly_2 in roof_polys[i + 1:]:
-                    if not Polygon2D.overlapping_bounding_rect(
-                            poly_1, poly_2, gap_distance):
-                        continue  # no overlap in bounding rect; gap impossible
-                    # check the first polygon against the second
-                    for pt_1 in poly_1:
-                        pt_dist = poly_2.distance_from_edge_to_point(pt_1)
-                        if tolerance < pt_dist <= gap_distance:
-                            gap_points.append(pt_1)
-                    # check the second polygon against the first
-                    for pt_2 in poly_2:
-                        pt_dist = poly_1.distance_from_edge_to_point(pt_2)
-                        if tolerance < pt_dist <= gap_distance:
-                            gap_points.append(pt_2)
-            except IndexError:
-                pass  # we have reached the end of the list of rooms
-        return gap_points
+        return polygon_gap_points(self.boundary_geometry_2d, gap_distance, tolerance)
 
     def assign_sub_faces(self, sub_faces, projection_distance=0, overwrite=True,
                          tolerance=0.01, angle_tolerance=1.0):
@@ -808,6 +812,7 @@ class RoofSpecification(object):
         geo_list = list(self._geometry)
         geo_list[face_index] = new_face_3d
         self._geometry = tuple(geo_list)
+        self._resolved_cache = None
 
     def update_geometry_2d(
             self, new_polygon_2d, polygon_index, new_hole_polygon_2d=None):
@@ -1700,7 +1705,9 @@ class RoofSpecification(object):
 
     def __copy__(self):
         new_cp = tuple(cp.duplicate() for cp in self._clerestory_parameters)
-        return RoofSpecification(self._geometry, new_cp)
+        new_roof = RoofSpecification(self._geometry, new_cp)
+        new_roof._resolved_cache = self._resolved_cache  # geometry is shared
+        return new_roof
 
     def __len__(self):
         return len(self._geometry)
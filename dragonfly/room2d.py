@@ -32,6 +32,7 @@ from honeybee.room import Room
 
 from ._base import _BaseGeometry
 from .properties import Room2DProperties
+from .spatialindex import RectangleGrid, polygon_gap_points
 import dragonfly.windowparameter as glzpar
 from dragonfly.windowparameter import _WindowParameterBase, _AsymmetricBase, \
     SimpleWindowRatio, RectangularWindows, DetailedWindows
@@ -1588,6 +1589,7 @@ class Room2D(_BaseGeometry):
                 characters for dragonfly identifiers.
         """
         self._identifier = clean_string('{}_{}'.format(prefix, self.identifier))
+        self._clear_parent_index()
         if self._display_name is not None:
             self.display_name = '{}_{}'.format(prefix, self.display_name)
         self.properties.add_prefix(prefix)
@@ -4629,28 +4631,8 @@ class Room2D(_BaseGeometry):
             room_2ds, which are larger than the tolerance but less than the
             gap_distance.
         """
-        gap_points = []
-        for i, room_1 in enumerate(room_2ds):
-            try:
-                for room_2 in room_2ds[i + 1:]:
-                    poly_1 = room_1._floor_geometry.boundary_polygon2d
-                    poly_2 = room_2._floor_geometry.boundary_polygon2d
-                    if not Polygon2D.overlapping_bounding_rect(
-                            poly_1, poly_2, gap_distance):
-                        continue  # no overlap in bounding rect; gap impossible
-                    # check the first polygon against the second
-                    for pt_1 in poly_1:
-                        pt_dist = poly_2.distance_from_edge_to_point(pt_1)
-                        if tolerance < pt_dist <= gap_distance:
-                            gap_points.append(pt_1)
-                    # check the second polygon against the first
-                    for pt_2 in poly_2:
-                        pt_dist = poly_1.distance_from_edge_to_point(pt_2)
-                        if tolerance < pt_dist <= gap_distance:
-                            gap_points.append(pt_2)
-            except IndexError:
-                pass  # we have reached the end of the list of rooms
-        return gap_points
+        polygons = [room._floor_geometry.boundary_polygon2d for room in room_2ds]
+        return polygon_gap_points(polygons, gap_distance, tolerance)
 
     @staticmethod
     def solve_adjacency(room_2ds, tolerance=0.01, resolve_window_conflicts=True):
@@ -4685,24 +4667,16 @@ class Room2D(_BaseGeometry):
         # set the adjacencies between all matching segments
         rwc = resolve_window_conflicts
         adj_info = []
-        for i, room_1 in enumerate(room_2ds):
-            try:
-                for room_2 in room_2ds[i + 1:]:
-                    if not Polygon2D.overlapping_bounding_rect(
-                            room_1._floor_geometry.boundary_polygon2d,
-                            room_2._floor_geometry.boundary_polygon2d, tolerance):
-                        continue  # no overlap in bounding rect; adjacency impossible
-                    for j, seg_1 in enumerate(room_1.floor_segments_2d):
-                        for k, seg_2 in enumerate(room_2.floor_segments_2d):
-                            if not isinstance(room_2._boundary_conditions[k], Surface):
-                                if seg_1.distance_to_point(seg_2.p1) <= tolerance and \
-                                        seg_1.distance_to_point(seg_2.p2) <= tolerance:
-                                    # set the boundary conditions of the segments
-                                    room_1.set_adjacency(room_2, j, k, rwc)
-                                    adj_info.append(((room_1, j), (room_2, k)))
-                                    break
-            except IndexError:
-                pass  # we have reached the end of the list of rooms
+        for room_1, room_2, j, seg_1, cand_segs in \
+                Room2D._adjacent_segment_candidates(room_2ds, tolerance):
+            for k, seg_2 in cand_segs:
+                if not isinstance(room_2._boundary_conditions[k], Surface):
+                    if seg_1.distance_to_point(seg_2.p1) <= tolerance and \
+                            seg_1.distance_to_point(seg_2.p2) <= tolerance:
+                        # set the boundary conditions of the segments
+                        room_1.set_adjacency(room_2, j, k, rwc)
+                        adj_info.append(((room_1, j), (room_2, k)))
+                        break
         return adj_info
 
     @staticmethod
@@ -4725,21 +4699,13 @@ class Room2D(_BaseGeometry):
             the second is the index of the wall segment that is adjacent.
         """
         adj_info = []  # lists of adjacencies to track
-        for i, room_1 in enumerate(room_2ds):
-            try:
-                for room_2 in room_2ds[i + 1:]:
-                    if not Polygon2D.overlapping_bounding_rect(
-                            room_1._floor_geometry.boundary_polygon2d,
-                            room_2._floor_geometry.boundary_polygon2d, tolerance):
-                        continue  # no overlap in bounding rect; adjacency impossible
-                    for j, seg_1 in enumerate(room_1.floor_segments_2d):
-                        for k, seg_2 in enumerate(room_2.floor_segments_2d):
-                            if seg_1.distance_to_point(seg_2.p1) <= tolerance and \
-                                    seg_1.distance_to_point(seg_2.p2) <= tolerance:
-                                adj_info.append(((room_1, j), (room_2, k)))
-                                break
-            except IndexError:
-                pass  # we have reached the end of the list of rooms
+        for room_1, room_2, j, seg_1, cand_segs in \
+                Room2D._adjacent_segment_candidates(room_2ds, tolerance):
+            for k, seg_2 in cand_segs:
+                if seg_1.distance_to_point(seg_2.p1) <= tolerance and \
+                        seg_1.distance_to_point(seg_2.p2) <= tolerance:
+                    adj_info.append(((room_1, j), (room_2, k)))
+                    break
         return adj_info
 
     @staticmethod
@@ -4765,26 +4731,19 @@ class Room2D(_BaseGeometry):
             wall segment that is adjacent.
         """
         adj_info = []  # lists of adjacencies to track
-        for i, room_1 in enumerate(room_2ds):
-            try:
-                for room_2 in room_2ds[i + 1:]:
-                    if not Polygon2D.overlapping_bounding_rect(
-                            room_1._floor_geometry.boundary_polygon2d,
-                            room_2._floor_geometry.boundary_polygon2d, tolerance):
-                        continue  # no overlap in bounding rect; adjacency impossible
-                    for j, seg_1 in enumerate(room_1.floor_segments_2d):
-                        for k, seg_2 in enumerate(room_2.floor_segments_2d):
-                            if seg_1.distance_to_point(seg_2.p1) <= tolerance and \
-                                    seg_1.distance_to_point(seg_2.p2) <= tolerance:
-                                if Room2D._seg_on_guide_lines(seg_1, lines, tolerance):
-                                    adj_info.append(((room_1, j), (room_2, k)))
-                                break
-            except IndexError:
-                pass  # we have reached the end of the list of rooms
+        for room_1, room_2, j, seg_1, cand_segs in \
+                Room2D._adjacent_segment_candidates(room_2ds, tolerance):
+            for k, seg_2 in cand_segs:
+                if seg_1.distance_to_point(seg_2.p1) <= tolerance and \
+                        seg_1.distance_to_point(seg_2.p2) <= tolerance:
+                    if Room2D._seg_on_guide_lines(seg_1, lines, tolerance):
+                        adj_info.append(((room_1, j), (room_2, k)))
+                    break
         return adj_info
 
     @staticmethod
-    def intersect_adjacency(room_2ds, tolerance=0.01, preserve_wall_props=True):
+    def intersect_adjacency(room_2ds, tolerance=0.01, preserve_wall_props=True,
+                            partition=False):
         """Intersect the line segments of an array of Room2Ds to ensure matching walls.
 
         Also note that this method does not actually set the walls that are next to one
@@ -4804,6 +4763,15 @@ class Room2D(_BaseGeometry):
                 erased, and this method will execute quickly. If True, an attempt
                 will be made to split window parameters new across colinear segments.
                 Existing boundary conditions will also be kept. (Default: True).
+            partition: Boolean to note whether the Room2D polygons should only be
+                intersected with neighboring polygons, which have bounding rectangles
+                within the tolerance of one another. The resulting geometry is the
+                same as when all polygons are intersected together but it is much
+                faster for large numbers of Room2Ds. Furthermore, any Room2Ds that
+                do not gain new vertices and have no Surface boundary conditions
+                are returned as they are when preserve_wall_props is True
+                (without being rebuilt or having their wall properties
+                transferred). (Default: False).
 
         Returns:
             An array of Room2Ds that have been intersected with one another.
@@ -4830,14 +4798,34 @@ class Room2D(_BaseGeometry):
                     polygon_2ds.append(hole)
 
         # intersect the Room2D polygons within the 2D space
-        int_poly = Polygon2D.intersect_polygon_segments(polygon_2ds, tol)
+        if partition:
+            vert_counts = [len(poly) for poly in polygon_2ds]
+            int_poly = Room2D._intersect_neighbor_polygons(polygon_2ds, tol)
+            room_changed = []  # note whether any polygon of each Room2D changed
+            for poly, v_count, is_hole in zip(int_poly, vert_counts, is_holes):
+                if not is_hole:
+                    room_changed.append(len(poly) != v_count)
+                elif len(poly) != v_count:
+                    room_changed[-1] = True
+            for i, room in enumerate(room_2ds):  # rebuilding resets Surface BCs
+                if not preserve_wall_props or any(
+                        isinstance(bc, Surface) for bc in room._boundary_conditions):
+                    room_changed[i] = True
+        else:
+            int_poly = Polygon2D.intersect_polygon_segments(polygon_2ds, tol)
+            room_changed = [True] * len(room_2ds)
 
         # convert the resulting coordinates back to 3D space
-        face_pts = []
+        face_pts, room_i = [], -1
         for poly, dist, is_hole in zip(int_poly, move_dists, is_holes):
-            pt_3d = [master_plane.xy_to_xyz(pt) for pt in poly]
-            if dist != 0:
-                pt_3d = [Point3D(pt.x, pt.y, pt.z - dist) for pt in pt_3d]
+            if not is_hole:
+                room_i += 1
+            if not room_changed[room_i]:  # no need to convert unchanged rooms
+                pt_3d = None
+            else:
+                pt_3d = [master_plane.xy_to_xyz(pt) for pt in poly]
+                if dist != 0:
+                    pt_3d = [Point3D(pt.x, pt.y, pt.z - dist) for pt in pt_3d]
             if not is_hole:
                 face_pts.append((pt_3d, []))
             else:
@@ -4846,6 +4834,9 @@ class Room2D(_BaseGeometry):
         # rebuild all of the floor geometries to the input Room2Ds
         intersected_rooms = []
         for i, face_loops in enumerate(face_pts):
+            if not room_changed[i]:  # room gained no vertices; use it as it is
+                intersected_rooms.append(room_2ds[i])
+                continue
             if len(face_loops[1]) == 0:  # no holes
                 new_geo = Face3D(face_loops[0], room_2ds[i].floor_geometry.plane)
             else:  # ensure holes are included
@@ -4872,10 +4863,27 @@ class Room2D(_BaseGeometry):
         # transfer the wall properties if requested
         if preserve_wall_props:
             for orig_r, new_r in zip(room_2ds, intersected_rooms):
-                orig_r._match_and_transfer_wall_props(new_r, tolerance)
+                if new_r is not orig_r:
+                    orig_r._match_and_transfer_wall_props(new_r, tolerance)
 
         return tuple(intersected_rooms)
 
+    @staticmethod
+    def _intersect_neighbor_polygons(polygons, tolerance):
+        """Intersect the segments of Polygon2Ds with only their neighboring polygons.
+
+        The result is the same as Polygon2D.intersect_polygon_segments because
+        vertices are only inserted along existing segments, which never changes
+        the bounding rectangle of a polygon, and polygons with bounding rectangles
+        farther apart than the tolerance are never intersected with one another.
+        The pairs are also intersected in the same order.
+        """
+        grid = RectangleGrid.from_polygons(polygons)
+        for i, j in grid.overlapping_pairs(tolerance):
+            polygons[i], polygons[j] = \
+                Polygon2D.intersect_segments(polygons[i], polygons[j], tolerance)
+        return polygons
+
     @staticmethod
     def patch_missing_adjacencies(room_2ds):
         """Replace any Surface BCs with missing adjacent objects with outdoors.
@@ -4984,17 +4992,12 @@ class Room2D(_BaseGeometry):
         b_poly = [room.floor_geometry.boundary_polygon2d for room in rooms]
         grouped_polys = Polygon2D.group_by_touching(b_poly, distance)
 
-        # figure out which rooms correspond to which polygons and return grouped rooms
-        grouped_rooms = []
-        for poly_group in grouped_polys:
-            room_group = []
-            for poly in poly_group:
-                for room in rooms:
-                    if room.floor_geometry.boundary_polygon2d == poly:
-                        room_group.append(room)
-                        break
-            grouped_rooms.append(room_group)
-        return grouped_rooms
+        # map each polygon to the index of the first room with an equal polygon
+        poly_index = {}
+        for i, poly in enumerate(b_poly):
+            poly_index.setdefault(poly, i)
+        return [[rooms[poly_index[poly]] for poly in poly_group]
+                for poly_group in grouped_polys]
 
     @staticmethod
     def group_by_adjacency(rooms):
@@ -7038,6 +7041,65 @@ class Room2D(_BaseGeometry):
         new_w_par.append(new_w_par.pop(0))
         return new_vertices, new_bcs, new_w_par
 
+    @staticmethod
+    def _adjacent_segment_candidates(room_2ds, tolerance):
+        """Get the pairs of Room2D segments that could possibly be adjacent.
+
+        All floor segments of the input room_2ds are added to a spatial index
+        such that each segment is only compared to the segments near it, rather
+        than all segments of all Room2Ds that overlap its Room2D.
+
+        Args:
+            room_2ds: A list of Room2Ds for which adjacency candidates will be found.
+            tolerance: The minimum difference between the coordinate values of two
+                faces at which they can be considered adjacent.
+
+        Returns:
+            An iterator of tuples with five items. The first two are the pair of
+            Room2Ds that can be adjacent. The third is the index of the segment
+            of the first Room2D and the fourth is this LineSegment2D. The last
+            item is a list of (index, LineSegment2D) tuples for segments of the
+            second Room2D that are near the segment of the first Room2D. The
+            order of the tuples is the same as that of looping over every pair
+            of Room2Ds (and their segments) in the order of the input room_2ds.
+        """
+        # build a spatial index of all of the segments
+        room_segs = [room.floor_segments_2d for room in room_2ds]
+        seg_keys, seg_rects = [], []
+        for i, segs in enumerate(room_segs):
+            for k, seg in enumerate(segs):
+                seg_keys.append((i, k))
+                seg_rects.append(RectangleGrid.segment_rectangle(seg))
+        if len(seg_rects) == 0:
+            return
+        seg_grid = RectangleGrid(seg_rects)
+        # find the candidate segments of other rooms for each segment
+        seg_count = 0
+        for i, room_1 in enumerate(room_2ds):
+            candidates = {}
+            for j in range(len(room_segs[i])):
+                for item in seg_grid.query(seg_rects[seg_count + j], tolerance):
+                    o_i, k = seg_keys[item]
+                    if o_i > i:
+                        try:
+                            candidates[o_i][j].append(k)
+                        except KeyError:
+                            try:
+                                candidates[o_i][j] = [k]
+                            except KeyError:
+                                candidates[o_i] = {j: [k]}
+            seg_count += len(room_segs[i])
+            for o_i in sorted(candidates):
+                room_2 = room_2ds[o_i]
+                if not Polygon2D.overlapping_bounding_rect(
+                        room_1._floor_geometry.boundary_polygon2d,
+                        room_2._floor_geometry.boundary_polygon2d, tolerance):
+                    continue  # no overlap in bounding rect; adjacency impossible
+                segs_2 = room_segs[o_i]
+                for j, ks in sorted(candidates[o_i].items()):
+                    yield room_1, room_2, j, room_segs[i][j], \
+                        [(k, segs_2[k]) for k in ks]
+
     @staticmethod
     def _adjacency_grouping(rooms, adj_finding_function):
         """Group Room2Ds together according to an adjacency finding function.
@@ -7050,14 +7112,23 @@ class Room2D(_BaseGeometry):
         Returns:
             A list of list with each sub-list containing rooms that share adjacencies.
         """
-        # create a room lookup table and duplicate the list of rooms
+        # create a room lookup table and map identifiers to the indices of rooms
         room_lookup = {rm.identifier: rm for rm in rooms}
-        all_rooms = list(rooms)
+        id_indices = {}
+        for i, rm in enumerate(rooms):
+            try:
+                id_indices[rm.identifier].append(i)
+            except KeyError:
+                id_indices[rm.identifier] = [i]
+        remaining = [True] * len(rooms)
         adj_network = []
 
         # loop through the rooms and find air boundary adjacencies
-        for room in all_rooms:
+        r_i = 0
+        while r_i < len(rooms):
+            room = rooms[r_i]
             adj_ids = adj_finding_function(room)
+            local_ids = set()
             if len(adj_ids) == 0:  # a room that is its own solar enclosure
                 adj_network.append([room])
             else:  # there are other adjacent rooms to find
@@ -7081,12 +7152,26 @@ class Room2D(_BaseGeometry):
                         for rm_id in new_ids:
                             local_ids.add(rm_id)
                         adj_ids.extend(new_ids)
-                # after the local network is understood, clean up duplicated rooms
                 adj_network.append(local_network)
-                i_to_remove = [i for i, room_obj in enumerate(all_rooms)
-                               if room_obj.identifier in local_ids]
-                for i in reversed(i_to_remove):
-                    all_rooms.pop(i)
+            # remove the grouped rooms from the rooms that remain to be grouped
+            removed_before = 0
+            for rm_id in local_ids:
+                for i in id_indices.pop(rm_id, ()):
+                    if remaining[i]:
+                        remaining[i] = False
+                        if i < r_i:
+                            removed_before += 1
+            # move to the next remaining room, skipping one remaining room for
+            # each removed room that came before this one, like iterating over
+            # a list from which the grouped rooms are popped
+            to_skip = removed_before if remaining[r_i] else removed_before + 1
+            r_i += 1
+            while r_i < len(rooms):
+                if remaining[r_i]:
+                    if to_skip == 0:
+                        break
+                    to_skip -= 1
+                r_i += 1
         return adj_network
 
     @staticmethod
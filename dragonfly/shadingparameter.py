@@ -6,6 +6,8 @@ from honeybee.typing import float_in_range, float_positive, int_positive
 
 from ladybug_geometry.geometry2d.pointvector import Vector2D
 
+from .internutil import intern_parameter
+
 
 class _ShadingParameterBase(object):
     """Base object for all shading parameters.
@@ -13,7 +15,7 @@ class _ShadingParameterBase(object):
     This object records all of the methods that must be overwritten on a shading
     parameter object for it to be successfully be applied in dragonfly workflows.
     """
-    __slots__ = ()
+    __slots__ = ('__weakref__',)
 
     def __init__(self):
         pass
@@ -74,6 +76,7 @@ class ExtrudedBorder(_ShadingParameterBase):
         * depth
     """
     __slots__ = ('_depth',)
+    _internable = True
 
     def __init__(self, depth):
         """Instructions for extruded borders over all windows in the wall."""
@@ -119,7 +122,7 @@ class ExtrudedBorder(_ShadingParameterBase):
         """
         assert data['type'] == 'ExtrudedBorder', \
             'Expected ExtrudedBorder dictionary. Got {}.'.format(data['type'])
-        return cls(data['depth'])
+        return intern_parameter(cls(data['depth']))
 
     def to_dict(self):
         """Get ExtrudedBorder as a dictionary."""
@@ -160,6 +163,7 @@ class Overhang(_ShadingParameterBase):
         * angle
     """
     __slots__ = ('_depth', '_angle')
+    _internable = True
 
     def __init__(self, depth, angle=0):
         """Instructions for a single overhang over an entire wall."""
@@ -212,7 +216,7 @@ class Overhang(_ShadingParameterBase):
         assert data['type'] == 'Overhang', \
             'Expected Overhang dictionary. Got {}.'.format(data['type'])
         angle = data['angle'] if 'angle' in data else 0
-        return cls(data['depth'], angle)
+        return intern_parameter(cls(data['depth'], angle))
 
     def to_dict(self):
         """Get Overhang as a dictionary."""
@@ -266,6 +270,7 @@ class _LouversBase(_ShadingParameterBase):
         * flip_start_side
     """
     __slots__ = ('_depth', '_offset', '_angle', '_contour_vector', '_flip_start_side')
+    _internable = True
 
     def __init__(self, depth, offset=0, angle=0, contour_vector=Vector2D(0, 1),
                  flip_start_side=False):
@@ -420,7 +425,8 @@ class LouversByDistance(_LouversBase):
         assert data['type'] == 'LouversByDistance', \
             'Expected LouversByDistance dictionary. Got {}.'.format(data['type'])
         offset, angle, contr, flip = cls._default_dict_parameters(data)
-        return cls(data['distance'], data['depth'], offset, angle, contr, flip)
+        return intern_parameter(
+            cls(data['distance'], data['depth'], offset, angle, contr, flip))
 
     def to_dict(self):
         """Get LouversByDistance as a dictionary."""
@@ -542,7 +548,8 @@ class LouversByCount(_LouversBase):
         assert data['type'] == 'LouversByCount', \
             'Expected LouversByCount dictionary. Got {}.'.format(data['type'])
         offset, angle, contr, flip = cls._default_dict_parameters(data)
-        return cls(data['louver_count'], data['depth'], offset, angle, contr, flip)
+        return intern_parameter(
+            cls(data['louver_count'], data['depth'], offset, angle, contr, flip))
 
     def to_dict(self):
         """Get LouversByCount as a dictionary."""
@@ -0,0 +1,320 @@
+# coding: utf-8
+"""Spatial indices used to quickly find dragonfly objects in close proximity."""
+from __future__ import division
+
+import math
+try:  # use numpy to compute many distances at once when it is available
+    import numpy
+except ImportError:  # numpy is not available (eg. IronPython)
+    numpy = None
+
+from ladybug_geometry.geometry2d import Polygon2D
+
+
+class RectangleGrid(object):
+    """A uniform grid that indexes bounding rectangles in the XY plane.
+
+    The grid is used as a broad phase before computationally intense checks
+    between many objects (eg. adjacency solving or overlap checks). All queries
+    are conservative, meaning that they never miss a rectangle that overlaps
+    the query rectangle within the tolerance. However, rectangles that are
+    farther than the tolerance by a negligible floating point difference
+    can be returned. So any exact check should still be performed on the
+    returned candidates.
+
+    Args:
+        rectangles: A list of tuples with four numbers for the bounding rectangles
+            to be indexed. Each tuple should be formatted as (min_x, min_y,
+            max_x, max_y). The index of each rectangle in this list is what
+            is returned by the query methods.
+        cell_size: An optional number for the dimension of each square grid cell.
+            If None, it will be set to the average dimension of the input
+            rectangles, which is usually a good choice. (Default: None).
+
+    Properties:
+        * rectangles
+        * cell_size
+    """
+    __slots__ = ('_rectangles', '_cell_size', '_cells', '_oversized')
+    MAX_CELLS = 1024  # max number of cells a rectangle can occupy in the grid
+
+    def __init__(self, rectangles, cell_size=None):
+        """Initialize RectangleGrid."""
+        self._rectangles = tuple(rectangles)
+        if cell_size is None:
+            cell_size = self._average_dimension(self._rectangles)
+        assert cell_size > 0, 'RectangleGrid cell_size must be greater than zero.'
+        self._cell_size = float(cell_size)
+        # add each of the rectangles to the grid cells
+        self._cells = {}
+        self._oversized = []
+        for i, rect in enumerate(self._rectangles):
+            x_min, y_min, x_max, y_max = self._cell_range(rect, 0)
+            if (x_max - x_min + 1) * (y_max - y_min + 1) > self.MAX_CELLS:
+                self._oversized.append(i)
+                continue
+            for x in range(x_min, x_max + 1):
+                for y in range(y_min, y_max + 1):
+                    try:
+                        self._cells[(x, y)].append(i)
+                    except KeyError:
+                        self._cells[(x, y)] = [i]
+
+    @classmethod
+    def from_polygons(cls, polygons, cell_size=None):
+        """Create a RectangleGrid from the bounding rectangles of Polygon2Ds.
+
+        Args:
+            polygons: A list of Polygon2D (or any objects with min and max
+                Point2D properties) to be indexed.
+            cell_size: An optional number for the dimension of each grid cell.
+        """
+        rects = []
+        for poly in polygons:
+            p_min, p_max = poly.min, poly.max
+            rects.append((p_min.x, p_min.y, p_max.x, p_max.y))
+        return cls(rects, cell_size)
+
+    @classmethod
+    def from_segments(cls, segments, cell_size=None):
+        """Create a RectangleGrid from the bounding rectangles of LineSegment2Ds.
+
+        Args:
+            segments: A list of LineSegment2D to be indexed.
+            cell_size: An optional number for the dimension of each grid cell.
+        """
+        return cls([cls.segment_rectangle(seg) for seg in segments], cell_size)
+
+    @property
+    def rectangles(self):
+        """Get a tuple of the (min_x, min_y, max_x, max_y) rectangles in the grid."""
+        return self._rectangles
+
+    @property
+    def cell_size(self):
+        """Get a number for the dimension of each square grid cell."""
+        return self._cell_size
+
+    def query(self, rectangle, tolerance=0):
+        """Get the indices of all indexed rectangles near a given rectangle.
+
+        Args:
+            rectangle: A tuple of (min_x, min_y, max_x, max_y) for the rectangle
+                to be queried.
+            tolerance: A number for the distance within which rectangles are
+                considered to be overlapping. (Default: 0).
+
+        Returns:
+            A sorted list of integers for the indices of the rectangles that
+            overlap the input rectangle within the tolerance.
+        """
+        x_min, y_min, x_max, y_max = self._cell_range(rectangle, tolerance)
+        found = set(self._oversized)
+        cells = self._cells
+        if (x_max - x_min + 1) * (y_max - y_min + 1) > len(cells):
+            # query covers more cells than are filled; check the filled cells
+            for (x, y), items in cells.items():
+                if x_min <= x <= x_max and y_min <= y <= y_max:
+                    found.update(items)
+        else:
+            for x in range(x_min, x_max + 1):
+                for y in range(y_min, y_max + 1):
+                    try:
+                        found.update(cells[(x, y)])
+                    except KeyError:
+                        pass
+        # remove any rectangles that are in the same cells but do not overlap
+        tol = tolerance + self._cell_size * 1e-9
+        rects, overlap = self._rectangles, self.rectangles_overlap
+        return sorted(i for i in found if overlap(rectangle, rects[i], tol))
+
+    def query_polygon(self, polygon, tolerance=0):
+        """Get the indices of all indexed rectangles near a Polygon2D's bounding rect.
+
+        Args:
+            polygon: A Polygon2D (or any object with min and max Point2D properties).
+            tolerance: A number for the distance within which rectangles are
+                considered to be overlapping. (Default: 0).
+        """
+        p_min, p_max = polygon.min, polygon.max
+        return self.query((p_min.x, p_min.y, p_max.x, p_max.y), tolerance)
+
+    def overlapping_pairs(self, tolerance=0):
+        """Get all pairs of indexed rectangles that overlap one another.
+
+        Args:
+            tolerance: A number for the distance within which rectangles are
+                considered to be overlapping. (Default: 0).
+
+        Returns:
+            A sorted list of tuples. Each tuple contains two integers (i, j)
+            for the indices of the overlapping rectangles where i < j.
+        """
+        pairs = []
+        for i, rect in enumerate(self._rectangles):
+            for j in self.query(rect, tolerance):
+                if j > i:
+                    pairs.append((i, j))
+        return pairs
+
+    @staticmethod
+    def segment_rectangle(segment):
+        """Get a (min_x, min_y, max_x, max_y) tuple for a LineSegment2D."""
+        p1, p2 = segment.p1, segment.p2
+        return (min(p1.x, p2.x), min(p1.y, p2.y), max(p1.x, p2.x), max(p1.y, p2.y))
+
+    @staticmethod
+    def rectangles_overlap(rect_1, rect_2, tolerance=0):
+        """Check if two (min_x, min_y, max_x, max_y) rectangles overlap in tolerance."""
+        return rect_1[0] - rect_2[2] <= tolerance and \
+            rect_2[0] - rect_1[2] <= tolerance and \
+            rect_1[1] - rect_2[3] <= tolerance and \
+            rect_2[1] - rect_1[3] <= tolerance
+
+    def _cell_range(self, rect, tolerance):
+        """Get the range of grid cells covered by a rectangle padded by tolerance."""
+        # pad with a tiny extra distance so that queries are always conservative
+        pad = tolerance + self._cell_size * 1e-9
+        c_size = self._cell_size
+        return (int(math.floor((rect[0] - pad) / c_size)),
+                int(math.floor((rect[1] - pad) / c_size)),
+                int(math.floor((rect[2] + pad) / c_size)),
+                int(math.floor((rect[3] + pad) / c_size)))
+
+    @staticmethod
+    def _average_dimension(rectangles):
+        """Get the average dimension of a list of rectangles for the grid cell size."""
+        total_dim, count = 0, 0
+        for rect in rectangles:
+            total_dim += max(rect[2] - rect[0], rect[3] - rect[1])
+            count += 1
+        avg_dim = total_dim / count if count != 0 else 0
+        return avg_dim if avg_dim > 0 else 1.0
+
+    def __len__(self):
+        return len(self._rectangles)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'RectangleGrid: [{} rectangles] [cell size: {}]'.format(
+            len(self._rectangles), self._cell_size)
+
+
+def polygon_gap_points(polygons, gap_distance=0.1, tolerance=0.01):
+    """Get the vertices of Polygon2Ds that form small gaps with other Polygon2Ds.
+
+    This function produces the same result as checking the distance_from_edge_to_point
+    of each vertex of every pair of polygons with overlapping bounding rectangles.
+    However, each vertex is only checked against the polygon segments within the
+    gap_distance, which are found with a RectangleGrid. The distances are computed
+    all at once using numpy when it is available.
+
+    Args:
+        polygons: A list of Polygon2D to be checked for gaps with one another.
+        gap_distance: The maximum distance between two polygons that is
+            considered a gap. (Default: 0.1).
+        tolerance: The minimum distance between a vertex and another polygon
+            that is considered a gap. (Default: 0.01).
+
+    Returns:
+        A list of Point2D for the vertices that are more than the tolerance and
+        no more than the gap_distance from another polygon. For each pair of
+        polygons, the vertices of the first polygon come before those of the second
+        and each vertex is repeated for every polygon with which it forms a gap.
+    """
+    # index all of the polygon segments in a grid
+    seg_rects, seg_coords, seg_polys = [], [], []
+    for p_i, poly in enumerate(polygons):
+        verts = poly.vertices
+        for v_i, pt_1 in enumerate(verts):
+            pt_2 = verts[(v_i + 1) % len(verts)]
+            seg_rects.append((min(pt_1.x, pt_2.x), min(pt_1.y, pt_2.y),
+                              max(pt_1.x, pt_2.x), max(pt_1.y, pt_2.y)))
+            seg_coords.append((pt_1.x, pt_1.y, pt_2.x - pt_1.x, pt_2.y - pt_1.y))
+            seg_polys.append(p_i)
+    if len(seg_rects) == 0:
+        return []
+    grid = RectangleGrid(seg_rects)
+
+    # find the segments of other polygons within the gap distance of each vertex
+    points, pt_is, pt_ids, seg_ids = [], [], [], []
+    for p_i, poly in enumerate(polygons):
+        for pt in poly.vertices:
+            pt_id = len(points)
+            points.append(pt)
+            pt_is.append(p_i)
+            for s_i in grid.query((pt.x, pt.y, pt.x, pt.y), gap_distance):
+                if seg_polys[s_i] != p_i:
+                    pt_ids.append(pt_id)
+                    seg_ids.append(s_i)
+    if len(seg_ids) == 0:
+        return []
+
+    # get the distance from each vertex to the nearest segment of each other polygon
+    distances = _point_segment_distances(points, pt_ids, seg_coords, seg_ids)
+    nearest = {}  # dictionary of (vertex, polygon) keys and their nearest distance
+    for pt_id, s_i, dist in zip(pt_ids, seg_ids, distances):
+        key = (pt_id, seg_polys[s_i])
+        if dist < nearest.get(key, float('inf')):
+            nearest[key] = dist
+
+    # collect the gap points following the order of the polygon pairs
+    gaps = {}
+    for (pt_id, p_j), dist in sorted(nearest.items()):
+        if tolerance < dist <= gap_distance:
+            try:
+                gaps[(pt_is[pt_id], p_j)].append(points[pt_id])
+            except KeyError:
+                gaps[(pt_is[pt_id], p_j)] = [points[pt_id]]
+    gap_points = []
+    for p_i, p_j in sorted(set((min(k), max(k)) for k in gaps)):
+        if not Polygon2D.overlapping_bounding_rect(
+                polygons[p_i], polygons[p_j], gap_distance):
+            continue  # no overlap in bounding rect; gap impossible
+        gap_points.extend(gaps.get((p_i, p_j), []))
+        gap_points.extend(gaps.get((p_j, p_i), []))
+    return gap_points
+
+
+def _point_segment_distances(points, pt_ids, seg_coords, seg_ids):
+    """Get the distances between pairs of Point2Ds and segments.
+
+    The arithmetic follows that of LineSegment2D.distance_to_point such that the
+    distances match it exactly.
+
+    Args:
+        points: A list of Point2D.
+        pt_ids: A list of integers for the point of each pair.
+        seg_coords: A list of (x, y, v_x, v_y) tuples for the start point and
+            vector of each segment.
+        seg_ids: A list of integers for the segment of each pair.
+
+    Returns:
+        A list of numbers for the distance of each pair.
+    """
+    if numpy is not None:
+        pts = numpy.array([(pt.x, pt.y) for pt in points], dtype=float)[pt_ids]
+        segs = numpy.array(seg_coords, dtype=float)[seg_ids]
+        p_x, p_y = pts[:, 0], pts[:, 1]
+        s_x, s_y, v_x, v_y = segs[:, 0], segs[:, 1], segs[:, 2], segs[:, 3]
+        d = v_x ** 2 + v_y ** 2
+        zero = d == 0  # zero-length segments; the closest point is the start
+        u = ((p_x - s_x) * v_x + (p_y - s_y) * v_y) / numpy.where(zero, 1.0, d)
+        u = numpy.where(zero, 0.0, numpy.clip(u, 0.0, 1.0))
+        c_x, c_y = s_x + u * v_x, s_y + u * v_y
+        return numpy.sqrt((p_x - c_x) ** 2 + (p_y - c_y) ** 2).tolist()
+    distances = []
+    for pt_id, s_i in zip(pt_ids, seg_ids):
+        pt, (s_x, s_y, v_x, v_y) = points[pt_id], seg_coords[s_i]
+        d = v_x ** 2 + v_y ** 2
+        if d == 0:
+            c_x, c_y = s_x, s_y
+        else:
+            u = ((pt.x - s_x) * v_x + (pt.y - s_y) * v_y) / d
+            u = max(min(u, 1.0), 0.0)
+            c_x, c_y = s_x + u * v_x, s_y + u * v_y
+        distances.append(math.sqrt((pt.x - c_x) ** 2 + (pt.y - c_y) ** 2))
+    return distances
@@ -21,6 +21,7 @@ from .room2d import Room2D
 from .roof import RoofSpecification
 from .windowparameter import DetailedWindows
 from .properties import StoryProperties
+from .spatialindex import RectangleGrid
 import dragonfly.writer.story as writer
 
 
@@ -88,12 +89,17 @@ class Story(_BaseGeometry):
     """
     STORY_TYPES = ('Standard', 'CeilingPlenum', 'FloorPlenum')
     __slots__ = ('_room_2ds', '_floor_to_floor_height', '_floor_height',
-                 '_multiplier', '_roof', '_type', '_parent')
+                 '_multiplier', '_roof', '_type', '_parent', '_identifier_index',
+                 '_roof_cache', '_outline_cache', '_view_index')
 
     def __init__(self, identifier, room_2ds, floor_to_floor_height=None,
                  floor_height=None, multiplier=1, roof=None, type='Standard'):
         """A Story of a building defined by an extruded Floor2Ds."""
         _BaseGeometry.__init__(self, identifier)  # process the identifier
+        self._identifier_index = None  # dictionary of Room2Ds set upon request
+        self._roof_cache = None  # dictionary of resolved roofs set upon translation
+        self._outline_cache = None  # dictionary of outline geometry set upon request
+        self._view_index = None  # floor index of an OffsetStoryView set upon translation
 
         # process the Room2Ds and story geometry
         self.room_2ds = room_2ds
@@ -572,7 +578,13 @@ using-multipliers-zone-and-or-window.html
                 not considered touching. Default: 0.01, suitable for objects
                 in meters.
         """
-        return self.floor_geometry(tolerance).naked_edges
+        cache = self._geometry_cache()
+        try:
+            return list(cache[('outline', tolerance)])
+        except KeyError:  # outline not yet computed at this tolerance
+            segs = self.floor_geometry(tolerance).naked_edges
+            cache[('outline', tolerance)] = tuple(segs)
+            return list(segs)
 
     def outline_polylines(self, tolerance=0.01):
         """Get a list of Polyline3D objects for the outline of the floor plate.
@@ -595,12 +607,19 @@ using-multipliers-zone-and-or-window.html
                 not considered touching. (Default: 0.01, suitable for objects
                 in meters).
         """
+        cache = self._geometry_cache()
+        try:
+            return list(cache[('footprint', tolerance)])
+        except KeyError:  # footprint not yet computed at this tolerance
+            pass
         plines = self.outline_polylines(tolerance)
         if len(plines) == 1:  # can be represented with a single Face3D
-            return [Face3D(plines[0].vertices[:-1])]
+            faces = [Face3D(plines[0].vertices[:-1])]
         else:  # need to separate holes from distinct Face3Ds
             faces = [Face3D(pl.vertices[:-1]) for pl in plines]
-            return Face3D.merge_faces_to_holes(faces, tolerance)
+            faces = Face3D.merge_faces_to_holes(faces, tolerance)
+        cache[('footprint', tolerance)] = tuple(faces)
+        return list(faces)
 
     def shade_representation(self, cap=False, tolerance=0.01):
         """A list of honeybee Shade objects representing the story geometry.
@@ -617,20 +636,27 @@ using-multipliers-zone-and-or-window.html
                 not considered touching. Default: 0.01, suitable for objects
                 in meters.
         """
-        context_shades = []
+        # get the extruded geometry, which is cached along with the outline
         extru_vec = Vector3D(0, 0, self.floor_to_floor_height * self.multiplier)
-        for i, seg in enumerate(self.outline_segments(tolerance)):
-            try:
-                extru_geo = Face3D.from_extrusion(seg, extru_vec)
-                shd_id = '{}_{}'.format(self.identifier, i)
-                context_shades.append(Shade(shd_id, extru_geo))
-            except ZeroDivisionError:
-                pass  # duplicate vertex resulting in a segment of length 0
-        if cap:
-            for i, s in enumerate(self.footprint(tolerance)):
-                shd_id = '{}_Top_{}'.format(self.identifier, i)
-                context_shades.append(Shade(shd_id, s.move(extru_vec)))
-        return context_shades
+        cache = self._geometry_cache()
+        key = ('shade', tolerance, cap, extru_vec.z)
+        try:
+            shade_geos = cache[key]
+        except KeyError:  # shade geometry not yet computed
+            shade_geos = []
+            for i, seg in enumerate(self.outline_segments(tolerance)):
+                try:
+                    extru_geo = Face3D.from_extrusion(seg, extru_vec)
+                    shade_geos.append((str(i), extru_geo))
+                except ZeroDivisionError:
+                    pass  # duplicate vertex resulting in a segment of length 0
+            if cap:
+                for i, s in enumerate(self.footprint(tolerance)):
+                    shade_geos.append(('Top_{}'.format(i), s.move(extru_vec)))
+            shade_geos = cache[key] = tuple(shade_geos)
+        # create the Shade objects from the geometry
+        return [Shade('{}_{}'.format(self.identifier, shd_id), geo)
+                for shd_id, geo in shade_geos]
 
     def shade_representation_multiplier(self, exclude_index=0, cap=False,
                                         tolerance=0.01):
@@ -690,10 +716,9 @@ using-multipliers-zone-and-or-window.html
             room_identifier: String for the identifier of the Room2D to be
                 retrieved from this story.
         """
-        for room in self._room_2ds:
-            if room.identifier == room_identifier:
-                return room
-        else:
+        try:
+            return self._room_2d_index()[room_identifier]
+        except KeyError:
             raise ValueError('Room2D "{}" was not found in the story "{}"'
                              '.'.format(room_identifier, self.identifier))
 
@@ -704,13 +729,11 @@ using-multipliers-zone-and-or-window.html
             room_identifier: Array of strings for the identifiers of the Room2D
                 to be retrieved from this Story.
         """
-        room_2ds = []
+        room_2ds, room_index = [], self._room_2d_index()
         for identifier in room_identifiers:
-            for room in self._room_2ds:
-                if room.identifier == identifier:
-                    room_2ds.append(room)
-                    break
-            else:
+            try:
+                room_2ds.append(room_index[identifier])
+            except KeyError:
                 raise ValueError('Room2D "{}" was not found in the story '
                                  '"{}".'.format(identifier, self.identifier))
         return room_2ds
@@ -733,11 +756,13 @@ using-multipliers-zone-and-or-window.html
                 characters for dragonfly identifiers.
         """
         self._identifier = clean_string('{}_{}'.format(prefix, self.identifier))
+        self._clear_parent_index()
         if self._display_name is not None:
             self.display_name = '{}_{}'.format(prefix, self.display_name)
         self.properties.add_prefix(prefix)
         for room in self.room_2ds:
             room.add_prefix(prefix)
+        self._identifier_index = None
 
     def add_room_2d(self, room_2d):
         """Add a Room2D to this Story.
@@ -1450,7 +1475,8 @@ using-multipliers-zone-and-or-window.html
                 at which they can be considered adjacent. (Default: 0.01,
                 suitable for objects in meters).
         """
-        self._room_2ds = Room2D.intersect_adjacency(self._room_2ds, tolerance)
+        self._room_2ds = Room2D.intersect_adjacency(
+            self._room_2ds, tolerance, partition=True)
 
     def solve_room_2d_adjacency(
             self, tolerance=0.01, intersect=False, resolve_window_conflicts=True):
@@ -1471,7 +1497,8 @@ using-multipliers-zone-and-or-window.html
                 larger are and assign them to the other segment. (Default: True).
         """
         if intersect:
-            self._room_2ds = Room2D.intersect_adjacency(self._room_2ds, tolerance)
+            self._room_2ds = Room2D.intersect_adjacency(
+                self._room_2ds, tolerance, partition=True)
         Room2D.solve_adjacency(self._room_2ds, tolerance, resolve_window_conflicts)
 
     def patch_missing_adjacencies(self):
@@ -1920,6 +1947,33 @@ using-multipliers-zone-and-or-window.html
             A string with the message or a list with a dictionary if detailed is True.
         """
         detailed = False if raise_exception else detailed
+        room_map = {}
+        for room in self._room_2ds:
+            try:
+                room_map[room.identifier].append((self, room))
+            except KeyError:
+                room_map[room.identifier] = [(self, room)]
+        msgs = self._missing_adjacency_msgs(room_map, detailed)
+        # report any errors
+        if detailed:
+            return msgs
+        full_msg = '\n '.join(msgs)
+        if raise_exception and len(msgs) != 0:
+            raise ValueError(full_msg)
+        return full_msg
+
+    def _missing_adjacency_msgs(self, room_map, detailed=False):
+        """Get a list of messages for the missing adjacencies of this Story.
+
+        Args:
+            room_map: A dictionary with Room2D identifiers as keys and lists of
+                (Story, Room2D) tuples as values. This can contain the Room2Ds
+                of other Stories (eg. all Room2Ds of a Model). Only the Room2Ds
+                of this Story are used to resolve adjacencies such that Room2Ds
+                of other Stories are still reported as missing.
+            detailed: Boolean for whether the returned items are dicts with error
+                info or strings with a message. (Default: False).
+        """
         # gather all of the Surface boundary conditions
         srf_bc_dict, rid_map = {}, {}
         for room in self._room_2ds:
@@ -1939,59 +1993,12 @@ using-multipliers-zone-and-or-window.html
         msgs = []
         for key, val in srf_bc_dict.items():
             rm_id = key[0]
-            for room in self._room_2ds:
-                if room.identifier == rm_id:
-                    try:
-                        rm_bc = room._boundary_conditions[key[1]]
-                        rm_w_par = room._window_parameters[key[1]]
-                    except IndexError:  # referenced wall segment does not exist
-                        try:
-                            r1, r2 = rid_map[val[0]], rid_map[rm_id]
-                        except KeyError:  # completely missing from the model
-                            r1, r2 = val[0], rm_id
-                        msg = 'Room "{}" has an adjacency referencing a missing ' \
-                            'wall segment on Room2D "{}".'.format(r1, r2)
-                        msg = self._validation_message_child(
-                            msg, val[3], detailed, '100203',
-                            error_type='Missing Adjacency')
-                        if detailed:
-                            msg['element_id'].append(room.identifier)
-                            msg['element_name'].append(room.display_name)
-                            msg['parents'].append(msg['parents'][0])
-                        msgs.append(msg)
-                        break
-                    if not isinstance(rm_bc, Surface):
-                        try:
-                            r1, r2 = rid_map[rm_id], rid_map[val[1]]
-                        except KeyError:  # completely missing from the model
-                            r1, r2 = rm_id, val[1]
-                        msg = 'Room "{}" does not have a Surface boundary condition ' \
-                            'at "{}" but its adjacent object does.'.format(r1, r2)
-                        msg = self._validation_message_child(
-                            msg, room, detailed, '100201',
-                            error_type='Mismatched Adjacency')
-                        if detailed:
-                            msg['element_id'].append(val[3].identifier)
-                            msg['element_name'].append(val[3].display_name)
-                            msg['parents'].append(msg['parents'][0])
-                        msgs.append(msg)
-                    if val[2] != rm_w_par:
-                        try:
-                            r1, r2 = rid_map[val[0]], rid_map[rm_id]
-                        except KeyError:  # completely missing from the model
-                            r1, r2 = val[0], rm_id
-                        msg = 'Window parameters do not match between ' \
-                            'adjacent Rooms "{}" and "{}".'.format(r1, r2)
-                        msg = self._validation_message_child(
-                            msg, room, detailed, '100202',
-                            error_type='Mismatched WindowParameter Adjacency')
-                        if detailed:
-                            msg['element_id'].append(val[3].identifier)
-                            msg['element_name'].append(val[3].display_name)
-                            msg['parents'].append(msg['parents'][0])
-                        msgs.append(msg)
+            room = None
+            for story, rm in room_map.get(rm_id, ()):
+                if story is self:
+                    room = rm
                     break
-            else:
+            if room is None:
                 try:
                     r1, r2 = rid_map[val[0]], rid_map[rm_id]
                 except KeyError:  # completely missing from the model
@@ -2001,13 +2008,55 @@ using-multipliers-zone-and-or-window.html
                 msg = self._validation_message_child(
                     msg, val[3], detailed, '100203', error_type='Missing Adjacency')
                 msgs.append(msg)
-        # report any errors
-        if detailed:
-            return msgs
-        full_msg = '\n '.join(msgs)
-        if raise_exception and len(msgs) != 0:
-            raise ValueError(full_msg)
-        return full_msg
+                continue
+            try:
+                rm_bc = room._boundary_conditions[key[1]]
+                rm_w_par = room._window_parameters[key[1]]
+            except IndexError:  # referenced wall segment does not exist
+                try:
+                    r1, r2 = rid_map[val[0]], rid_map[rm_id]
+                except KeyError:  # completely missing from the model
+                    r1, r2 = val[0], rm_id
+                msg = 'Room "{}" has an adjacency referencing a missing ' \
+                    'wall segment on Room2D "{}".'.format(r1, r2)
+                msg = self._validation_message_child(
+                    msg, val[3], detailed, '100203', error_type='Missing Adjacency')
+                if detailed:
+                    msg['element_id'].append(room.identifier)
+                    msg['element_name'].append(room.display_name)
+                    msg['parents'].append(msg['parents'][0])
+                msgs.append(msg)
+                continue
+            if not isinstance(rm_bc, Surface):
+                try:
+                    r1, r2 = rid_map[rm_id], rid_map[val[1]]
+                except KeyError:  # completely missing from the model
+                    r1, r2 = rm_id, val[1]
+                msg = 'Room "{}" does not have a Surface boundary condition ' \
+                    'at "{}" but its adjacent object does.'.format(r1, r2)
+                msg = self._validation_message_child(
+                    msg, room, detailed, '100201', error_type='Mismatched Adjacency')
+                if detailed:
+                    msg['element_id'].append(val[3].identifier)
+                    msg['element_name'].append(val[3].display_name)
+                    msg['parents'].append(msg['parents'][0])
+                msgs.append(msg)
+            if val[2] != rm_w_par:
+                try:
+                    r1, r2 = rid_map[val[0]], rid_map[rm_id]
+                except KeyError:  # completely missing from the model
+                    r1, r2 = val[0], rm_id
+                msg = 'Window parameters do not match between ' \
+                    'adjacent Rooms "{}" and "{}".'.format(r1, r2)
+                msg = self._validation_message_child(
+                    msg, room, detailed, '100202',
+                    error_type='Mismatched WindowParameter Adjacency')
+                if detailed:
+                    msg['element_id'].append(val[3].identifier)
+                    msg['element_name'].append(val[3].display_name)
+                    msg['parents'].append(msg['parents'][0])
+                msgs.append(msg)
+        return msgs
 
     def check_no_room2d_overlaps(
             self, tolerance=0.01, raise_exception=True, detailed=False):
@@ -2031,51 +2080,49 @@ using-multipliers-zone-and-or-window.html
         detailed = False if raise_exception else detailed
         # find the number of overlaps across the Room2Ds
         msgs = []
-        rooms = self.room_2ds
-        for i, room_1 in enumerate(rooms):
-            # first check whether the boundaries of the rooms overlap
+        rooms = self._room_2ds
+        # only check the rooms with bounding rectangles that overlap
+        for i, j in self._overlapping_room_2d_pairs(rooms, None, tolerance):
+            room_1, room_2 = rooms[i], rooms[j]
+            # check whether the boundaries of the rooms overlap
             poly_1 = room_1.floor_geometry.boundary_polygon2d
-            try:
-                for room_2 in rooms[i + 1:]:
-                    poly_2 = room_2.floor_geometry.boundary_polygon2d
-                    if poly_1.polygon_relationship(poly_2, tolerance) >= 0:
-                        # check that one room is not inside the hole of another
-                        inside_hole = False
-                        if room_1.floor_geometry.has_holes:
-                            for hole in room_1.floor_geometry.hole_polygon2d:
-                                if hole.polygon_relationship(poly_2, tolerance) == 1:
-                                    inside_hole = True
-                                    break
-                        if not inside_hole and room_2.floor_geometry.has_holes:
-                            for hole in room_2.floor_geometry.hole_polygon2d:
-                                if hole.polygon_relationship(poly_1, tolerance) == 1:
-                                    inside_hole = True
-                                    break
-                        # if the room is not in a hole, then they overlap
-                        if not inside_hole:
-                            msg = 'Room "{}" overlaps with Room2D "{}" more than ' \
-                                'the tolerance ({}) on Story "{}".'.format(
-                                    room_1.display_name, room_2.display_name,
-                                    tolerance, self.display_name)
-                            msg = self._validation_message_child(
-                                msg, room_1, detailed, '100104',
-                                error_type='Overlapping Room Geometries')
-                            if detailed:
-                                msg['element_id'].append(room_2.identifier)
-                                msg['element_name'].append(room_2.display_name)
-                                msg['parents'].append(msg['parents'][0])
-                                m_z = room_1.floor_geometry[0].z - \
-                                    room_2.floor_geometry[0].z
-                                m_vec = Vector3D(0, 0, m_z)
-                                room_2_geo = room_2.floor_geometry.move(m_vec)
-                                help_geo = Face3D.coplanar_intersection(
-                                    room_1.floor_geometry, room_2_geo, tolerance, 0.017)
-                                if help_geo is not None:
-                                    msg['helper_geometry'] = \
-                                        [f.to_dict() for f in help_geo]
-                            msgs.append(msg)
-            except IndexError:
-                pass  # we have reached the end of the list
+            poly_2 = room_2.floor_geometry.boundary_polygon2d
+            if poly_1.polygon_relationship(poly_2, tolerance) >= 0:
+                # check that one room is not inside the hole of another
+                inside_hole = False
+                if room_1.floor_geometry.has_holes:
+                    for hole in room_1.floor_geometry.hole_polygon2d:
+                        if hole.polygon_relationship(poly_2, tolerance) == 1:
+                            inside_hole = True
+                            break
+                if not inside_hole and room_2.floor_geometry.has_holes:
+                    for hole in room_2.floor_geometry.hole_polygon2d:
+                        if hole.polygon_relationship(poly_1, tolerance) == 1:
+                            inside_hole = True
+                            break
+                # if the room is not in a hole, then they overlap
+                if not inside_hole:
+                    msg = 'Room "{}" overlaps with Room2D "{}" more than ' \
+                        'the tolerance ({}) on Story "{}".'.format(
+                            room_1.display_name, room_2.display_name,
+                            tolerance, self.display_name)
+                    msg = self._validation_message_child(
+                        msg, room_1, detailed, '100104',
+                        error_type='Overlapping Room Geometries')
+                    if detailed:
+                        msg['element_id'].append(room_2.identifier)
+                        msg['element_name'].append(room_2.display_name)
+                        msg['parents'].append(msg['parents'][0])
+                        m_z = room_1.floor_geometry[0].z - \
+                            room_2.floor_geometry[0].z
+                        m_vec = Vector3D(0, 0, m_z)
+                        room_2_geo = room_2.floor_geometry.move(m_vec)
+                        help_geo = Face3D.coplanar_intersection(
+                            room_1.floor_geometry, room_2_geo, tolerance, 0.017)
+                        if help_geo is not None:
+                            msg['helper_geometry'] = \
+                                [f.to_dict() for f in help_geo]
+                    msgs.append(msg)
         # report any errors
         if detailed:
             return msgs
@@ -2150,65 +2197,67 @@ using-multipliers-zone-and-or-window.html
         detailed = False if raise_exception else detailed
         # find the collisions across the Room2Ds
         msgs = []
-        for room_1 in self.room_2ds:
-            fh1, ch1 = room_1.floor_height, room_1.ceiling_height
-            poly_1 = room_1.floor_geometry.boundary_polygon2d
+        rooms_1, rooms_2 = self._room_2ds, other_story._room_2ds
+        # only check the rooms with bounding rectangles that overlap
+        for i, j in self._overlapping_room_2d_pairs(rooms_1, rooms_2, tolerance):
+            room_1, room_2 = rooms_1[i], rooms_2[j]
             # first check whether the rooms have any vertical overlap
-            for room_2 in other_story.room_2ds:
-                fh2, ch2 = room_2.floor_height, room_2.ceiling_height
-                v_overlap = 0
-                if fh1 < fh2 and ch1 - tolerance > fh2:
-                    v_overlap = ch1 - fh2
-                elif fh2 < fh1 and ch2 - tolerance > fh1:
-                    v_overlap = ch2 - fh1
-                if v_overlap != 0:
-                    # check whether the boundaries of the rooms overlap
-                    poly_2 = room_2.floor_geometry.boundary_polygon2d
-                    if poly_1.polygon_relationship(poly_2, tolerance) >= 0:
-                        # check that one room is not inside the hole of another
-                        inside_hole = False
-                        if room_1.floor_geometry.has_holes:
-                            for hole in room_1.floor_geometry.hole_polygon2d:
-                                if hole.polygon_relationship(poly_2, tolerance) == 1:
-                                    inside_hole = True
-                                    break
-                        if not inside_hole and room_2.floor_geometry.has_holes:
-                            for hole in room_2.floor_geometry.hole_polygon2d:
-                                if hole.polygon_relationship(poly_1, tolerance) == 1:
-                                    inside_hole = True
-                                    break
-                        # if the room is not in a hole, then they collide
-                        if not inside_hole:
-                            msg = 'Room "{}" on Story "{}" collides with Room2D "{}"' \
-                                ' on Story "{}" with a vertical overlap of {}.'.format(
-                                    room_1.display_name, self.display_name,
-                                    room_2.display_name, other_story.display_name,
-                                    v_overlap)
-                            msg = self._validation_message_child(
-                                msg, room_1, detailed, '100108',
-                                error_type='Colliding Rooms Between Stories')
-                            if detailed:
-                                msg['element_id'].append(room_2.identifier)
-                                msg['element_name'].append(room_2.display_name)
-                                msg['parents'].append(msg['parents'][0])
-                                if fh1 > fh2:
-                                    m_z = room_1.floor_geometry[0].z - \
-                                        room_2.floor_geometry[0].z
-                                    m_vec = Vector3D(0, 0, m_z)
-                                    room_1_geo = room_1.floor_geometry
-                                    room_2_geo = room_2.floor_geometry.move(m_vec)
-                                else:
-                                    m_z = room_2.floor_geometry[0].z - \
-                                        room_1.floor_geometry[0].z
-                                    m_vec = Vector3D(0, 0, m_z)
-                                    room_1_geo = room_1.floor_geometry.move(m_vec)
-                                    room_2_geo = room_2.floor_geometry
-                                help_geo = Face3D.coplanar_intersection(
-                                    room_1_geo, room_2_geo, tolerance, 0.017)
-                                if help_geo is not None:
-                                    msg['helper_geometry'] = \
-                                        [f.to_dict() for f in help_geo]
-                            msgs.append(msg)
+            fh1, ch1 = room_1.floor_height, room_1.ceiling_height
+            fh2, ch2 = room_2.floor_height, room_2.ceiling_height
+            v_overlap = 0
+            if fh1 < fh2 and ch1 - tolerance > fh2:
+                v_overlap = ch1 - fh2
+            elif fh2 < fh1 and ch2 - tolerance > fh1:
+                v_overlap = ch2 - fh1
+            if v_overlap != 0:
+                # check whether the boundaries of the rooms overlap
+                poly_1 = room_1.floor_geometry.boundary_polygon2d
+                poly_2 = room_2.floor_geometry.boundary_polygon2d
+                if poly_1.polygon_relationship(poly_2, tolerance) >= 0:
+                    # check that one room is not inside the hole of another
+                    inside_hole = False
+                    if room_1.floor_geometry.has_holes:
+                        for hole in room_1.floor_geometry.hole_polygon2d:
+                            if hole.polygon_relationship(poly_2, tolerance) == 1:
+                                inside_hole = True
+                                break
+                    if not inside_hole and room_2.floor_geometry.has_holes:
+                        for hole in room_2.floor_geometry.hole_polygon2d:
+                            if hole.polygon_relationship(poly_1, tolerance) == 1:
+                                inside_hole = True
+                                break
+                    # if the room is not in a hole, then they collide
+                    if not inside_hole:
+                        msg = 'Room "{}" on Story "{}" collides with Room2D "{}"' \
+                            ' on Story "{}" with a vertical overlap of {}.'.format(
+                                room_1.display_name, self.display_name,
+                                room_2.display_name, other_story.display_name,
+                                v_overlap)
+                        msg = self._validation_message_child(
+                            msg, room_1, detailed, '100108',
+                            error_type='Colliding Rooms Between Stories')
+                        if detailed:
+                            msg['element_id'].append(room_2.identifier)
+                            msg['element_name'].append(room_2.display_name)
+                            msg['parents'].append(msg['parents'][0])
+                            if fh1 > fh2:
+                                m_z = room_1.floor_geometry[0].z - \
+                                    room_2.floor_geometry[0].z
+                                m_vec = Vector3D(0, 0, m_z)
+                                room_1_geo = room_1.floor_geometry
+                                room_2_geo = room_2.floor_geometry.move(m_vec)
+                            else:
+                                m_z = room_2.floor_geometry[0].z - \
+                                    room_1.floor_geometry[0].z
+                                m_vec = Vector3D(0, 0, m_z)
+                                room_1_geo = room_1.floor_geometry.move(m_vec)
+                                room_2_geo = room_2.floor_geometry
+                            help_geo = Face3D.coplanar_intersection(
+                                room_1_geo, room_2_geo, tolerance, 0.017)
+                            if help_geo is not None:
+                                msg['helper_geometry'] = \
+                                    [f.to_dict() for f in help_geo]
+                        msgs.append(msg)
         # report any errors
         if detailed:
             return msgs
@@ -2413,43 +2462,20 @@ using-multipliers-zone-and-or-window.html
         # convert all of the Room2Ds to honeybee Rooms
         hb_rooms = []
         adjacencies = []
-        for room in self._room_2ds:
-            hb_room, adj = room.to_honeybee(mult, tolerance=tolerance,
-                                            enforce_bc=enforce_adj,
-                                            enforce_solid=enforce_solid)
-            hb_rooms.append(hb_room)
-            adjacencies.extend(adj)
+        self._roof_cache = {}  # share resolved roofs across the Room2Ds
+        try:
+            for room in self._room_2ds:
+                hb_room, adj = room.to_honeybee(mult, tolerance=tolerance,
+                                                enforce_bc=enforce_adj,
+                                                enforce_solid=enforce_solid)
+                hb_rooms.append(hb_room)
+                adjacencies.extend(adj)
+        finally:
+            self._roof_cache = None
 
         # assign adjacent boundary conditions that could not be set on the room level
         if len(adjacencies) != 0:
-            adj_set = set()
-            for adj in adjacencies:
-                if adj[0].identifier not in adj_set:
-                    for room in hb_rooms:
-                        adj_room = adj[1][-1]
-                        if room.identifier == adj_room:
-                            for face in room.faces:
-                                adj_face = adj[1][-2]
-                                if face.identifier == adj_face:
-                                    self._match_apertures(adj[0], face)
-                                    other_resolve = False
-                                    if self.roof is not None:  # two roofs may meet
-                                        tol_area = math.sqrt(face.area) * tolerance
-                                        if abs(face.area - adj[0].area) > tol_area:
-                                            self._resolve_roof_adj(
-                                                face, adj[0], tolerance)
-                                            other_resolve = True
-                                    if not other_resolve:
-                                        try:
-                                            adj[0].set_adjacency(face, tolerance)
-                                        except (AssertionError, ValueError) as e:
-                                            if enforce_adj:
-                                                raise e
-                                            face.boundary_condition = bcs.outdoors
-                                            adj[0].boundary_condition = bcs.outdoors
-                                    adj_set.add(face.identifier)
-                                    break
-                            break
+            self._set_honeybee_adjacencies(hb_rooms, adjacencies, tolerance, enforce_adj)
         # put back the original roof to avoid mutating the story
         if original_roof is not None:
             self.roof = original_roof
@@ -2510,6 +2536,74 @@ using-multipliers-zone-and-or-window.html
         avg_ftc = sum([rm.floor_to_ceiling_height for rm in room_2ds]) / len(room_2ds)
         return True if flr_hts[-1] - flr_hts[0] < avg_ftc else False
 
+    def _room_2d_index(self):
+        """Get a dictionary of the Room2Ds in this Story with identifiers as keys.
+
+        The dictionary is only rebuilt when the Room2Ds of the Story have changed
+        or one of them has been renamed since the last time it was requested.
+        If several Room2Ds share an identifier, the first one is in the dictionary.
+        """
+        index = self._identifier_index
+        if index is None or index[0] is not self._room_2ds:
+            room_index = {}
+            for room in self._room_2ds:
+                if room._identifier not in room_index:
+                    room_index[room._identifier] = room
+            index = self._identifier_index = (self._room_2ds, room_index)
+        return index[1]
+
+    def _geometry_cache(self):
+        """Get a dictionary to cache geometry derived from the floors of the Room2Ds.
+
+        The dictionary is cleared whenever the Room2Ds of the Story, their floor
+        geometry or the floor_height of the Story have changed since the last
+        time it was requested. Keys of the dictionary are tuples that start
+        with the type of geometry followed by the inputs used to compute it.
+        """
+        floors = tuple(room._floor_geometry for room in self._room_2ds)
+        flr_hgt = self._floor_height
+        cache = self._outline_cache
+        if cache is None or cache[0] is not self._room_2ds or cache[1] != flr_hgt \
+                or any(f1 is not f2 for f1, f2 in zip(cache[2], floors)):
+            cache = self._outline_cache = (self._room_2ds, flr_hgt, floors, {})
+        return cache[3]
+
+    @staticmethod
+    def _overlapping_room_2d_pairs(room_2ds, other_room_2ds=None, tolerance=0.01):
+        """Get the pairs of Room2Ds with bounding rectangles that overlap.
+
+        This is used as a broad phase before checking whether Room2D polygons
+        overlap one another, ensuring that the more computationally intense
+        polygon relationship is only evaluated for Room2Ds in close proximity.
+
+        Args:
+            room_2ds: A list of Room2Ds for which overlapping pairs will be found.
+            other_room_2ds: An optional list of other Room2Ds. If None, the pairs
+                will be found between the room_2ds themselves. Otherwise, the pairs
+                will be between the room_2ds and these other Room2Ds. (Default: None).
+            tolerance: The distance within which bounding rectangles are considered
+                to be overlapping. (Default: 0.01, suitable for objects in meters).
+
+        Returns:
+            A list of tuples with two integers for each pair of overlapping Room2Ds.
+            The first integer is the index in the room_2ds and the second is the
+            index in the other_room_2ds (or in the room_2ds if other_room_2ds is
+            None, in which case the first index is always lower). The pairs are
+            sorted such that they follow the order of looping through the input
+            Room2Ds with a nested loop.
+        """
+        polys_1 = [room._floor_geometry.boundary_polygon2d for room in room_2ds]
+        if other_room_2ds is None:
+            if len(polys_1) < 2:
+                return []
+            return RectangleGrid.from_polygons(polys_1).overlapping_pairs(tolerance)
+        polys_2 = [room._floor_geometry.boundary_polygon2d for room in other_room_2ds]
+        if len(polys_1) == 0 or len(polys_2) == 0:
+            return []
+        grid = RectangleGrid.from_polygons(polys_2)
+        return [(i, j) for i, poly in enumerate(polys_1)
+                for j in grid.query_polygon(poly, tolerance)]
+
     def _room_roofs(self, room_2d, tolerance):
         """Get a RoofSpecification to be used for a specific Room2D in the Story.
 
@@ -2521,13 +2615,15 @@ using-multipliers-zone-and-or-window.html
                 will be evaluated.
         """
         # first check whether it's possible for the room to be shaped by a roof
-        if not room_2d.is_top_exposed or self.multiplier != 1:
+        view_index = self._view_index
+        if not room_2d.is_top_exposed or \
+                (self.multiplier != 1 and view_index is None):
             return None  # it's impossible for the room to be shaped by a roof
         # determine all roof specifications that can influence the Room2D
         room_roofs = []
         if self._roof is not None:
             room_roofs.append(self._roof)
-        if self._parent is not None:
+        if self._parent is not None and not view_index:  # no prefixed story views
             room_ch = room_2d.ceiling_height
             story_roofs = self._parent._story_roofs(self)
             for hgt, rf in story_roofs:
@@ -2536,24 +2632,101 @@ using-multipliers-zone-and-or-window.html
         # if there is only one or no roofs, the solution is simple
         if len(room_roofs) == 0:
             return None  # no relevant roofs were found
-        if len(room_roofs) == 1:  # just return a variation of the lone roof
-            if room_roofs[0]._is_resolved:
-                return room_roofs[0]
-            else:  # the roof of another story; we must resolve it
-                res_roof_geo = room_roofs[0].resolved_geometry(tolerance)
-                res_roof = RoofSpecification(
-                    res_roof_geo, room_roofs[0].clerestory_parameters)
-                res_roof._is_resolved = True
-                return res_roof
-        # if we have multiple roofs, create a new roof with everything resolved
-        all_geo = [g for roof in room_roofs for g in roof]
-        all_clear = [cp for roof in room_roofs for cp in roof.clerestory_parameters]
-        base_roof = RoofSpecification(all_geo, all_clear)
-        res_roof_geo = base_roof.resolved_geometry(tolerance)
-        res_roof = RoofSpecification(res_roof_geo, all_clear)
+        if len(room_roofs) == 1 and room_roofs[0]._is_resolved:
+            return room_roofs[0]
+        # check whether the same roofs were already resolved for another Room2D
+        roof_cache = self._roof_cache
+        if roof_cache is not None:
+            key = (tolerance, tuple(room_roofs))
+            geos = tuple(roof._geometry for roof in room_roofs)
+            try:
+                cached_geos, res_roof = roof_cache[key]
+                if all(g1 is g2 for g1, g2 in zip(cached_geos, geos)):
+                    return res_roof
+            except KeyError:  # roofs not yet resolved
+                pass
+        if len(room_roofs) == 1:  # the roof of another story; we must resolve it
+            res_roof_geo = room_roofs[0].resolved_geometry(tolerance)
+            res_roof = RoofSpecification(
+                res_roof_geo, room_roofs[0].clerestory_parameters)
+        else:  # if we have multiple roofs, create a new roof with everything resolved
+            all_geo = [g for roof in room_roofs for g in roof]
+            all_clear = [cp for roof in room_roofs for cp in roof.clerestory_parameters]
+            base_roof = RoofSpecification(all_geo, all_clear)
+            res_roof_geo = base_roof.resolved_geometry(tolerance)
+            res_roof = RoofSpecification(res_roof_geo, all_clear)
         res_roof._is_resolved = True
+        if roof_cache is not None:
+            roof_cache[key] = (geos, res_roof)
         return res_roof
 
+    def _set_honeybee_adjacencies(self, hb_rooms, adjacencies, tolerance=0.01,
+                                  enforce_adj=True):
+        """Set adjacencies between Honeybee Rooms that could not be set by the Room2Ds.
+
+        Rooms and Faces are found through dictionaries keyed by identifier such
+        that the time to set each adjacency does not grow with the number of
+        Rooms in the Story. This stage of the translation is its own method
+        so that its cost can be seen separately when profiling translation.
+
+        Args:
+            hb_rooms: A list of Honeybee Rooms that were translated from this Story.
+            adjacencies: A list of tuples returned from Room2D.to_honeybee.
+                Each tuple contains a Face followed by the boundary condition
+                objects of its adjacent Face, ending with the adjacent Face
+                identifier and then the adjacent Room identifier.
+            tolerance: The minimum difference between coordinate values at
+                which faces are considered adjacent. (Default: 0.01).
+            enforce_adj: Boolean to note whether an exception should be raised
+                if an adjacency is invalid (True) or if the Faces should be given
+                Outdoor boundary conditions (False). (Default: True).
+        """
+        room_map, face_maps = {}, {}
+        for room in hb_rooms:
+            if room.identifier not in room_map:
+                room_map[room.identifier] = room
+        adj_set = set()
+        for adj in adjacencies:
+            if adj[0].identifier in adj_set:
+                continue
+            try:
+                room = room_map[adj[1][-1]]
+            except KeyError:  # the adjacent Room is not in the Story
+                continue
+            try:
+                faces = face_maps[room.identifier]
+            except KeyError:
+                faces = {}
+                for face in room.faces:
+                    if face.identifier not in faces:
+                        faces[face.identifier] = face
+                face_maps[room.identifier] = faces
+            try:
+                face = faces[adj[1][-2]]
+            except KeyError:  # the adjacent Face is not in the Room
+                continue
+            self._match_apertures(adj[0], face)
+            other_resolve = False
+            if self.roof is not None:  # two roofs may meet
+                tol_area = math.sqrt(face.area) * tolerance
+                if abs(face.area - adj[0].area) > tol_area:
+                    split_rooms = (room, adj[0].parent)
+                    self._resolve_roof_adj(face, adj[0], tolerance)
+                    other_resolve = True
+                    # the faces of the Rooms were split so they must be mapped again
+                    for rm in split_rooms:
+                        if rm is not None:
+                            face_maps.pop(rm.identifier, None)
+            if not other_resolve:
+                try:
+                    adj[0].set_adjacency(face, tolerance)
+                except (AssertionError, ValueError) as e:
+                    if enforce_adj:
+                        raise e
+                    face.boundary_condition = bcs.outdoors
+                    adj[0].boundary_condition = bcs.outdoors
+            adj_set.add(face.identifier)
+
     @staticmethod
     def _match_apertures(face_1, face2):
         for ap1, ap2 in zip(face_1.apertures, face2.apertures):
@@ -2665,3 +2838,406 @@ using-multipliers-zone-and-or-window.html
 
     def __repr__(self):
         return 'Story: %s' % self.display_name
+
+
+class OffsetStoryView(object):
+    """A lightweight view of a Story that is repeated at a higher floor.
+
+    The view shares the Room2Ds, window parameters, roof and properties of its
+    base Story and it only stores the number of floors by which it is offset.
+    Its identifier, floor_height and other basic attributes are computed from
+    the base Story using the identifier prefix and Z offset of the floor. When
+    the view is translated to Honeybee, the Rooms are translated from the Room2Ds
+    of the base Story and then they are prefixed and moved to the floor of
+    the view such that no Room2Ds are copied.
+
+    A real Story (with a multiplier of 1, prefixed identifiers and geometry moved
+    by the offset) is only created when the view is edited (by setting one of
+    its properties or calling one of the Story methods that edit geometry) or
+    when its Room2Ds are requested. This Story is stored on the view such that
+    all edits to the view are applied to it and the base Story is never changed.
+
+    Args:
+        story: The base dragonfly Story that is repeated.
+        floor_index: An integer for the number of floors by which the view is
+            offset from the base Story. If 0, the view represents the base
+            Story itself (with its multiplier set to 1). (Default: 0).
+
+    Properties:
+        * base_story
+        * floor_index
+        * is_edited
+        * prefix
+        * offset
+        * identifier
+        * display_name
+        * full_id
+        * multiplier
+        * floor_to_floor_height
+        * floor_height
+        * type
+        * is_plenum
+        * has_plenums
+        * room_2ds
+        * roof
+        * floor_area
+        * exterior_wall_area
+        * exterior_aperture_area
+        * volume
+        * parent
+        * has_parent
+        * properties
+        * user_data
+    """
+    __slots__ = ('_base_story', '_floor_index', '_story')
+
+    def __init__(self, story, floor_index=0):
+        assert isinstance(story, Story), \
+            'Expected dragonfly Story. Got {}'.format(type(story))
+        self._base_story = story
+        self._floor_index = int(floor_index)
+        self._story = None  # real Story that is set once the view is edited
+
+    @property
+    def base_story(self):
+        """Get the Story that this view is derived from."""
+        return self._base_story
+
+    @property
+    def floor_index(self):
+        """Get an integer for the number of floors by which the base Story is offset.
+        """
+        return self._floor_index
+
+    @property
+    def is_edited(self):
+        """Get a boolean for whether a real Story has been created for the view.
+
+        This is True once the view has been edited or its Room2Ds have been
+        requested and, from then on, all attributes of the view are taken from
+        the real Story.
+        """
+        return self._story is not None
+
+    @property
+    def prefix(self):
+        """Get text for the identifier prefix of the view or None if it has no prefix.
+        """
+        if self._floor_index == 0:
+            return None
+        return 'Flr{}'.format(self._floor_index)
+
+    @property
+    def offset(self):
+        """Get a Vector3D for the offset of the view from the base Story."""
+        return Vector3D(
+            0, 0, self._base_story.floor_to_floor_height * self._floor_index)
+
+    @property
+    def identifier(self):
+        """Get text for the unique identifier of the Story."""
+        if self._story is not None:
+            return self._story.identifier
+        if self._floor_index == 0:
+            return self._base_story.identifier
+        return clean_string('{}_{}'.format(self.prefix, self._base_story.identifier))
+
+    @property
+    def display_name(self):
+        """Get text for the name of the Story without any character restrictions."""
+        if self._story is not None:
+            return self._story.display_name
+        if self._floor_index == 0:
+            return self._base_story.display_name
+        if self._base_story._display_name is None:
+            return self.identifier
+        return '{}_{}'.format(self.prefix, self._base_story._display_name)
+
+    @property
+    def full_id(self):
+        """Get a string with both the object display_name and identifier."""
+        return '{}[{}]'.format(self.display_name, self.identifier)
+
+    @property
+    def multiplier(self):
+        """Get an integer for the multiplier of the Story."""
+        if self._story is not None:
+            return self._story.multiplier
+        return 1
+
+    @property
+    def floor_to_floor_height(self):
+        """Get a number for the distance from this Story to the Story above it."""
+        if self._story is not None:
+            return self._story.floor_to_floor_height
+        return self._base_story.floor_to_floor_height
+
+    @property
+    def floor_height(self):
+        """Get a number for the absolute floor height of the Story."""
+        if self._story is not None:
+            return self._story.floor_height
+        return self._base_story.floor_height + self.offset.z
+
+    @property
+    def type(self):
+        """Get text for the type of story that the view represents."""
+        if self._story is not None:
+            return self._story.type
+        return self._base_story.type
+
+    @property
+    def is_plenum(self):
+        """Get a boolean for whether the Room2Ds of the Story represent plenums."""
+        if self._story is not None:
+            return self._story.is_plenum
+        return self._base_story.is_plenum
+
+    @property
+    def has_plenums(self):
+        """Get a boolean for whether Room2Ds on this Story have assigned plenum depths.
+        """
+        if self._story is not None:
+            return self._story.has_plenums
+        return self._base_story.has_plenums
+
+    @property
+    def room_2ds(self):
+        """Get a tuple of the Room2Ds of the real Story represented by the view.
+
+        Since Room2Ds can be edited, requesting them creates the real Story.
+        """
+        return self.to_story().room_2ds
+
+    @property
+    def roof(self):
+        """Get the RoofSpecification of the real Story represented by the view.
+
+        Since the roof can be edited, requesting it creates the real Story.
+        """
+        return self.to_story().roof
+
+    @property
+    def floor_area(self):
+        """Get a number for the total floor area in the Story."""
+        if self._story is not None:
+            return self._story.floor_area
+        return self._base_story.floor_area
+
+    @property
+    def exterior_wall_area(self):
+        """Get a number for the total exterior wall area for the Story."""
+        if self._story is not None:
+            return self._story.exterior_wall_area
+        return self._base_story.exterior_wall_area
+
+    @property
+    def exterior_aperture_area(self):
+        """Get a number for the total exterior aperture area for the Story."""
+        if self._story is not None:
+            return self._story.exterior_aperture_area
+        return self._base_story.exterior_aperture_area
+
+    @property
+    def volume(self):
+        """Get a number for the volume of all the Room2Ds in the Story."""
+        if self._story is not None:
+            return self._story.volume
+        return self._base_story.volume
+
+    @property
+    def parent(self):
+        """Get the parent Building of the base Story if assigned. None if not."""
+        if self._story is not None:
+            return self._story.parent
+        return self._base_story.parent
+
+    @property
+    def has_parent(self):
+        """Get a boolean noting whether the Story has a parent Building."""
+        return self.parent is not None
+
+    @property
+    def properties(self):
+        """Get the properties of the real Story represented by the view.
+
+        Since the properties can be edited, requesting them creates the real Story.
+        """
+        return self.to_story().properties
+
+    @property
+    def user_data(self):
+        """Get the user_data of the real Story represented by the view.
+
+        Since the user_data can be edited, requesting it creates the real Story.
+        """
+        return self.to_story().user_data
+
+    def to_story(self):
+        """Get the real Story that is represented by this view.
+
+        The Story has a multiplier of 1, identifiers prefixed with the prefix
+        of the view and geometry moved by the offset of the view. It is created
+        upon the first call and it is stored on the view such that later calls
+        (and all edits to the view) use the same Story.
+        """
+        if self._story is None:
+            self._story = self._new_story()
+        return self._story
+
+    def duplicate(self):
+        """Get a new Story that is represented by this view."""
+        if self._story is not None:
+            return self._story.duplicate()
+        return self._new_story()
+
+    def to_honeybee(self, use_multiplier=True, tolerance=0.01,
+                    enforce_adj=True, enforce_solid=True):
+        """Convert the Story represented by this view to a list of Honeybee Rooms.
+
+        If the view has not been edited, the Rooms are translated from the Room2Ds
+        of the base Story and they are then prefixed and moved to the floor of
+        the view without copying any of the Room2Ds.
+
+        Args:
+            use_multiplier: Boolean to note whether the Story's multiplier should
+                be passed along to the generated Honeybee Rooms. Since views
+                have a multiplier of 1 unless they are edited, this typically
+                has no effect. (Default: True).
+            tolerance: The minimum distance in z values of floor_height and
+                floor_to_ceiling_height at which adjacent Faces will be split.
+                (Default: 0.01, suitable for objects in meters).
+            enforce_adj: Boolean to note whether an exception should be raised if
+                an adjacency between two Room2Ds is invalid. (Default: True).
+            enforce_solid: Boolean to note whether rooms should be translated
+                as solid extrusions whenever translating them with custom
+                roof geometry produces a non-solid result. (Default: True).
+
+        Returns:
+            A list of honeybee Rooms that represent the Story.
+        """
+        if self._story is not None:
+            return self._story.to_honeybee(
+                use_multiplier, tolerance, enforce_adj, enforce_solid)
+        base_story = self._base_story
+        base_story._view_index = self._floor_index
+        try:
+            hb_rooms = base_story.to_honeybee(
+                False, tolerance, enforce_adj, enforce_solid)
+        finally:
+            base_story._view_index = None
+        if self._floor_index != 0:
+            prefix, offset, story_name = self.prefix, self.offset, self.display_name
+            for hb_room in hb_rooms:
+                OffsetStoryView._add_prefix_to_room(hb_room, prefix)
+                hb_room.move(offset)
+                hb_room.story = story_name
+        return hb_rooms
+
+    def to_dict(self, abridged=False, included_prop=None):
+        """Return the Story represented by this view as a dictionary.
+
+        Args:
+            abridged: Boolean to note whether the extension properties of the
+                object should be included in detail (False) or just referenced
+                by identifier (True). (Default: False).
+            included_prop: List of properties to filter keys that must be included
+                in output dictionary. (Default: None).
+        """
+        story = self._story if self._story is not None else self._new_story()
+        return story.to_dict(abridged, included_prop)
+
+    def _new_story(self):
+        """Get a new Story with the prefix and offset of this view applied to it."""
+        new_story = self._base_story.duplicate()
+        new_story.multiplier = 1
+        if self._floor_index != 0:
+            new_story.add_prefix(self.prefix)
+            new_story.move(self.offset)
+        return new_story
+
+    @staticmethod
+    def _add_prefix_to_room(hb_room, prefix):
+        """Add a prefix to a Honeybee Room translated from the base Story.
+
+        Objects without a display_name keep using their identifier as their
+        display_name, like the Rooms translated from a prefixed Story.
+        """
+        objs = [hb_room]
+        objs.extend(hb_room.shades)
+        for face in hb_room.faces:
+            objs.append(face)
+            objs.extend(face.shades)
+            for sub_f in face.apertures + face.doors:
+                objs.append(sub_f)
+                objs.extend(sub_f.shades)
+        unnamed = [obj for obj in objs if obj._display_name is None]
+        hb_room.add_prefix(prefix)
+        for obj in unnamed:
+            obj._display_name = None
+
+    def __getstate__(self):
+        return self._base_story, self._floor_index, self._story
+
+    def __setstate__(self, state):
+        self._base_story, self._floor_index, self._story = state
+
+    def __copy__(self):
+        new_v = OffsetStoryView(self._base_story, self._floor_index)
+        if self._story is not None:
+            new_v._story = self._story.duplicate()
+        return new_v
+
+    def __len__(self):
+        if self._story is not None:
+            return len(self._story)
+        return len(self._base_story)
+
+    def __getitem__(self, key):
+        return self.room_2ds[key]
+
+    def __iter__(self):
+        return iter(self.room_2ds)
+
+    def __repr__(self):
+        return 'OffsetStoryView: %s' % self.display_name
+
+
+def _edit_story_method(name):
+    """Get an OffsetStoryView method that edits the real Story of the view."""
+    story_method = getattr(Story, name)
+
+    def edit_method(self, *args, **kwargs):
+        return story_method(self.to_story(), *args, **kwargs)
+    edit_method.__name__ = name
+    edit_method.__doc__ = story_method.__doc__
+    return edit_method
+
+
+def _edit_story_setter(name):
+    """Get an OffsetStoryView property setter that edits the real Story of the view.
+    """
+    def edit_setter(self, value):
+        setattr(self.to_story(), name, value)
+    return edit_setter
+
+
+for _name in (
+        'add_prefix', 'add_room_2d', 'add_room_2ds', 'align_room_2ds', 'align',
+        'pull_to_story', 'remove_room_2d_duplicate_vertices',
+        'remove_room_2d_short_segments', 'delete_degenerate_room_2ds',
+        'join_small_room_2ds', 'fill_holes', 'join_room_2ds',
+        'modify_wall_properties', 'reset_adjacency', 'intersect_room_2d_adjacency',
+        'patch_missing_adjacencies', 'set_adjacent_air_boundary',
+        'set_outdoor_window_parameters', 'set_outdoor_shading_parameters',
+        'to_rectangular_windows', 'set_ground_contact', 'set_top_exposed',
+        'split_with_story_above', 'set_top_exposed_by_story_above',
+        'set_ground_contact_by_story_below', 'make_underground', 'make_aboveground',
+        'automatically_zone', 'move', 'rotate_xy', 'reflect', 'scale'):
+    setattr(OffsetStoryView, _name, _edit_story_method(_name))
+for _name in (
+        'identifier', 'display_name', 'room_2ds', 'floor_to_floor_height',
+        'floor_height', 'multiplier', 'roof', 'type', 'user_data'):
+    setattr(OffsetStoryView, _name,
+            getattr(OffsetStoryView, _name).setter(_edit_story_setter(_name)))
+del _name
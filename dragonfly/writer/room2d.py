@@ -4,3 +4,13 @@ Note to developers:
 Use this module to extend dragonfly's Room2D writer for new extensions.
 (eg. adding `rad` to this module adds the method `Room2D.to.rad`)
 """
+import sys as _sys
+
+import dragonfly as _dragonfly
+
+
+def __getattr__(name):
+    # load any pending extensions, which may add the requested writer to this module
+    if not name.startswith('_') and _dragonfly.load_extensions():
+        return getattr(_sys.modules[__name__], name)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
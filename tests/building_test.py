@@ -2,9 +2,10 @@
 import pytest
 
 from dragonfly.building import Building
-from dragonfly.story import Story
+from dragonfly.story import Story, OffsetStoryView
 from dragonfly.room2d import Room2D
 from dragonfly.roof import RoofSpecification
+from dragonfly.context import ContextShade
 from dragonfly.windowparameter import SimpleWindowRatio
 from dragonfly.shadingparameter import Overhang
 
@@ -46,7 +47,8 @@ def test_building_init():
         assert isinstance(story, Story)
         assert story.has_parent
     for story in building.all_stories():
-        assert isinstance(story, Story)
+        assert isinstance(story, OffsetStoryView)
+        assert isinstance(story.to_story(), Story)
         assert story.has_parent
     for room in building.unique_room_2ds:
         assert isinstance(room, Room2D)
@@ -68,6 +70,87 @@ def test_building_init():
     assert len(building.unique_room_2ds) == 16
 
 
+def test_building_story_views():
+    """Test that the Story views of a Building share the geometry of unique Stories."""
+    pts_1 = (Point3D(0, 0, 3), Point3D(0, 10, 3), Point3D(10, 10, 3), Point3D(10, 0, 3))
+    pts_2 = (Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(20, 10, 3), Point3D(20, 0, 3))
+    room2d_1 = Room2D('Office1', Face3D(pts_1), 3)
+    room2d_2 = Room2D('Office2', Face3D(pts_2), 3)
+    story = Story('Office_Floor', [room2d_1, room2d_2])
+    story.display_name = 'Office Floor'
+    story.solve_room_2d_adjacency(0.01)
+    story.set_outdoor_window_parameters(SimpleWindowRatio(0.4))
+    story.multiplier = 3
+    building = Building('Office_Building_1234', [story])
+    real_stories = [OffsetStoryView(story, i).to_story() for i in range(3)]
+
+    views = building.all_stories()
+    assert all(isinstance(st, OffsetStoryView) for st in views)
+    assert [st.identifier for st in views] == \
+        [st.identifier for st in real_stories] == \
+        ['Office_Floor', 'Flr1_Office_Floor', 'Flr2_Office_Floor']
+    assert [st.display_name for st in views] == \
+        [st.display_name for st in real_stories] == \
+        ['Office Floor', 'Flr1_Office Floor', 'Flr2_Office Floor']
+    assert [st.floor_height for st in views] == [3, 6, 9]
+    assert all(st.multiplier == 1 for st in views)
+
+    # check that all floors share the Room2Ds and window parameters of the story
+    base_win_par = room2d_1.window_parameters[1]
+    for view in views:
+        assert view.base_story is story
+        assert all(rm is b_rm for rm, b_rm in zip(view.base_story, story.room_2ds))
+        assert view.base_story[0].window_parameters[1] is base_win_par
+    assert views[1].base_story[1] is views[2].base_story[1] is room2d_2
+
+    # check that translation builds each floor without copying any Room2Ds
+    copy_func = Room2D.__copy__
+
+    def no_copy(room):
+        raise AssertionError('Room2D {} was copied.'.format(room.identifier))
+    Room2D.__copy__ = no_copy
+    try:
+        hb_rooms = [view.to_honeybee(False, 0.01) for view in views]
+    finally:
+        Room2D.__copy__ = copy_func
+    assert not any(view.is_edited for view in views)
+    assert [rm.identifier for rm in hb_rooms[2]] == ['Flr2_Office1', 'Flr2_Office2']
+    assert hb_rooms[2][0].min.z == pytest.approx(9, abs=1e-6)
+    assert room2d_1.floor_height == 3
+    for rms, real_story in zip(hb_rooms, real_stories):
+        real_rms = real_story.to_honeybee(False, 0.01)
+        assert [rm.identifier for rm in rms] == [rm.identifier for rm in real_rms]
+        assert [rm.story for rm in rms] == [rm.story for rm in real_rms]
+        for rm, real_rm in zip(rms, real_rms):
+            assert [f.display_name for f in rm.faces] == \
+                [f.display_name for f in real_rm.faces]
+            assert [str(f.boundary_condition) for f in rm.faces] == \
+                [str(f.boundary_condition) for f in real_rm.faces]
+            assert rm.volume == pytest.approx(real_rm.volume, abs=1e-6)
+            assert rm.min.z == pytest.approx(real_rm.min.z, abs=1e-6)
+    assert views[1].to_dict() == real_stories[1].to_dict()
+    assert not views[1].is_edited
+
+    # check that editing a view creates a Story without mutating the base
+    views[1].move(Vector3D(0, 0, 1))
+    views[2].multiplier = 2
+    assert views[1].is_edited and views[2].is_edited
+    assert views[1].floor_height == pytest.approx(7, abs=1e-6)
+    assert views[1].room_2ds[0].identifier == 'Flr1_Office1'
+    assert views[1].room_2ds[0] is not room2d_1
+    assert views[2].multiplier == 2
+    assert story.floor_height == 3 and story.multiplier == 3
+    assert room2d_1.floor_height == 3
+    assert not views[0].is_edited
+    with pytest.raises(AttributeError):
+        views[0].generate_grid(0.5)
+
+    # check that views are converted to real Stories when added to a Building
+    new_bldg = Building('Office_Building_5678', views)
+    assert all(type(st) is Story for st in new_bldg.unique_stories)
+    assert new_bldg.unique_stories[1] is views[1].to_story()
+
+
 def test_building_init_from_footprint():
     """Test the initialization of Building objects from_footprint."""
     pts_1 = (Point3D(0, 0, 0), Point3D(0, 10, 0), Point3D(10, 10, 0), Point3D(10, 0, 0))
@@ -935,6 +1018,40 @@ def test_buildings_to_honeybee():
     assert len(hb_models[0].orphaned_shades) == 5
 
 
+def test_buildings_to_honeybee_shade_distance():
+    """Test that context within the shade_distance is found using the grids."""
+    buildings, con_shades = [], []
+    for i in range(5):
+        for j in range(5):
+            x, y = i * 15, j * 25
+            pts = (Point3D(x, y, 0), Point3D(x + 10, y, 0),
+                   Point3D(x + 10, y + 10, 0), Point3D(x, y + 10, 0))
+            room = Room2D('Room_{}_{}'.format(i, j), Face3D(pts), 3)
+            story = Story('Story_{}_{}'.format(i, j), [room])
+            buildings.append(Building('Building_{}_{}'.format(i, j), [story]))
+            shd_pts = tuple(Point3D(pt.x, pt.y + 12, 5) for pt in pts)
+            con_shades.append(
+                ContextShade('Tree_{}_{}'.format(i, j), [Face3D(shd_pts)]))
+
+    shd_info = Building._honeybee_shades(buildings, con_shades, 6, False, 0.01)
+    bldg_shades, bldg_pts, c_shades, con_pts, grids = shd_info
+    assert grids is not None
+    for i in range(len(buildings)):
+        grid_model, full_model = Model('Grid'), Model('Full')
+        Building._add_context_to_honeybee(
+            grid_model, bldg_shades, bldg_pts, c_shades, con_pts, 6,
+            len(buildings), i, grids)
+        Building._add_context_to_honeybee(
+            full_model, bldg_shades, bldg_pts, c_shades, con_pts, 6,
+            len(buildings), i)
+        assert [shd.identifier for shd in grid_model.orphaned_shades] == \
+            [shd.identifier for shd in full_model.orphaned_shades]
+
+    hb_models = Building.buildings_to_honeybee(buildings, con_shades, 6)
+    assert len(hb_models[0].orphaned_shades) == 4 + 2
+    assert len(hb_models[12].orphaned_shades) == 2 * 4 + 6
+
+
 def test_to_dict():
     """Test the Building to_dict method."""
     pts_1 = (Point3D(0, 0, 2), Point3D(10, 0, 2), Point3D(10, 10, 2), Point3D(0, 10, 2))
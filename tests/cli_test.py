@@ -1,7 +1,9 @@
 """Test cli."""
+import click
 from click.testing import CliRunner
 
-from dragonfly.cli import viz
+import dragonfly
+from dragonfly.cli import main, viz
 from dragonfly.cli.create import from_honeybee_cli, from_geojson_cli
 from dragonfly.cli.edit import convert_units, solve_adjacency, reset_room_boundaries, \
     align_room_2ds, remove_short_segments, windows_by_ratio
@@ -25,6 +27,23 @@ def test_viz():
     assert result.output.endswith('z!\n')
 
 
+def test_main_pending_extensions():
+    ctx = click.Context(main)
+    dragonfly._pending_extensions.append('dragonfly_notinstalled')
+    try:
+        commands = main.list_commands(ctx)
+        assert 'notinstalled' in commands
+        assert 'viz' in commands
+        assert 'dragonfly_notinstalled' in dragonfly._pending_extensions
+        assert main.get_command(ctx, 'viz') is viz
+        assert 'dragonfly_notinstalled' in dragonfly._pending_extensions
+        assert main.get_command(ctx, 'notinstalled') is None
+        assert 'dragonfly_notinstalled' not in dragonfly._pending_extensions
+    finally:
+        if 'dragonfly_notinstalled' in dragonfly._pending_extensions:
+            dragonfly._pending_extensions.remove('dragonfly_notinstalled')
+
+
 def test_from_honeybee():
     input_model = './tests/json/revit_sample_model.hbjson'
     runner = CliRunner()
@@ -131,6 +150,16 @@ def test_model_to_honeybee():
         assert os.path.isfile(model_info['full_path'])
 
 
+def test_model_to_honeybee_workers():
+    input_model = './tests/json/sample_revit_model.dfjson'
+    runner = CliRunner()
+    result = runner.invoke(model_to_honeybee_cli, [input_model, '--workers', '2'])
+    assert result.exit_code == 0
+
+    for model_info in json.loads(result.output):
+        assert os.path.isfile(model_info['full_path'])
+
+
 def test_model_from_geojson():
     input_model = './tests/geojson/TestGeoJSON.geojson'
     runner = CliRunner()
@@ -142,6 +171,17 @@ def test_model_from_geojson():
     assert isinstance(df_model, Model)
 
 
+def test_model_from_geojson_stream():
+    input_model = './tests/geojson/TestGeoJSON.geojson'
+    runner = CliRunner()
+    result = runner.invoke(from_geojson_cli, [input_model, '-st', '-w', '2'])
+    assert result.exit_code == 0
+
+    model_dict = json.loads(result.output)
+    df_model = Model.from_dict(model_dict)
+    assert len(df_model.buildings) == 3
+
+
 def test_validate_model():
     input_model = './tests/json/sample_revit_model.dfjson'
     incorrect_input_model = './tests/json/bad_adjacency_model.dfjson'
@@ -175,6 +215,17 @@ def test_validate_model_json():
         assert len(valid_report['errors']) != 0
 
 
+def test_validate_model_workers():
+    input_model = './tests/json/sample_revit_model.dfjson'
+    runner = CliRunner()
+    result = runner.invoke(validate_model_cli, [input_model, '--json'])
+    serial_report = json.loads(result.output)
+    result = runner.invoke(validate_model_cli, [input_model, '--json', '--workers', '2'])
+    assert result.exit_code == 0
+    valid_report = json.loads(result.output)
+    assert valid_report['errors'] == serial_report['errors']
+
+
 def test_merge_models_to_honeybee():
     input_df_model = './tests/json/sample_revit_model.dfjson'
     extra_df_model = './tests/json/model_with_doors_skylights.dfjson'
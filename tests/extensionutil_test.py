@@ -0,0 +1,70 @@
+# coding=utf-8
+import os
+import sys
+import json
+
+from ladybug_geometry.geometry3d import Point3D, Face3D
+
+import dragonfly
+from dragonfly.extensionutil import extension_names
+from dragonfly.properties import Room2DProperties
+from dragonfly.room2d import Room2D
+
+
+def test_extension_names_cache(tmpdir):
+    """Test the extension_names method with a cache file."""
+    cache_file = str(tmpdir.join('cache', 'extensions.json'))
+    names = extension_names(cache_file)
+    assert os.path.isfile(cache_file)
+    assert extension_names(cache_file) == names == extension_names()
+
+    # check that a stale cache is not used
+    with open(cache_file) as inf:
+        cache = json.load(inf)
+    cache['extensions'] = ['dragonfly_fake']
+    with open(cache_file, 'w') as outf:
+        json.dump(cache, outf)
+    assert extension_names(cache_file) == ['dragonfly_fake']
+    cache['sys_path'] = []
+    with open(cache_file, 'w') as outf:
+        json.dump(cache, outf)
+    assert extension_names(cache_file) == names
+
+
+def test_lazy_extension_loading(tmpdir):
+    """Test that pending extensions are loaded upon first access of properties."""
+    ext_folder = tmpdir.mkdir('dragonfly_lazytest')
+    ext_folder.join('__init__.py').write(
+        'from dragonfly.properties import Room2DProperties\n'
+        'Room2DProperties.lazytest = property(lambda self: "lazy")\n'
+    )
+    sys.path.insert(0, str(tmpdir))
+    dragonfly._pending_extensions.append('dragonfly_lazytest')
+    try:
+        pts = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
+        room = Room2D('ShoeBox', Face3D(pts), 3)
+        assert room.properties.lazytest == 'lazy'
+        assert 'dragonfly_lazytest' in dragonfly.extensions
+        assert dragonfly._pending_extensions == []
+        assert not dragonfly.load_extensions()
+    finally:
+        sys.path.remove(str(tmpdir))
+        del Room2DProperties.lazytest
+        dragonfly.extensions.pop('dragonfly_lazytest', None)
+        sys.modules.pop('dragonfly_lazytest', None)
+
+
+def test_extension_attributes_cache():
+    """Test that cached extension attributes are refreshed when extensions change."""
+    pts = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
+    room = Room2D('ShoeBox', Face3D(pts), 3)
+    base_attributes = room.properties._extension_attributes
+    assert room.properties._extension_attributes is base_attributes
+    assert 'cachetest' not in base_attributes
+
+    Room2DProperties.cachetest = property(lambda self: 'cached')
+    try:
+        assert 'cachetest' in room.properties._extension_attributes
+    finally:
+        del Room2DProperties.cachetest
+    assert room.properties._extension_attributes == base_attributes
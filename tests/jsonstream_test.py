@@ -0,0 +1,45 @@
+# coding=utf-8
+import io
+import json
+import pytest
+
+from dragonfly.jsonstream import iter_json_object
+
+
+def test_iter_json_object():
+    """Test the iter_json_object function with a small chunk size."""
+    data = {
+        'type': 'Model',
+        'identifier': 'Test \\"Model\\" {[,]}',
+        'buildings': [{'identifier': 'Bldg_{}'.format(i), 'height': 123456.789 * i}
+                      for i in range(20)],
+        'empty': [],
+        'context_shades': None,
+        'tolerance': 0.001
+    }
+    for indent in (None, 4):
+        text = json.dumps(data, indent=indent)
+        items = []
+        for key, value in iter_json_object(io.StringIO(text), ('buildings', 'empty'), 7):
+            if key in ('buildings', 'empty'):
+                assert not isinstance(value, list)
+                value = list(value)
+            items.append((key, value))
+        assert dict(items) == data
+        assert [key for key, _ in items] == list(data.keys())
+
+    # check that unread array items are skipped
+    text = json.dumps(data)
+    keys = [key for key, _ in iter_json_object(io.StringIO(text), ('buildings',), 7)]
+    assert keys == list(data.keys())
+    assert list(iter_json_object(io.StringIO(' { } '))) == []
+
+
+def test_iter_json_object_invalid():
+    """Test the iter_json_object function with invalid JSON."""
+    with pytest.raises(ValueError):
+        list(iter_json_object(io.StringIO('[1, 2]')))
+    with pytest.raises(ValueError):
+        list(iter_json_object(io.StringIO('{"a": [1, 2}'), ('a',), 3))
+    with pytest.raises(ValueError):
+        list(iter_json_object(io.StringIO('{"a": 1'), (), 3))
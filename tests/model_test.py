@@ -10,12 +10,14 @@ from ladybug_geometry.geometry3d import Point3D, Vector3D, Plane, Face3D
 from ladybug.futil import nukedir
 
 import honeybee.model as hb_model
+from honeybee.extensionutil import room_extension_dicts
 from honeybee.room import Room
 from honeybee.shade import Shade
 from honeybee.facetype import RoofCeiling
 from honeybee.boundarycondition import Surface, Outdoors
 
 from dragonfly.model import Model
+from dragonfly.dfbin import write_dfbin
 from dragonfly.building import Building
 from dragonfly.story import Story
 from dragonfly.room2d import Room2D
@@ -175,6 +177,17 @@ def test_model_add_objects():
     assert len(model.buildings_by_identifier(['OfficeBuilding1'])) == 1
     with pytest.raises(ValueError):
         model.buildings_by_identifier(['NotABuilding'])
+    assert model.stories_by_identifier(['OfficeFloor1', 'OfficeFloor2']) == \
+        [story_1, story_2]
+    assert model.room_2ds_by_identifier(['Office1', 'Office3']) == \
+        [room2d_1, room2d_3]
+    room2d_3.identifier = 'Office5'
+    assert model.room_2ds_by_identifier(['Office5']) == [room2d_3]
+    with pytest.raises(ValueError):
+        model.room_2ds_by_identifier(['Office3'])
+    story_2.room_2ds = [room2d_4]
+    with pytest.raises(ValueError):
+        model.room_2ds_by_identifier(['Office5'])
     assert len(model.context_shade_by_identifier(['TreeCanopy1'])) == 1
     with pytest.raises(ValueError):
         model.context_shade_by_identifier(['NotAShade'])
@@ -1057,6 +1070,22 @@ def test_check_duplicate_identifiers():
     assert model_1.check_duplicate_building_identifiers(False) == ''
 
 
+def test_check_all_workers():
+    """Test that check_all gives the same result when run in parallel."""
+    model = Model.from_file('./tests/json/bad_adjacency_model.dfjson')
+    other_model = Model.from_file('./tests/json/sample_revit_model.dfjson')
+    model.add_model(other_model)
+    assert len(model.buildings) > 1
+
+    serial_msg = model.check_all(False, include_warnings=True)
+    assert serial_msg != ''
+    assert model.check_all(False, include_warnings=True, workers=2) == serial_msg
+    serial_errs = model.check_all(False, True)
+    assert len(serial_errs) != 0
+    assert model.check_all(False, True, workers=2) == serial_errs
+    assert model.check_for_extension('Generic', False, True, workers=2) == serial_errs
+
+
 def test_check_roofs_above_rooms():
     """Test the check_roofs_above_rooms method."""
     # simple 10 x 10 rooms
@@ -1202,6 +1231,37 @@ def test_to_honeybee_multiple_models():
     assert len(hb_models[-1].orphaned_shades) == 6
 
 
+def test_to_honeybee_workers():
+    """Test that to_honeybee with several workers matches the serial translation."""
+    model_file = './tests/json/model_with_doors_skylights.dfjson'
+    model = Model.from_file(model_file)
+    for opm in ('Building', 'Story', 'District'):
+        for mult in (True, False):
+            serial = model.to_honeybee(opm, use_multiplier=mult, tolerance=0.01)
+            para = model.to_honeybee(opm, use_multiplier=mult, tolerance=0.01,
+                                     workers=2)
+            assert len(serial) == len(para)
+            for s_model, p_model in zip(serial, para):
+                assert s_model.to_dict() == p_model.to_dict()
+
+
+def test_iter_honeybee():
+    """Test that iter_honeybee yields the same Models as to_honeybee."""
+    model_file = './tests/json/model_with_room3ds.dfjson'
+    model = Model.from_file(model_file)
+    for opm in ('Building', 'Story', 'District'):
+        for mult in (True, False):
+            hb_models = model.to_honeybee(
+                opm, 5, use_multiplier=mult, solve_ceiling_adjacencies=True,
+                merge_method='Zones', tolerance=0.01)
+            hb_iter = model.iter_honeybee(
+                opm, 5, use_multiplier=mult, solve_ceiling_adjacencies=True,
+                merge_method='Zones', tolerance=0.01)
+            assert not isinstance(hb_iter, list)
+            iter_dicts = [hb_model.to_dict() for hb_model in hb_iter]
+            assert iter_dicts == [hb_model.to_dict() for hb_model in hb_models]
+
+
 def test_to_honeybee_missing_adjacency():
     """Test the to_honeybee method with a missing adjacency."""
     pts_1 = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
@@ -1274,6 +1334,73 @@ def test_to_honeybee_merge_method():
     assert hb_model.check_missing_adjacencies(False, False) == ''
 
 
+def test_to_honeybee_merge_method_split_stories():
+    """Test the to_honeybee method with Stories that merge into several Rooms."""
+    stories = []
+    for flr_hgt in (0, 3):
+        rooms = []
+        for x_orig in (0, 50):
+            for i in range(3):
+                x = x_orig + i * 5
+                pts = (Point3D(x, 0, flr_hgt), Point3D(x + 5, 0, flr_hgt),
+                       Point3D(x + 5, 5, flr_hgt), Point3D(x, 5, flr_hgt))
+                rm_id = 'Room_{}_{}_{}'.format(flr_hgt, x_orig, i)
+                rooms.append(Room2D(rm_id, Face3D(pts), 3))
+        Room2D.solve_adjacency(rooms, 0.01)
+        stories.append(Story('Story_{}'.format(flr_hgt), rooms))
+    model = Model('Split_Stories', [Building('Building', stories)])
+
+    hb_model = model.to_honeybee(
+        'District', merge_method='Stories', solve_ceiling_adjacencies=True,
+        tolerance=0.01)[0]
+    assert len(hb_model.rooms) == 4
+    assert hb_model.check_missing_adjacencies(False, False) == ''
+    adj_rooms = set()
+    for room in hb_model.rooms:
+        for face in room.faces:
+            if isinstance(face.boundary_condition, Surface):
+                adj_rooms.add(face.boundary_condition.boundary_condition_objects[-1])
+    assert adj_rooms == set(room.identifier for room in hb_model.rooms)
+
+
+def test_to_honeybee_solve_ceiling_adjacencies_stacked():
+    """Test the Surface BCs assigned by solve_ceiling_adjacencies over several stories.
+    """
+    layouts = [((0, 10), (10, 20)), ((5, 15),), ((0, 10), (10, 20))]
+    stories = []
+    for s_i, layout in enumerate(layouts):
+        rooms = []
+        for r_i, (x0, x1) in enumerate(layout):
+            z = s_i * 3
+            pts = (Point3D(x0, 0, z), Point3D(x1, 0, z),
+                   Point3D(x1, 10, z), Point3D(x0, 10, z))
+            rooms.append(Room2D('Room_{}_{}'.format(s_i, r_i), Face3D(pts), 3))
+        Room2D.solve_adjacency(rooms, 0.01)
+        stories.append(Story('Story_{}'.format(s_i), rooms))
+    model = Model('Stacked', [Building('Building', stories)])
+
+    expected = set([
+        ('Room_0_0', 'RoofCeiling', 'Room_1_0'), ('Room_0_0', 'Wall', 'Room_0_1'),
+        ('Room_0_1', 'RoofCeiling', 'Room_1_0'), ('Room_0_1', 'Wall', 'Room_0_0'),
+        ('Room_1_0', 'Floor', 'Room_0_0'), ('Room_1_0', 'Floor', 'Room_0_1'),
+        ('Room_1_0', 'RoofCeiling', 'Room_2_0'),
+        ('Room_1_0', 'RoofCeiling', 'Room_2_1'),
+        ('Room_2_0', 'Floor', 'Room_1_0'), ('Room_2_0', 'Wall', 'Room_2_1'),
+        ('Room_2_1', 'Floor', 'Room_1_0'), ('Room_2_1', 'Wall', 'Room_2_0')
+    ])
+    for opm in ('Building', 'District'):
+        hb_model = model.to_honeybee(
+            opm, use_multiplier=False, solve_ceiling_adjacencies=True,
+            tolerance=0.01)[0]
+        assert hb_model.check_missing_adjacencies(False, False) == ''
+        adj_faces = [(room.identifier, face.type.name,
+                      face.boundary_condition.boundary_condition_objects[-1])
+                     for room in hb_model.rooms for face in room.faces
+                     if isinstance(face.boundary_condition, Surface)]
+        assert len(adj_faces) == 12
+        assert set(adj_faces) == expected
+
+
 def test_to_honeybee_merge_method_big_plenums():
     """Test the to_honeybee method with different plenum depths."""
     model_file = './tests/json/merge_plenum_test.dfjson'
@@ -1839,6 +1966,68 @@ def test_to_from_dfpkl_methods():
     os.remove(model_dfpkl)
 
 
+def test_to_from_dfbin_methods():
+    """Test the to/from dfbin methods."""
+    pts_1 = (Point3D(0, 0, 3), Point3D(0, 10, 3), Point3D(10, 10, 3), Point3D(10, 0, 3))
+    pts_2 = (Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(20, 10, 3), Point3D(20, 0, 3))
+    hole = (Point3D(2, 2, 3), Point3D(4, 2, 3), Point3D(4, 4, 3), Point3D(2, 4, 3))
+    room2d_1 = Room2D('Office1', Face3D(pts_1, holes=[hole]), 3)
+    room2d_2 = Room2D('Office2', Face3D(pts_2), 3)
+    story = Story('OfficeFloor', [room2d_1, room2d_2])
+    story.solve_room_2d_adjacency(0.01)
+    story.set_outdoor_window_parameters(SimpleWindowRatio(0.4))
+    story.multiplier = 4
+    building_1 = Building('OfficeBuilding', [story])
+    building_2 = building_1.duplicate()
+    building_2.identifier = 'OtherBuilding'
+    building_2.move(Vector3D(30, 0, 0))
+
+    tree_canopy_geo = Face3D.from_regular_polygon(6, 6, Plane(o=Point3D(5, -10, 6)))
+    tree_canopy = ContextShade('TreeCanopy', [tree_canopy_geo])
+    model = Model('NewDevelopment', [building_1, building_2], [tree_canopy])
+
+    model_dfbin = model.to_dfbin('test')
+    assert os.path.isfile(model_dfbin)
+    new_model = Model.from_dfbin(model_dfbin)
+    assert new_model.to_dict() == model.to_dict()
+    new_model = Model.from_file(model_dfbin)
+    assert new_model.to_dict() == model.to_dict()
+
+    part_model = Model.from_dfbin(model_dfbin, ['OtherBuilding'])
+    assert len(part_model.buildings) == 1
+    assert len(part_model.context_shades) == 0
+    assert part_model.buildings[0].to_dict() == building_2.to_dict()
+    os.remove(model_dfbin)
+
+
+def test_to_from_dfbin_sparse_room_dicts():
+    """Test the dfbin methods with Room2D dictionaries that omit optional keys."""
+    pts_1 = (Point3D(0, 0, 3), Point3D(0, 10, 3), Point3D(10, 10, 3), Point3D(10, 0, 3))
+    hole = (Point3D(2, 2, 3), Point3D(4, 2, 3), Point3D(4, 4, 3), Point3D(2, 4, 3))
+    pts_2 = (Point3D(0, 0, -6), Point3D(0, 10, -6), Point3D(10, 10, -6),
+             Point3D(10, 0, -6))
+    room2d_1 = Room2D('Office1', Face3D(pts_1, holes=[hole]), 3)
+    room2d_2 = Room2D('Basement1', Face3D(pts_2), 3)
+    building = Building('OfficeBuilding', [Story('OfficeFloor', [room2d_1]),
+                                           Story('Basement', [room2d_2])])
+    model = Model('NewDevelopment', [building])
+
+    model_dict = model.to_dict()
+    for story in model_dict['buildings'][0]['unique_stories']:
+        for room in story['room_2ds']:
+            room.pop('boundary_conditions')
+    assert Model.from_dict(model_dict).to_dict() == model.to_dict()
+    for story in model_dict['buildings'][0]['unique_stories']:
+        if story['identifier'] == 'Basement':
+            story['room_2ds'][0]['floor_holes'] = None
+
+    model_dfbin = model.to_dfbin('test_sparse')
+    write_dfbin(model_dict, model_dfbin)
+    new_model = Model.from_dfbin(model_dfbin)
+    assert new_model.to_dict() == model.to_dict()
+    os.remove(model_dfbin)
+
+
 def test_from_dict_nulls():
     """Test the re-serialization of a Model with null extension properties."""
     test_json = './tests/json/model_with_nulls.json'
@@ -1849,6 +2038,51 @@ def test_from_dict_nulls():
     assert isinstance(model, Model)
 
 
+def test_from_dfjson_stream():
+    """Test the Model from_dfjson method with streaming of the objects."""
+    test_files = ['./tests/json/model_with_bldg_roofs.dfjson',
+                  './tests/json/model_with_room3ds.dfjson',
+                  './tests/json/model_with_nulls.json']
+    for test_file in test_files:
+        model = Model.from_dfjson(test_file)
+        stream_model = Model.from_dfjson(test_file, stream=True)
+        assert stream_model.to_dict() == model.to_dict()
+        stream_model = Model.from_dfjson(test_file, True, stream=True)
+        assert stream_model.to_dict() == Model.from_dfjson(test_file, True).to_dict()
+
+    # check a file written by the Model, which has the units after the buildings
+    model = Model.from_dfjson(test_files[0])
+    model_dict = model.to_dict()
+    dict_keys = list(model_dict.keys())
+    assert dict_keys.index('units') > dict_keys.index('buildings')
+    model_dfjson = model.to_dfjson('test_stream')
+    stream_model = Model.from_dfjson(model_dfjson, stream=True)
+    assert stream_model.to_dict() == Model.from_dfjson(model_dfjson).to_dict()
+    os.remove(model_dfjson)
+
+
+def test_extension_skeleton_room_3ds():
+    """Test that the streamed extension skeleton keeps the properties of 3D Rooms."""
+    test_file = './tests/json/model_with_room3ds.dfjson'
+    with open(test_file) as inf:
+        data = json.load(inf)
+    for bldg_dict in data['buildings']:
+        skeleton = Model._extension_skeleton(bldg_dict)
+        assert 'geometry' not in json.dumps(skeleton)
+        for ext_key in ('energy', 'radiance'):
+            full_dicts = room_extension_dicts(
+                bldg_dict.get('room_3ds') or [], ext_key, [], [], [], [], [])
+            skel_dicts = room_extension_dicts(
+                skeleton.get('room_3ds') or [], ext_key, [], [], [], [], [])
+            assert skel_dicts == full_dicts
+    assert any(len(bldg_dict.get('room_3ds') or []) != 0
+               for bldg_dict in data['buildings'])
+
+    model = Model.from_dfjson(test_file)
+    stream_model = Model.from_dfjson(test_file, stream=True)
+    assert stream_model.to_dict() == model.to_dict()
+
+
 def test_to_geojson():
     """Test the Model to_geojson method."""
     pts_1 = (Point3D(50, 50, 3), Point3D(60, 50, 3), Point3D(60, 60, 3), Point3D(50, 60, 3))
@@ -2003,6 +2237,26 @@ def test_from_geojson():
     assert bldg3.unique_stories[0].floor_to_floor_height == pytest.approx(3.0, abs=1e-10)
 
 
+def test_from_geojson_stream_workers():
+    """Test the Model from_geojson method with the stream and workers options."""
+    geojson_folder = os.path.join(os.getcwd(), 'tests', 'geojson')
+    geo_fp = os.path.join(geojson_folder, 'TestGeoJSON.geojson')
+    location = Location('Boston', 'MA', 'USA', 42.366151, -71.019357)
+    model, _ = Model.from_geojson(geo_fp, location=location)
+
+    stream_model, _ = Model.from_geojson(geo_fp, location=location, stream=True)
+    assert stream_model.to_dict() == model.to_dict()
+    par_model, _ = Model.from_geojson(
+        geo_fp, location=location, stream=True, workers=2, batch_size=1)
+    assert par_model.to_dict() == model.to_dict()
+
+    model, loc = Model.from_geojson(geo_fp)
+    stream_model, stream_loc = Model.from_geojson(geo_fp, stream=True, batch_size=2)
+    assert stream_model.to_dict() == model.to_dict()
+    assert stream_loc.latitude == loc.latitude
+    assert stream_loc.longitude == loc.longitude
+
+
 def test_from_geojson_units_test():
     """Test the Model from_geojson method with non-meter units."""
 
@@ -2208,6 +2462,62 @@ def test_from_honeybee():
     model.check_missing_adjacencies()
 
 
+def test_check_missing_adjacencies_across_stories():
+    """Test that check_missing_adjacencies reports references to other Stories."""
+    stories = []
+    for flr_hgt in (0, 3):
+        rooms = []
+        for x in (0, 5):
+            pts = (Point3D(x, 0, flr_hgt), Point3D(x + 5, 0, flr_hgt),
+                   Point3D(x + 5, 5, flr_hgt), Point3D(x, 5, flr_hgt))
+            rm_id = 'Room_{}_{}'.format(flr_hgt, x)
+            rooms.append(Room2D(rm_id, Face3D(pts), 3))
+        Room2D.solve_adjacency(rooms, 0.01)
+        stories.append(Story('Story_{}'.format(flr_hgt), rooms))
+    model = Model('Adjacency_Check', [Building('Building', stories)])
+    assert model.check_missing_adjacencies(False) == ''
+
+    # reference a Room2D of the other Story from the first Story
+    room = model.stories[0].room_2ds[0]
+    bcs = list(room.boundary_conditions)
+    for i, bc in enumerate(bcs):
+        if isinstance(bc, Surface):
+            bcs[i] = Surface(('Room_3_5..Face4', 'Room_3_5'))
+    room._boundary_conditions = tuple(bcs)
+
+    report = model.check_missing_adjacencies(False, True)
+    assert [msg['code'] for msg in report] == ['100203']
+    assert report == model.stories[0].check_missing_adjacencies(False, True)
+    assert model.stories[1].check_missing_adjacencies(False) == ''
+    with pytest.raises(ValueError):
+        model.check_missing_adjacencies()
+
+    # check that the model-wide check matches the check of each Story
+    story_msgs = [(story.full_id, story.check_missing_adjacencies(False))
+                  for story in model.stories]
+    header = Model._STORY_CHECK_HEADERS['check_missing_adjacencies']
+    assert model.check_missing_adjacencies(False) == \
+        Model._story_check_report(story_msgs, header, False)
+
+    # check Room2Ds with the same identifiers in different Stories
+    stories = []
+    for flr_hgt in (0, 3):
+        rooms = []
+        for x in (0, 5):
+            pts = (Point3D(x, 0, flr_hgt), Point3D(x + 5, 0, flr_hgt),
+                   Point3D(x + 5, 5, flr_hgt), Point3D(x, 5, flr_hgt))
+            rooms.append(Room2D('Room_{}'.format(x), Face3D(pts), 3))
+        Room2D.solve_adjacency(rooms, 0.01)
+        stories.append(Story('Story_{}'.format(flr_hgt), rooms))
+    model = Model('Adjacency_Check', [Building('Building', stories)])
+    assert model.check_missing_adjacencies(False) == ''
+    room = model.stories[1].room_2ds[0]
+    room.window_parameters = [SimpleWindowRatio(0.4)] * len(room)
+    report = model.check_missing_adjacencies(False, True)
+    assert [msg['code'] for msg in report] == ['100202', '100202']
+    assert report == model.stories[1].check_missing_adjacencies(False, True)
+
+
 def test_from_honeybee_methods():
     """Test the different conversion methods on the from_honeybee method."""
     hb_model_file = './tests/json/revit_sample_model.hbjson'
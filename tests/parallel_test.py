@@ -0,0 +1,38 @@
+# coding=utf-8
+from concurrent.futures import ThreadPoolExecutor
+
+from dragonfly.parallel import worker_count, parallel_map, parallel_imap
+
+
+def test_worker_count():
+    """Test the worker_count method."""
+    assert worker_count() == 1
+    assert worker_count(1) == 1
+    assert worker_count(3) == 3
+    assert worker_count(0) >= 1
+    assert worker_count(-1) >= 1
+
+
+def test_parallel_map():
+    """Test the parallel_map method."""
+    args = list(range(10))
+    expected = [abs(-a) for a in args]
+    assert parallel_map(abs, args) == expected
+    assert parallel_map(abs, args, workers=2) == expected
+    with ThreadPoolExecutor(2) as pool:
+        assert parallel_map(abs, args, executor=pool) == expected
+    assert parallel_map(abs, []) == []
+
+
+def test_parallel_imap():
+    """Test the parallel_imap method."""
+    args = list(range(10))
+    expected = [abs(-a) for a in args]
+    results = parallel_imap(abs, iter(args))
+    assert not isinstance(results, list)
+    assert list(results) == expected
+    assert list(parallel_imap(abs, iter(args), workers=2)) == expected
+    assert list(parallel_imap(abs, iter(args), workers=2, buffer_size=1)) == expected
+    with ThreadPoolExecutor(2) as pool:
+        assert list(parallel_imap(abs, iter(args), executor=pool)) == expected
+    assert list(parallel_imap(abs, [])) == []
@@ -2,7 +2,8 @@
 import pytest
 
 from dragonfly.projection import meters_to_long_lat_factors, polygon_to_lon_lat, \
-    origin_long_lat_from_location, lon_lat_to_polygon
+    origin_long_lat_from_location, lon_lat_to_polygon, flatten_rings, \
+    coordinates_to_lon_lat, lon_lat_to_coordinates
 
 from ladybug_geometry.geometry2d.pointvector import Point2D
 from ladybug.location import Location
@@ -71,3 +72,29 @@ def test_lon_lat_to_polygon():
     for point, test_point in zip(polygon, test_polygon):
         assert test_point[0] == pytest.approx(point[0], abs=1e-5)
         assert test_point[1] == pytest.approx(point[1], abs=1e-5)
+
+
+def test_coordinates_to_lon_lat():
+    """Test that the batch conversion methods match the single polygon methods."""
+    polygons = [
+        [(0, 0), (2, 0), (2, 2), (0, 2)],
+        [(10.5, -3.25), (40.1, 7.3), (12.7, 55.9)],
+        [(-1000, 250), (-500, 250), (-500, 750), (-1000, 750), (-750, 1000)]
+    ]
+    origin = (-70.0, 42.0)
+    convert_facs = meters_to_long_lat_factors(origin)
+    coords, ring_offsets = flatten_rings(polygons)
+    assert len(coords) == 24
+    assert ring_offsets == [0, 4, 7, 12]
+
+    lon_lat = coordinates_to_lon_lat(coords, ring_offsets, origin, convert_facs)
+    assert lon_lat == [polygon_to_lon_lat(p, origin, convert_facs) for p in polygons]
+    assert lon_lat == coordinates_to_lon_lat(coords, ring_offsets, origin)
+
+    coords, ring_offsets = flatten_rings(lon_lat)
+    verts = lon_lat_to_coordinates(coords, ring_offsets, origin)
+    assert verts == [lon_lat_to_polygon(p, origin) for p in lon_lat]
+    for poly, b_poly in zip(polygons, verts):
+        for pt, b_pt in zip(poly, b_poly):
+            assert pt[0] == pytest.approx(b_pt[0], abs=1e-6)
+            assert pt[1] == pytest.approx(b_pt[1], abs=1e-6)
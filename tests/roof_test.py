@@ -82,6 +82,29 @@ def test_resolved_geometry():
     assert res_geo[2].center.z == pytest.approx(0.0, abs=1e-3)
 
 
+def test_resolved_geometry_cache():
+    """Test that the resolved_geometry is cached until the geometry is changed."""
+    pts_1 = (Point3D(0, 0, 0), Point3D(10, 0, 0), Point3D(10, 7, 7), Point3D(0, 7, 7))
+    pts_2 = (Point3D(0, 5, 5), Point3D(10, 5, 5), Point3D(10, 10, 0), Point3D(0, 10, 0))
+    roof = RoofSpecification([Face3D(pts_1), Face3D(pts_2)])
+
+    res_geo = roof.resolved_geometry(0.01)
+    res_geo_2 = roof.resolved_geometry(0.01)
+    assert res_geo is not res_geo_2
+    assert all(g1 is g2 for g1, g2 in zip(res_geo, res_geo_2))
+    assert roof.resolved_geometry(0.001)[0] is not res_geo[0]
+    assert roof.duplicate().resolved_geometry(0.01)[0] is res_geo[0]
+
+    roof.move(Vector3D(0, 0, 3))
+    moved_geo = roof.resolved_geometry(0.01)
+    assert moved_geo[0].center.z == pytest.approx(res_geo[0].center.z + 3, abs=1e-3)
+
+    new_face = Face3D(tuple(Point3D(pt.x, pt.y, 0) for pt in pts_2))
+    roof.update_geometry_3d(new_face, 1)
+    assert roof._resolved_cache is None
+    assert roof.resolved_geometry(0.01)[0] is not moved_geo[0]
+
+
 def test_roof_find_gaps():
     """Test the RoofSpecification.find_gaps method."""
     pts_1 = (Point3D(0, 0, 0), Point3D(10, 0, 0), Point3D(10, 5, 5), Point3D(0, 5, 5))
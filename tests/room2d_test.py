@@ -1145,6 +1145,29 @@ def test_room2d_solve_adjacency():
         '{}..Face2'.format(room2d_1.identifier)
 
 
+def test_room2d_solve_adjacency_grid():
+    """Test the Room2D solve_adjacency method with a grid of many rooms."""
+    rooms = []
+    for x in range(6):
+        for y in range(6):
+            pts = (Point3D(x * 5, y * 5, 3), Point3D(x * 5 + 5, y * 5, 3),
+                   Point3D(x * 5 + 5, y * 5 + 5, 3), Point3D(x * 5, y * 5 + 5, 3))
+            rooms.append(Room2D('Room_{}_{}'.format(x, y), Face3D(pts), 3))
+    adj_info = Room2D.find_adjacency(rooms, 0.01)
+    assert len(adj_info) == 60
+    adj_info = Room2D.solve_adjacency(rooms, 0.01)
+    assert len(adj_info) == 60
+    for (room_1, _), (room_2, _) in adj_info:
+        assert rooms.index(room_1) < rooms.index(room_2)
+    assert adj_info == sorted(
+        adj_info, key=lambda a: (rooms.index(a[0][0]), rooms.index(a[1][0]), a[0][1]))
+    for room in rooms:
+        srf_count = sum(isinstance(bc, Surface) for bc in room.boundary_conditions)
+        assert len(room.floor_segments) - srf_count == \
+            sum(room.identifier.endswith(e) for e in ('_0', '_5')) + \
+            sum(room.identifier.startswith(s) for s in ('Room_0_', 'Room_5_'))
+
+
 def test_solve_adjacency_aperture():
     """Test the Room2D solve_adjacency method with an interior aperture."""
     pts_1 = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
@@ -1214,6 +1237,71 @@ def test_room2d_intersect_adjacency():
         '{}..Face3'.format(room2d_1.identifier)
 
 
+def test_room2d_intersect_adjacency_partition():
+    """Test the Room2D intersect_adjacency method with the partition option."""
+    pts_1 = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
+    pts_2 = (Point3D(10, 5, 3), Point3D(20, 5, 3),
+             Point3D(20, 15, 3), Point3D(10, 15, 3))
+    pts_3 = (Point3D(0, 10, 3), Point3D(5, 10, 3), Point3D(5, 20, 3), Point3D(0, 20, 3))
+    pts_4 = (Point3D(40, 0, 3), Point3D(50, 0, 3),
+             Point3D(50, 10, 3), Point3D(40, 10, 3))
+    rooms = [Room2D('Room{}'.format(i), Face3D(pts), 3)
+             for i, pts in enumerate((pts_1, pts_2, pts_3, pts_4))]
+    rooms[0].set_outdoor_window_parameters(SimpleWindowRatio(0.4))
+
+    int_rooms = Room2D.intersect_adjacency(rooms, 0.01)
+    part_rooms = Room2D.intersect_adjacency(rooms, 0.01, partition=True)
+    assert [len(r) for r in part_rooms] == [6, 5, 4, 4]
+    for int_r, part_r in zip(int_rooms, part_rooms):
+        assert int_r.floor_geometry.vertices == part_r.floor_geometry.vertices
+        assert int_r.window_parameters == part_r.window_parameters
+    assert part_rooms[2] is rooms[2]  # rooms without new vertices pass through
+    assert part_rooms[3] is rooms[3]
+    assert part_rooms[0] is not rooms[0]
+
+
+def test_room2d_intersect_adjacency_partition_solved():
+    """Test the partition option of intersect_adjacency with solved adjacencies."""
+    pts_1 = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
+    pts_2 = (Point3D(10, 0, 3), Point3D(20, 0, 3),
+             Point3D(20, 10, 3), Point3D(10, 10, 3))
+    pts_3 = (Point3D(0, 10, 3), Point3D(5, 10, 3), Point3D(5, 20, 3), Point3D(0, 20, 3))
+    rooms = [Room2D('Room{}'.format(i), Face3D(pts), 3)
+             for i, pts in enumerate((pts_1, pts_2, pts_3))]
+    Room2D.solve_adjacency(rooms, 0.01)
+
+    part_rooms = Room2D.intersect_adjacency(rooms, 0.01, partition=True)
+    for room in part_rooms:  # rebuilt rooms have their Surface BCs reset
+        assert all(not isinstance(bc, Surface) for bc in room.boundary_conditions)
+
+    story = Story('OfficeFloor', rooms)
+    story.solve_room_2d_adjacency(0.01, intersect=True)
+    assert len(story.room_2ds[0]) == 5
+    assert story.check_missing_adjacencies(False) == ''
+
+
+def test_room2d_from_dict_shared_parameters():
+    """Test that Room2Ds loaded from dicts share equal shading parameters."""
+    pts_1 = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
+    pts_2 = (Point3D(10, 0, 3), Point3D(20, 0, 3),
+             Point3D(20, 10, 3), Point3D(10, 10, 3))
+    room2d_1 = Room2D('SquareShoebox1', Face3D(pts_1), 3)
+    room2d_2 = Room2D('SquareShoebox2', Face3D(pts_2), 3)
+    ashrae_base, overhang = SimpleWindowRatio(0.4), Overhang(1)
+    for room in (room2d_1, room2d_2):
+        room.set_outdoor_window_parameters(ashrae_base)
+        room.set_outdoor_shading_parameters(overhang)
+    assert room2d_1.window_parameters[0] is ashrae_base
+    assert room2d_1.shading_parameters[0] is overhang
+
+    new_1 = Room2D.from_dict(room2d_1.to_dict())
+    new_2 = Room2D.from_dict(room2d_2.to_dict())
+    assert new_1.window_parameters[0] is not new_2.window_parameters[0]
+    s_pars = [sp for room in (new_1, new_2) for sp in room.shading_parameters]
+    assert all(sp is s_pars[0] for sp in s_pars)
+    assert new_1.to_dict() == room2d_1.to_dict()
+
+
 def test_group_by_adjacency():
     """Test the Room2D group_by_adjacency method."""
     pts_1 = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
@@ -1235,6 +1323,55 @@ def test_group_by_adjacency():
     assert len(grouped_rooms[1]) == 1
 
 
+def test_group_by_adjacency_multiple_walls():
+    """Test the group_by_adjacency method with rooms sharing several walls."""
+    pts_1 = (Point3D(0, 0, 3), Point3D(5, 0, 3), Point3D(5, 5, 3), Point3D(0, 5, 3))
+    pts_2 = (Point3D(5, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3),
+             Point3D(0, 10, 3), Point3D(0, 5, 3), Point3D(5, 5, 3))
+    pts_3 = (Point3D(10, 0, 3), Point3D(15, 0, 3),
+             Point3D(15, 10, 3), Point3D(10, 10, 3))
+    pts_4 = (Point3D(20, 0, 3), Point3D(25, 0, 3), Point3D(25, 5, 3), Point3D(20, 5, 3))
+    rooms = [Room2D('Room{}'.format(i), Face3D(pts), 3)
+             for i, pts in enumerate((pts_1, pts_2, pts_3, pts_4))]
+    rooms = Room2D.intersect_adjacency(rooms, 0.01)
+    Room2D.solve_adjacency(rooms, 0.01)
+
+    # rooms are listed once for each wall segment of the adjacency
+    grouped_rooms = Room2D.group_by_adjacency(rooms)
+    assert [[rm.identifier for rm in grp] for grp in grouped_rooms] == \
+        [['Room0', 'Room1', 'Room1', 'Room2'], ['Room3']]
+    grouped_rooms = Room2D.group_by_adjacency([rooms[3], rooms[2], rooms[0], rooms[1]])
+    assert [[rm.identifier for rm in grp] for grp in grouped_rooms] == \
+        [['Room3'], ['Room2', 'Room1', 'Room0', 'Room0']]
+
+    # remove the adjacency to Room2 from Room1 such that it is only on one side
+    room_bcs = list(rooms[1].boundary_conditions)
+    for i, bc in enumerate(room_bcs):
+        if isinstance(bc, Surface) and bc.boundary_condition_objects[-1] == 'Room2':
+            room_bcs[i] = bcs.outdoors
+    rooms[1].boundary_conditions = room_bcs
+    grouped_rooms = Room2D.group_by_adjacency([rooms[2], rooms[3], rooms[0], rooms[1]])
+    assert [[rm.identifier for rm in grp] for grp in grouped_rooms] == \
+        [['Room2', 'Room1', 'Room0', 'Room0'], ['Room3']]
+
+
+def test_group_by_proximity():
+    """Test the Room2D group_by_proximity method."""
+    pts_1 = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
+    pts_2 = (Point3D(12, 0, 3), Point3D(20, 0, 3),
+             Point3D(20, 10, 3), Point3D(12, 10, 3))
+    pts_3 = (Point3D(40, 0, 3), Point3D(50, 0, 3),
+             Point3D(50, 10, 3), Point3D(40, 10, 3))
+    room2d_1 = Room2D('SquareShoebox1', Face3D(pts_1), 3)
+    room2d_2 = Room2D('SquareShoebox2', Face3D(pts_2), 3)
+    room2d_3 = Room2D('SquareShoebox3', Face3D(pts_3), 3)
+
+    grouped_rooms = Room2D.group_by_proximity([room2d_1, room2d_2, room2d_3], 6)
+    assert len(grouped_rooms) == 2
+    assert grouped_rooms[0] == [room2d_1, room2d_2]
+    assert grouped_rooms[1] == [room2d_3]
+
+
 def test_group_by_air_boundary_adjacency():
     """Test the Room2D group_by_air_boundary_adjacency method."""
     pts_1 = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
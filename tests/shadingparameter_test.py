@@ -108,6 +108,7 @@ def test_overhang_dict_methods():
     new_simple_awning = Overhang.from_dict(shd_dict)
     assert new_simple_awning == simple_awning
     assert shd_dict == new_simple_awning.to_dict()
+    assert Overhang.from_dict(shd_dict) is new_simple_awning
 
 
 def test_overhang_add_shading_to_face():
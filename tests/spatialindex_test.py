@@ -0,0 +1,69 @@
+# coding=utf-8
+from ladybug_geometry.geometry2d import Point2D, LineSegment2D, Polygon2D
+
+from dragonfly.spatialindex import RectangleGrid, polygon_gap_points
+
+
+def test_rectangle_grid_init():
+    """Test the initialization of RectangleGrid and basic properties."""
+    rects = [(0, 0, 1, 1), (1, 0, 2, 1), (5, 5, 6, 6)]
+    grid = RectangleGrid(rects)
+    str(grid)  # test the string representation
+
+    assert len(grid) == 3
+    assert grid.rectangles == tuple(rects)
+    assert grid.cell_size == 1
+
+    grid = RectangleGrid(rects, 2.5)
+    assert grid.cell_size == 2.5
+
+
+def test_rectangle_grid_query():
+    """Test the RectangleGrid query method."""
+    rects = [(0, 0, 1, 1), (1, 0, 2, 1), (5, 5, 6, 6), (-100, -100, 100, -99)]
+    grid = RectangleGrid(rects)
+
+    assert 0 in grid.query((0.5, 0.5, 0.6, 0.6))
+    assert 2 not in grid.query((0.5, 0.5, 0.6, 0.6))
+    assert 2 in grid.query((3, 3, 4.99, 4.99), 0.02)
+    assert 3 in grid.query((50, -99.5, 51, -99.2))  # oversized rectangle
+    assert grid.query((0, 0, 2, 1)) == sorted(grid.query((0, 0, 2, 1)))
+
+
+def test_rectangle_grid_overlapping_pairs():
+    """Test the RectangleGrid overlapping_pairs method."""
+    rects = [(0, 0, 1, 1), (1, 0, 2, 1), (5, 5, 6, 6), (2.005, 0, 3, 1)]
+    grid = RectangleGrid(rects)
+
+    assert grid.overlapping_pairs() == [(0, 1)]
+    assert grid.overlapping_pairs(0.01) == [(0, 1), (1, 3)]
+
+
+def test_rectangle_grid_from_geometry():
+    """Test the RectangleGrid from_polygons and from_segments methods."""
+    pts = (Point2D(0, 0), Point2D(2, 0), Point2D(2, 2), Point2D(0, 2))
+    polygon = Polygon2D(pts)
+    grid = RectangleGrid.from_polygons([polygon, polygon.move(Point2D(3, 0))])
+    assert grid.rectangles[0] == (0, 0, 2, 2)
+    assert grid.query_polygon(polygon) == [0]
+    assert grid.query_polygon(polygon, 1.5) == [0, 1]
+
+    seg = LineSegment2D.from_end_points(Point2D(2, 2), Point2D(0, 0))
+    grid = RectangleGrid.from_segments([seg])
+    assert grid.rectangles[0] == (0, 0, 2, 2)
+
+
+def test_polygon_gap_points():
+    """Test the polygon_gap_points function against the distance to each polygon."""
+    poly_1 = Polygon2D((Point2D(0, 0), Point2D(5, 0), Point2D(5, 5), Point2D(0, 5)))
+    poly_2 = Polygon2D((Point2D(5.05, 0), Point2D(10, 0),
+                        Point2D(10, 5), Point2D(5.05, 5)))
+    poly_3 = Polygon2D((Point2D(0, 5), Point2D(5, 5), Point2D(5, 10), Point2D(0, 10)))
+    polygons = [poly_1, poly_2, poly_3]
+
+    gap_pts = polygon_gap_points(polygons, 0.1, 0.01)
+    assert gap_pts == [poly_1[1], poly_1[2], poly_2[0], poly_2[3], poly_2[3], poly_3[1]]
+    assert gap_pts[0] is poly_1[1]
+    assert polygon_gap_points(polygons, 0.04, 0.01) == []
+    assert polygon_gap_points([poly_1], 0.1, 0.01) == []
+    assert polygon_gap_points([], 0.1, 0.01) == []
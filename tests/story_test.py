@@ -69,6 +69,33 @@ def test_story_floor_geometry():
     assert all([isinstance(seg, LineSegment3D) for seg in outline_segs])
 
 
+def test_story_shade_representation_cache():
+    """Test that the Story outline and shade geometry are cached until edited."""
+    pts_1 = (Point3D(0, 0, 3), Point3D(0, 10, 3), Point3D(10, 10, 3), Point3D(10, 0, 3))
+    pts_2 = (Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(20, 10, 3), Point3D(20, 0, 3))
+    room2d_1 = Room2D('Office1', Face3D(pts_1), 3)
+    room2d_2 = Room2D('Office2', Face3D(pts_2), 3)
+    story = Story('OfficeFloor', [room2d_1, room2d_2])
+
+    outline_segs = story.outline_segments(0.01)
+    assert story.outline_segments(0.01)[0] is outline_segs[0]
+    shades = story.shade_representation(True, 0.01)
+    assert len(shades) == 7
+    assert shades[-1].identifier == 'OfficeFloor_Top_0'
+    shades_2 = story.shade_representation(True, 0.01)
+    assert shades_2[0] is not shades[0]
+    assert shades_2[0].geometry is shades[0].geometry
+    assert len(story.shade_representation(False, 0.01)) == 6
+
+    story.multiplier = 2
+    assert story.shade_representation(False, 0.01)[0].max.z == pytest.approx(9, 1e-6)
+    story.move(Vector3D(0, 0, 1))
+    assert story.outline_segments(0.01)[0] is not outline_segs[0]
+    assert story.shade_representation(False, 0.01)[0].min.z == pytest.approx(4, 1e-6)
+    room2d_2.move(Vector3D(5, 0, 0))
+    assert max(f.max.x for f in story.footprint(0.01)) == pytest.approx(25, 1e-6)
+
+
 def test_story_add_rooms():
     """Test the Story add_rooms methods."""
     pts_1 = (Point3D(0, 0, 3), Point3D(0, 10, 3), Point3D(10, 10, 3), Point3D(10, 0, 3))
@@ -94,6 +121,18 @@ def test_story_add_rooms():
     assert story.floor_area == 400
     assert isinstance(story.room_by_identifier('Office3'), Room2D)
 
+    # check that lookups are updated when rooms are renamed or removed
+    room2d_4.identifier = 'Office5'
+    assert story.room_by_identifier('Office5') is room2d_4
+    with pytest.raises(ValueError):
+        story.room_by_identifier('Office4')
+    story.add_prefix('Upper')
+    assert story.rooms_by_identifier(['Upper_Office1', 'Upper_Office5']) == \
+        [room2d_1, room2d_4]
+    story.room_2ds = [room2d_1, room2d_2]
+    with pytest.raises(ValueError):
+        story.rooms_by_identifier(['Upper_Office1', 'Upper_Office5'])
+
 
 def test_story_set_adjacent_air_boundary():
     """Test the set_adjacent_air_boundary method."""
@@ -344,6 +383,34 @@ def test_check_roofs_above_rooms():
     assert story.check_roofs_above_rooms(raise_exception=False) != ''
 
 
+def test_check_no_room2d_overlaps():
+    """Test the check_no_room2d_overlaps and check_collision_with_story methods."""
+    rooms = []
+    for x in range(5):
+        for y in range(5):
+            pts = (Point3D(x * 5, y * 5, 0), Point3D(x * 5 + 5, y * 5, 0),
+                   Point3D(x * 5 + 5, y * 5 + 5, 0), Point3D(x * 5, y * 5 + 5, 0))
+            rooms.append(Room2D('Room_{}_{}'.format(x, y), Face3D(pts), 3))
+    story = Story('OfficeFloor', rooms)
+    assert story.check_no_room2d_overlaps(0.01, False) == ''
+
+    pts = (Point3D(2, 2, 0), Point3D(8, 2, 0), Point3D(8, 8, 0), Point3D(2, 8, 0))
+    story.add_room_2d(Room2D('Overlap', Face3D(pts), 3))
+    errors = story.check_no_room2d_overlaps(0.01, False, True)
+    assert len(errors) == 4
+    assert [e['element_id'][1] for e in errors] == ['Overlap'] * 4
+    assert errors[0]['element_id'][0] == 'Room_0_0'
+
+    other_story = story.duplicate()
+    other_story.add_prefix('Upper')
+    other_story.move(Vector3D(0, 0, 2))
+    errors = story.check_collision_with_story(other_story, 0.01, False, True)
+    assert len(errors) == 26 + 4 + 4
+    other_story.move(Vector3D(0, 0, 1))
+    errors = story.check_collision_with_story(other_story, 0.01, False, True)
+    assert errors == []
+
+
 def test_to_honeybee():
     """Test the to_honeybee method."""
     pts_1 = (Point3D(0, 0, 3), Point3D(10, 0, 3), Point3D(10, 10, 3), Point3D(0, 10, 3))
@@ -408,6 +475,27 @@ def test_to_honeybee_different_heights():
     assert rm1_ap.area == pytest.approx(rm2_ap.area, rel=1e-3)
 
 
+def test_to_honeybee_grid_adjacency():
+    """Test that the to_honeybee method sets all adjacencies of a grid of rooms."""
+    rooms = []
+    for i in range(36):
+        x, y = (i % 6) * 5, (i // 6) * 5
+        pts = (Point3D(x, y, 0), Point3D(x + 5, y, 0),
+               Point3D(x + 5, y + 5, 0), Point3D(x, y + 5, 0))
+        rooms.append(Room2D('Room_{}'.format(i), Face3D(pts), 3))
+    story = Story('GridFloor', rooms)
+    story.solve_room_2d_adjacency(0.01)
+
+    hb_rooms = story.to_honeybee(True, tolerance=0.01)
+    faces = {f.identifier: f for rm in hb_rooms for f in rm.faces}
+    adj_faces = [f for f in faces.values() if isinstance(f.boundary_condition, Surface)]
+    assert len(adj_faces) == 120
+    for face in adj_faces:
+        other_face = faces[face.boundary_condition.boundary_condition_object]
+        assert other_face.boundary_condition.boundary_condition_object == \
+            face.identifier
+
+
 def test_to_dict():
     """Test the Story to_dict method."""
     pts_1 = (Point3D(0, 0, 2), Point3D(10, 0, 2), Point3D(10, 10, 2), Point3D(0, 10, 2))
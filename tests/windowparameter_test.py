@@ -153,6 +153,17 @@ def test_simple_window_ratio_dict_methods():
     assert glz_dict == new_ashrae_base.to_dict()
 
 
+def test_simple_window_ratio_from_dict_not_shared():
+    """Test that SimpleWindowRatio from equal dicts are independent objects."""
+    glz_dict = SimpleWindowRatio(0.35).to_dict()
+    glz_1 = SimpleWindowRatio.from_dict(glz_dict)
+    glz_2 = SimpleWindowRatio.from_dict(glz_dict)
+    assert glz_1 == glz_2
+    assert glz_1 is not glz_2
+    glz_1.user_data = {'type': 'Tinted'}
+    assert glz_2.user_data is None
+
+
 def test_simple_window_ratio_add_window_to_face():
     """Test the add_window_to_face method."""
     ashrae_base = SimpleWindowRatio(0.4)